@@ -53,9 +53,11 @@ class ApiPlaylistManager:
         self.api_url_base = api_url
         if name:
             self.name = name
-        # Refresh timeouts from config in case settings changed
-        self._connect_timeout = app_config.get(["network", "connection_timeout"], 5)
-        self._read_timeout = app_config.get(["network", "read_timeout"], 10)
+
+    def set_timeouts(self, connect_timeout: float, read_timeout: float):
+        """Apply new request timeouts (pushed by the registry when the network config changes)."""
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
     
     @property
     def status(self) -> ConnectionStatus:
@@ -308,7 +310,7 @@ class ApiPlaylistManager:
                 track.play_time = self.time_str_to_seconds(data['STARTTIME'])
                 # If server didn't provide metadata or duration, try reading from file
                 if not track.artist and not track.title or not track.duration:
-                    TrackUtils.update_track_metadata(track)
+                    TrackUtils.update_track_metadata(track, use_verified_duration=False)
                 playlist.tracks.append(track)
         else:
             print(f"Unexpected root element: {root.tag}")
@@ -376,6 +378,8 @@ class RemotePlaylistRegistry:
         self._initialized = True
         self._managers: dict[str, ApiPlaylistManager] = {}
         self._load_sources_from_config()
+        # Sources and timeouts are re-read only when the network section changes
+        app_config.subscribe(lambda changed: self.reload(), ("network",))
     
     def _load_sources_from_config(self):
         """Load remote source configurations."""
@@ -456,3 +460,8 @@ class RemotePlaylistRegistry:
                     self._managers[source_id] = ApiPlaylistManager(source_id, url, name)
             else:
                 self._managers[source_id] = ApiPlaylistManager(source_id, url, name)
+
+        connect_timeout = app_config.get(["network", "connection_timeout"], 5)
+        read_timeout = app_config.get(["network", "read_timeout"], 10)
+        for manager in self._managers.values():
+            manager.set_timeouts(connect_timeout, read_timeout)
@@ -0,0 +1,149 @@
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import app_config
+from PlaylistService.fs_utils import file_signature
+from PlaylistService.write_behind import atomic_write
+
+# Write the cache every this many new results, so a cancelled run keeps most of its work
+CACHE_SAVE_INTERVAL = 100
+# How often a run waiting on long decodes checks whether it was cancelled
+CANCEL_POLL_SECONDS = 0.25
+
+
+class BatchFileAnalyzer(ABC):
+    """Runs a per-file analysis over many tracks in a process pool, with results cached per file.
+
+    Subclasses provide the module-level worker function (it runs in another
+    process), the analysis settings and the report conversion. Cache entries
+    are reused while the file's size and mtime and the settings are unchanged,
+    so re-running over an unchanged playlist only reads the cache. Reports
+    from the latest runs are kept in memory for redrawing rows. Callbacks run
+    on the analyzer's coordinating thread.
+    """
+
+    # config.json section holding "max_workers" (and any analysis settings)
+    config_section = ""
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self.reports: Dict[str, Any] = {}
+        self._cache: Optional[dict] = None
+        self._lock = threading.Lock()
+        self._cancel_event: Optional[threading.Event] = None
+
+    @staticmethod
+    def available() -> bool:
+        """Whether the analysis can run here (e.g. its optional dependencies are installed)."""
+        return True
+
+    @abstractmethod
+    def worker(self) -> Callable:
+        """Module-level function called as worker(path, *settings) in a pool process."""
+
+    def settings(self) -> list:
+        return []
+
+    @abstractmethod
+    def report_from_dict(self, data: dict, settings: list):
+        """Rebuild a report from its cached to_dict() form."""
+
+    def get_report(self, path: str):
+        return self.reports.get(path)
+
+    def analyze(self, paths: Iterable[str], on_report: Callable[[str, Any], None],
+                on_finished: Callable[[bool], None]):
+        """Analyze paths in the background.
+
+        on_report(path, report or None on failure) is called once per path and
+        on_finished(cancelled) once at the end. Starting a new run cancels the
+        previous one.
+        """
+        self.cancel()
+        cancel_event = threading.Event()
+        self._cancel_event = cancel_event
+        unique_paths = list(dict.fromkeys(p for p in paths if p))
+        threading.Thread(target=self._run, args=(unique_paths, on_report, on_finished, cancel_event),
+                         name=f"{self.config_section}-analysis", daemon=True).start()
+
+    def cancel(self):
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def _run(self, paths, on_report, on_finished, cancel_event):
+        settings = self.settings()
+        cache = self._load_cache()
+        pending = []
+        for path in paths:
+            with self._lock:
+                entry = cache.get(path)
+            signature = file_signature(path)
+            # JSON turns the signature tuple into a list
+            if entry and tuple(entry.get("signature") or ()) == signature and entry.get("settings") == settings:
+                self._report(path, self.report_from_dict(entry["report"], settings), on_report, signature)
+            elif signature is not None:
+                pending.append((path, signature))
+            else:
+                on_report(path, None)
+
+        unsaved = 0
+        if pending and not cancel_event.is_set():
+            max_workers = app_config.get([self.config_section, "max_workers"], None) or os.cpu_count() or 2
+            worker = self.worker()
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            try:
+                futures = {executor.submit(worker, path, *settings): (path, signature)
+                           for path, signature in pending}
+                remaining = set(futures)
+                while remaining and not cancel_event.is_set():
+                    done, remaining = wait(remaining, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if cancel_event.is_set():
+                            break
+                        path, signature = futures[future]
+                        try:
+                            report = future.result()
+                        except Exception as e:
+                            print(f"{self.config_section.title()} analysis failed for {path}: {e}")
+                            on_report(path, None)
+                            continue
+                        with self._lock:
+                            cache[path] = {"signature": signature, "settings": settings, "report": report.to_dict()}
+                        self._report(path, report, on_report, signature)
+                        unsaved += 1
+                        if unsaved >= CACHE_SAVE_INTERVAL:
+                            self._save_cache()
+                            unsaved = 0
+            finally:
+                # A cancelled run reports at once instead of waiting out in-flight decodes (which
+                # can take minutes on a 3-hour file); their results are dropped when they finish
+                executor.shutdown(wait=not cancel_event.is_set(), cancel_futures=True)
+        if unsaved:
+            self._save_cache()
+        on_finished(cancel_event.is_set())
+
+    def _report(self, path, report, on_report, signature=None):
+        self.reports[path] = report
+        on_report(path, report)
+
+    def _load_cache(self) -> dict:
+        with self._lock:
+            if self._cache is None:
+                try:
+                    with open(self.cache_path, "r", encoding="utf-8") as f:
+                        self._cache = json.load(f)
+                except (OSError, ValueError):
+                    self._cache = {}
+            return self._cache
+
+    def _save_cache(self):
+        with self._lock:
+            data = json.dumps(self._cache).encode("utf-8")
+        try:
+            atomic_write(self.cache_path, data)
+        except OSError as e:
+            print(f"Could not save {self.config_section} cache: {e}")
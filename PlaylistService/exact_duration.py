@@ -0,0 +1,253 @@
+import json
+import mmap
+import os
+import struct
+import subprocess
+import threading
+from typing import Optional
+
+from PlaylistService.batch_analysis import BatchFileAnalyzer
+from PlaylistService.fs_utils import FFMPEG_CREATION_FLAGS, data_path, file_signature
+
+DURATION_CACHE_PATH = data_path("duration_cache.json")
+
+# MPEG audio header tables, indexed by the header's version bits (0 = 2.5, 2 = 2, 3 = 1)
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Frames whose headers disagree with the first frame, or garbage between frames,
+# make the walker rescan for the next header; give up after this many bytes
+_MAX_RESYNC_BYTES = 64 * 1024
+
+# Verified durations: path -> (file signature, seconds), from DURATION_CACHE_PATH
+# on first use and from DurationAnalyzer runs after that
+_verified: Optional[dict] = None
+_verified_lock = threading.Lock()
+
+
+def _verified_entries() -> dict:
+    """The verified durations, read from the duration cache the first time (call with _verified_lock held)."""
+    global _verified
+    if _verified is None:
+        _verified = {}
+        try:
+            with open(DURATION_CACHE_PATH, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        for path, entry in cache.items():
+            try:
+                _verified[path] = (tuple(entry["signature"]), entry["report"]["seconds"])
+            except (KeyError, TypeError):
+                continue
+    return _verified
+
+
+def verified_duration(path: str) -> Optional[float]:
+    """Exact duration found by DurationAnalyzer for path, if the file hasn't changed since."""
+    with _verified_lock:
+        entry = _verified_entries().get(path)
+    if entry is None or file_signature(path) != entry[0]:
+        return None
+    return entry[1]
+
+
+class DurationReport:
+    """Exact duration of one file and how it was measured ("xing", "frames" or "ffprobe")."""
+
+    def __init__(self, seconds: float, method: str):
+        self.seconds = seconds
+        self.method = method
+
+    def to_dict(self) -> dict:
+        return {"seconds": self.seconds, "method": self.method}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DurationReport":
+        return cls(data["seconds"], data["method"])
+
+
+def _parse_header(data, offset: int):
+    """(frame length, samples per frame, sample rate, version, layer) of the frame at offset, or None."""
+    if offset + 4 > len(data):
+        return None
+    b1, b2 = data[offset + 1], data[offset + 2]
+    if data[offset] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 3
+    layer = 4 - ((b1 >> 1) & 3)
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        # Reserved values (and free-format, which can't be walked by length)
+        return None
+    padding = (b2 >> 1) & 1
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    bitrate = _BITRATES[(1 if version == 3 else 2, layer)][bitrate_index] * 1000
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate, version, layer
+    if layer == 3 and version != 3:
+        return 72 * bitrate // sample_rate + padding, 576, sample_rate, version, layer
+    return 144 * bitrate // sample_rate + padding, 1152, sample_rate, version, layer
+
+
+def _skip_id3v2(data) -> int:
+    offset = 0
+    # Some files carry more than one ID3v2 tag back to back
+    while data[offset:offset + 3] == b"ID3" and offset + 10 <= len(data):
+        size = 0
+        for byte in data[offset + 6:offset + 10]:
+            size = (size << 7) | (byte & 0x7F)
+        footer = 10 if data[offset + 5] & 0x10 else 0
+        offset += 10 + size + footer
+    return offset
+
+
+def _find_frame(data, offset: int, limit: int):
+    """First offset at or after offset holding a frame header that the next header confirms."""
+    end = min(len(data), offset + limit)
+    while offset < end:
+        offset = data.find(b"\xff", offset, end)
+        if offset < 0:
+            return None
+        header = _parse_header(data, offset)
+        if header is not None:
+            following = offset + header[0]
+            if following >= len(data) or _parse_header(data, following) is not None:
+                return offset
+        offset += 1
+    return None
+
+
+def _info_frame(data, offset: int, header):
+    """Read a Xing/Info or VBRI header in the first frame.
+
+    Returns (audio frame count or None, encoder delay + padding in samples) or
+    None if the frame is ordinary audio.
+    """
+    _, _, _, version, _ = header
+    channel_mode = data[offset + 3] >> 6
+    if version == 3:
+        side_info = 17 if channel_mode == 3 else 32
+    else:
+        side_info = 9 if channel_mode == 3 else 17
+    xing = offset + 4 + side_info
+    tag = bytes(data[xing:xing + 4])
+    if tag in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", data[xing + 4:xing + 8])[0]
+        frames = struct.unpack(">I", data[xing + 8:xing + 12])[0] if flags & 1 else None
+        position = xing + 8 + (4 if flags & 1 else 0) + (4 if flags & 2 else 0) + (100 if flags & 4 else 0) \
+            + (4 if flags & 8 else 0)
+        trim = 0
+        if bytes(data[position:position + 4]) in (b"LAME", b"Lavf", b"Lavc"):
+            delay_padding = data[position + 21:position + 24]
+            if len(delay_padding) == 3:
+                delay = (delay_padding[0] << 4) | (delay_padding[1] >> 4)
+                padding = ((delay_padding[1] & 0x0F) << 8) | delay_padding[2]
+                # Decoders add 529 samples of their own delay at the start and
+                # take them back from the end, so only the encoder's figures count
+                trim = delay + padding
+        return frames, trim
+    vbri = offset + 4 + 32
+    if bytes(data[vbri:vbri + 4]) == b"VBRI":
+        return struct.unpack(">I", data[vbri + 14:vbri + 18])[0], 0
+    return None
+
+
+def mp3_duration(file_path: str) -> DurationReport:
+    """Exact decoded duration of an MP3.
+
+    Uses the frame count from a Xing/Info/VBRI header when there is one
+    (minus the LAME encoder delay and padding); otherwise walks every frame
+    header and counts samples. Only headers are read, through mmap.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError("empty file")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            first = _find_frame(data, _skip_id3v2(data), _MAX_RESYNC_BYTES)
+            if first is None:
+                raise ValueError("no MPEG audio frames found")
+            header = _parse_header(data, first)
+            _, samples_per_frame, sample_rate, version, layer = header
+            info = _info_frame(data, first, header)
+            if info is not None and info[0]:
+                frames, trim = info
+                samples = max(frames * samples_per_frame - trim, 0)
+                return DurationReport(round(samples / sample_rate, 3), "xing")
+
+            # An Info frame without a count carries no audio; skip it
+            offset = first + header[0] if info is not None else first
+            samples = 0
+            size = len(data)
+            while offset < size:
+                parsed = _parse_header(data, offset)
+                if parsed is None or parsed[2] != sample_rate or parsed[3] != version or parsed[4] != layer:
+                    if data[offset:offset + 3] == b"TAG" or data[offset:offset + 8] == b"APETAGEX":
+                        break
+                    offset = _find_frame(data, offset + 1, _MAX_RESYNC_BYTES)
+                    if offset is None:
+                        break
+                    continue
+                if offset + parsed[0] > size:
+                    break  # truncated last frame
+                samples += parsed[1]
+                offset += parsed[0]
+            return DurationReport(round(samples / sample_rate, 3), "frames")
+
+
+def probe_duration(file_path: str) -> DurationReport:
+    """Container duration reported by ffprobe, for formats other than MP3."""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1',
+         file_path],
+        capture_output=True, text=True, timeout=60, creationflags=FFMPEG_CREATION_FLAGS)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or "ffprobe failed")
+    return DurationReport(round(float(result.stdout.strip()), 3), "ffprobe")
+
+
+def measure_duration(file_path: str) -> DurationReport:
+    """Worker entry point: exact duration of any supported file."""
+    if os.path.splitext(file_path)[1].lower() == ".mp3":
+        return mp3_duration(file_path)
+    return probe_duration(file_path)
+
+
+def needs_verification(path: str, duration) -> bool:
+    """Whether a track's duration may be an estimate: every MP3, and anything without a duration.
+
+    For MP3s the worker itself decides how much work is needed (a Xing
+    header is read in one go; only header-less files are walked).
+    """
+    return os.path.splitext(path)[1].lower() == ".mp3" or not duration
+
+
+class DurationAnalyzer(BatchFileAnalyzer):
+    """Exact durations over many tracks (see BatchFileAnalyzer), cached in DURATION_CACHE_PATH.
+
+    Results are also published to verified_duration(), which metadata
+    loading prefers over tag estimates.
+    """
+
+    config_section = "duration"
+
+    def __init__(self, cache_path: str = DURATION_CACHE_PATH):
+        super().__init__(cache_path)
+
+    def worker(self):
+        return measure_duration
+
+    def report_from_dict(self, data: dict, settings: list) -> DurationReport:
+        return DurationReport.from_dict(data)
+
+    def _report(self, path, report, on_report, signature=None):
+        with _verified_lock:
+            _verified_entries()[path] = (signature or file_signature(path), report.seconds)
+        super()._report(path, report, on_report, signature)
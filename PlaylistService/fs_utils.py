@@ -0,0 +1,25 @@
+import os
+import subprocess
+from typing import Optional, Tuple
+
+# settings.json and every cache and database live here: the working directory,
+# since the app is started from its own folder
+DATA_DIR = ""
+
+# Every ffmpeg/ffprobe the app starts (analysis, conversion); under pythonw on Windows each
+# would otherwise open its own console window
+FFMPEG_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(size, mtime_ns) of a file, or None if it can't be read; an unchanged signature means an unchanged file."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info.st_size, info.st_mtime_ns
+
+
+def data_path(name: str) -> str:
+    """Path of the app data file or folder called name (settings, caches, databases)."""
+    return os.path.join(DATA_DIR, name)
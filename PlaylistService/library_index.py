@@ -0,0 +1,329 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+import app_config
+from models.track import Track
+from PlaylistService.fs_utils import data_path
+from PlaylistService.library_search import LibraryEntry, LibrarySearchIndex
+from PlaylistService.track_utils import TrackUtils
+
+LIBRARY_DB_FILE = data_path("library.db")
+
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.wma', '.m4a', '.mp4', '.aac', '.flac', '.ogg')
+
+# Content hash: file size plus the first and last 64 KB. Tags are usually
+# rewritten in place at the start, so a retagged file can change hash; a
+# moved or renamed file never does.
+HASH_EDGE_BYTES = 64 * 1024
+
+# Directory listing and hashing are network-bound on the share, so use plenty of threads
+CRAWL_WORKERS = 16
+# Rows written per transaction while indexing
+WRITE_BATCH = 500
+# Opening the track search refreshes the index again once the last refresh is this old
+STALE_AFTER_SECONDS = 15 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    key          TEXT PRIMARY KEY,
+    path         TEXT NOT NULL,
+    name         TEXT NOT NULL,
+    size         INTEGER NOT NULL,
+    mtime_ns     INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    duration     REAL,
+    artist       TEXT,
+    title        TEXT,
+    present      INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS files_content_hash ON files(content_hash);
+CREATE INDEX IF NOT EXISTS files_name ON files(name);
+"""
+
+
+def path_key(path: str) -> str:
+    """Lookup key for a path: normalized separators and, on Windows, case."""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def content_hash(path: str, size: int) -> str:
+    digest = hashlib.sha1(str(size).encode("ascii"))
+    with open(path, "rb") as f:
+        digest.update(f.read(HASH_EDGE_BYTES))
+        if size > 2 * HASH_EDGE_BYTES:
+            f.seek(-HASH_EDGE_BYTES, os.SEEK_END)
+            digest.update(f.read(HASH_EDGE_BYTES))
+        elif size > HASH_EDGE_BYTES:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _folder_prefix(key: str) -> str:
+    """key with exactly one trailing separator, for "is inside this folder" tests."""
+    return key.rstrip(os.sep) + os.sep
+
+
+def library_roots() -> List[str]:
+    """Folders to index: config.json "paths.library_roots", a list or a ';'-separated string."""
+    roots = app_config.get(["paths", "library_roots"], [])
+    if isinstance(roots, str):
+        roots = roots.split(";")
+    return [root.strip() for root in roots if root and root.strip()]
+
+
+def _scan_directory(directory: str) -> Tuple[List[tuple], List[str], bool]:
+    """(audio files as (path, size, mtime_ns), subdirectories, readable) of one directory."""
+    files = []
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                    elif entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                        info = entry.stat()
+                        files.append((entry.path, info.st_size, info.st_mtime_ns))
+                except OSError:
+                    continue
+    except OSError as e:
+        print(f"Library index: could not list {directory}: {e}")
+        return files, subdirectories, False
+    return files, subdirectories, True
+
+
+class LibraryIndex:
+    """Persistent index of the audio files under the configured library folders.
+
+    Each file is recorded with its size, mtime, a content hash of its first
+    and last 64 KB, and its duration/artist/title. Refreshes are incremental:
+    only files whose size or mtime changed are read again. Files that vanish
+    are kept (marked not present) so their hash can still be looked up, which
+    is how a moved or renamed track is found again with one indexed query.
+
+    The present files are also kept in an in-memory LibrarySearchIndex for
+    search-as-you-type; it is loaded from the database and rebuilt after
+    refreshes that changed anything.
+    """
+
+    def __init__(self, db_path: str = LIBRARY_DB_FILE):
+        self.db_path = db_path
+        self.search_index = LibrarySearchIndex()
+        self.last_refreshed: Optional[float] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._load_thread: Optional[threading.Thread] = None
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    # ---- connections ----
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        with self._schema_lock:
+            if not self._schema_ready:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(_SCHEMA)
+                connection.commit()
+                self._schema_ready = True
+        return connection
+
+    # ---- refresh ----
+
+    @property
+    def refreshing(self) -> bool:
+        return self._refresh_thread is not None and self._refresh_thread.is_alive()
+
+    def refresh_async(self, on_progress: Optional[Callable[[int], None]] = None,
+                      on_finished: Optional[Callable[[dict], None]] = None) -> bool:
+        """Bring the index up to date in the background.
+
+        on_progress(files seen) and on_finished(stats) run on the refresh
+        thread. Returns False (and does nothing) if no library folders are
+        configured or a refresh is already running.
+        """
+        roots = library_roots()
+        if not roots or self.refreshing:
+            return False
+        self._refresh_thread = threading.Thread(target=self._refresh, args=(roots, on_progress, on_finished),
+                                                name="library-index", daemon=True)
+        self._refresh_thread.start()
+        return True
+
+    @property
+    def loading(self) -> bool:
+        return self._load_thread is not None and self._load_thread.is_alive()
+
+    def refresh_if_stale(self) -> bool:
+        """refresh_async() unless the index was refreshed in the last STALE_AFTER_SECONDS."""
+        if self.last_refreshed is not None and time.monotonic() - self.last_refreshed < STALE_AFTER_SECONDS:
+            return False
+        return self.refresh_async()
+
+    def _refresh(self, roots, on_progress, on_finished):
+        started = time.monotonic()
+        stats = {"files": 0, "indexed": 0, "missing": 0, "errors": 0, "seconds": 0.0}
+        try:
+            # Make what was indexed last time searchable while the folders are crawled
+            if not self.search_index.loaded:
+                self._load_search_index()
+            with ThreadPoolExecutor(max_workers=CRAWL_WORKERS, thread_name_prefix="library-crawl") as executor:
+                found, unreadable = self._crawl(executor, roots, stats, on_progress)
+                self._update_rows(executor, roots, found, unreadable, stats)
+            if stats["indexed"] or stats["missing"]:
+                self._load_search_index()
+        except Exception as e:
+            print(f"Library index refresh failed: {e}")
+        self.last_refreshed = time.monotonic()
+        stats["seconds"] = round(time.monotonic() - started, 1)
+        print(f"Library index: {stats['files']} files, {stats['indexed']} (re)indexed, "
+              f"{stats['missing']} gone, {stats['errors']} errors in {stats['seconds']} s")
+        if on_finished:
+            on_finished(stats)
+
+    def _crawl(self, executor, roots, stats, on_progress):
+        """List every audio file under roots, many directories at a time."""
+        found: Dict[str, tuple] = {}
+        unreadable = set()
+        pending = {executor.submit(_scan_directory, root): root for root in roots}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory = pending.pop(future)
+                files, subdirectories, readable = future.result()
+                if not readable:
+                    unreadable.add(path_key(directory))
+                for subdirectory in subdirectories:
+                    pending[executor.submit(_scan_directory, subdirectory)] = subdirectory
+                for path, size, mtime_ns in files:
+                    found[path_key(path)] = (path, size, mtime_ns)
+            stats["files"] = len(found)
+            if on_progress:
+                on_progress(len(found))
+        return found, unreadable
+
+    def _update_rows(self, executor, roots, found, unreadable, stats):
+        connection = self._connect()
+        try:
+            known = {key: (size, mtime_ns, present) for key, size, mtime_ns, present
+                     in connection.execute("SELECT key, size, mtime_ns, present FROM files")}
+
+            changed = [entry for key, entry in found.items()
+                       if known.get(key) is None or known[key][:2] != entry[1:] or not known[key][2]]
+            rows = []
+            for row in executor.map(self._describe, changed):
+                if row is None:
+                    stats["errors"] += 1
+                    continue
+                rows.append(row)
+                if len(rows) >= WRITE_BATCH:
+                    self._write_rows(connection, rows)
+                    stats["indexed"] += len(rows)
+                    rows = []
+            if rows:
+                self._write_rows(connection, rows)
+                stats["indexed"] += len(rows)
+
+            # Files no longer found under a folder that could be listed are gone (moved,
+            # renamed or deleted). Folders that couldn't be listed (share offline) keep theirs.
+            root_prefixes = tuple(_folder_prefix(path_key(root)) for root in roots)
+            unreadable_prefixes = tuple(_folder_prefix(key) for key in unreadable)
+            gone = [(key,) for key, (_, _, present) in known.items()
+                    if present and key not in found and key.startswith(root_prefixes)
+                    and not (unreadable_prefixes and key.startswith(unreadable_prefixes))]
+            with connection:
+                connection.executemany("UPDATE files SET present = 0 WHERE key = ?", gone)
+            stats["missing"] = len(gone)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _describe(entry) -> Optional[tuple]:
+        path, size, mtime_ns = entry
+        try:
+            digest = content_hash(path, size)
+            track = TrackUtils.update_track_metadata(Track(path))
+        except Exception as e:
+            print(f"Library index: could not read {path}: {e}")
+            return None
+        return (path_key(path), path, os.path.basename(path).lower(), size, mtime_ns, digest,
+                track.duration, track.artist, track.title)
+
+    @staticmethod
+    def _write_rows(connection, rows):
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO files (key, path, name, size, mtime_ns, content_hash, duration, artist, title, "
+                "present) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)", rows)
+
+    # ---- search ----
+
+    def load_search_index_async(self) -> bool:
+        """Load the search index from the database in the background, if it isn't loaded yet.
+
+        Returns False if there is nothing to load or it is already loaded or
+        loading; a running refresh loads it too.
+        """
+        if self.search_index.loaded or not os.path.exists(self.db_path) or self.refreshing or self.loading:
+            return False
+
+        def load():
+            try:
+                self._load_search_index()
+            except Exception as e:
+                print(f"Could not load library search index: {e}")
+        self._load_thread = threading.Thread(target=load, name="library-search-load", daemon=True)
+        self._load_thread.start()
+        return True
+
+    def _load_search_index(self):
+        started = time.monotonic()
+        connection = self._connect()
+        try:
+            rows = connection.execute("SELECT path, artist, title, duration FROM files WHERE present = 1").fetchall()
+        finally:
+            connection.close()
+        self.search_index.build(rows)
+        print(f"Library search index: {len(rows)} files in {time.monotonic() - started:.1f} s")
+
+    def search(self, query: str, limit: int = 50) -> List[LibraryEntry]:
+        """Library files matching query (see LibrarySearchIndex); never touches the filesystem."""
+        return self.search_index.search(query, limit)
+
+    # ---- lookups ----
+
+    def find_moved(self, paths: List[str]) -> Dict[str, Tuple[str, str]]:
+        """New locations for files that are missing at paths: {old path: (new path, how)}.
+
+        A file last seen at the old path is matched by its content hash ("content").
+        Paths the index never saw fall back to a unique file with the same
+        name ("name"). Paths without a confident match are left out.
+        """
+        if not os.path.exists(self.db_path):
+            return {}
+        matches = {}
+        connection = self._connect()
+        try:
+            for old_path in paths:
+                key = path_key(old_path)
+                name = os.path.basename(old_path).lower()
+                row = connection.execute("SELECT content_hash FROM files WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    candidates = [path for path, candidate_name in connection.execute(
+                        "SELECT path, name FROM files WHERE content_hash = ? AND present = 1 AND key != ?",
+                        (row[0], key))]
+                    if candidates:
+                        same_name = [p for p in candidates if os.path.basename(p).lower() == name]
+                        matches[old_path] = ((same_name or candidates)[0], "content")
+                        continue
+                candidates = connection.execute(
+                    "SELECT path FROM files WHERE name = ? AND present = 1 AND key != ? LIMIT 2", (name, key)).fetchall()
+                if len(candidates) == 1:
+                    matches[old_path] = (candidates[0][0], "name")
+        finally:
+            connection.close()
+        return matches
@@ -0,0 +1,286 @@
+import os
+import re
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from itertools import accumulate
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+_TOKEN_SPLIT = re.compile(r"[\W_]+")
+_NONZERO_BYTES = re.compile(rb"[^\x00]+")
+
+# Rows matching a query are kept as a bitmask (a Python int, bit n = entry n), so
+# combining the words of a query is one AND. Words on more rows than
+# DENSE_WORD_ENTRIES, and prefixes (like "b" or "sh") whose words are on more rows
+# than BROAD_PREFIX_ENTRIES in total, get their mask built up front; the masks of
+# other typed prefixes are cached.
+DENSE_WORD_ENTRIES = 2000
+BROAD_PREFIX_ENTRIES = 10000
+PREFIX_MASK_CACHE_SIZE = 256
+# Only the first this many matches in name order are ranked, for broad queries like "a"
+MAX_RANKED = 1000
+# Typo tolerance for words that start no indexed word: up to this many close words
+# sharing at least this fraction of letter trigrams
+FUZZY_ALTERNATIVES = 5
+FUZZY_MIN_SIMILARITY = 0.4
+FUZZY_MIN_LENGTH = 3
+
+
+class LibraryEntry(NamedTuple):
+    path: str
+    artist: str
+    title: str
+    duration: Optional[float]
+
+
+def fold(text: str) -> str:
+    """Lowercase without accents, so "beyonce" finds "Beyoncé"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_SPLIT.split(fold(text)) if token]
+
+
+def _trigrams(token: str) -> set:
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _ids_to_mask(ids, mask_bytes: bytearray):
+    for entry_id in ids:
+        mask_bytes[entry_id >> 3] |= 1 << (entry_id & 7)
+
+
+def _first_ids(mask: int, limit: int) -> List[int]:
+    """The lowest limit set bits of mask, ascending."""
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    ids = []
+    for run in _NONZERO_BYTES.finditer(data):
+        for position in range(run.start(), run.end()):
+            byte = data[position]
+            for bit in range(8):
+                if byte >> bit & 1:
+                    ids.append(position * 8 + bit)
+            # Checked per byte: a dense mask is one long run
+            if len(ids) >= limit:
+                return ids[:limit]
+    return ids
+
+
+def _broad_prefix_masks(vocabulary: List[str], postings: List[array], dense_masks: dict, mask_size: int) -> dict:
+    """Masks of every prefix whose words have more than BROAD_PREFIX_ENTRIES postings.
+
+    Built from the longest such prefixes up, so each posting is written into
+    a mask once and shorter prefixes are ORs of longer ones.
+    """
+    totals = [0] + list(accumulate(len(entry_ids) for entry_ids in postings))
+    masks = {}
+
+    def groups(start, end, length):
+        # vocabulary[start:end] shares its first length letters; split it by the next one
+        position = start
+        while position < end:
+            word = vocabulary[position]
+            if len(word) <= length:
+                position += 1
+                continue
+            child = word[:length + 1]
+            group_end = bisect_left(vocabulary, child + "\uffff", position, end)
+            yield child, position, group_end
+            position = group_end
+
+    def build(prefix, start, end):
+        mask = 0
+        mask_bytes = bytearray(mask_size)
+        leaves = [start] if vocabulary[start] == prefix else []
+        for child, child_start, child_end in groups(start, end, len(prefix)):
+            if totals[child_end] - totals[child_start] > BROAD_PREFIX_ENTRIES:
+                mask |= build(child, child_start, child_end)
+            else:
+                leaves.extend(range(child_start, child_end))
+        for vocabulary_id in leaves:
+            dense = dense_masks.get(vocabulary_id)
+            if dense is not None:
+                mask |= dense
+            else:
+                _ids_to_mask(postings[vocabulary_id], mask_bytes)
+        mask |= int.from_bytes(mask_bytes, "little")
+        masks[prefix] = mask
+        return mask
+
+    for prefix, start, end in groups(0, len(vocabulary), 0):
+        if totals[end] - totals[start] > BROAD_PREFIX_ENTRIES:
+            build(prefix, start, end)
+    return masks
+
+
+class _Snapshot(NamedTuple):
+    entries: List[LibraryEntry]
+    texts: List[str]  # per entry: " word word ... ", for ranking
+    vocabulary: List[str]  # distinct words, sorted
+    postings: List[array]  # per vocabulary word: entry ids, ascending
+    dense_masks: dict  # vocabulary id -> mask, for words on many rows
+    broad_masks: dict  # prefix -> mask, for prefixes on many rows
+    trigrams: dict  # trigram -> vocabulary ids, for typo lookups
+    prefix_masks: OrderedDict  # LRU of query word -> mask
+
+
+class LibrarySearchIndex:
+    """In-memory word index over the library, for search-as-you-type.
+
+    Entries are built from library index rows (file name, parent folder,
+    artist and title), so queries never touch the filesystem. Every query
+    word must prefix-match a word of the entry; a word matching nothing is
+    replaced by its closest indexed words (typos). Entry ids follow file
+    name order, which is also the ranking tie-break. A rebuild replaces the
+    whole snapshot in one assignment, so searches never wait on it.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[_Snapshot] = None
+        self._cache_lock = threading.Lock()
+        # Bumped by every build, so callers can tell when results may have changed
+        self.generation = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    def __len__(self):
+        return len(self._snapshot.entries) if self._snapshot else 0
+
+    def build(self, rows: Iterable[Tuple[str, Optional[str], Optional[str], Optional[float]]]):
+        """Replace the index with rows of (path, artist, title, duration)."""
+        rows = sorted(rows, key=lambda row: os.path.basename(row[0]).lower())
+        entries = []
+        texts = []
+        word_entries = {}
+        for entry_id, (path, artist, title, duration) in enumerate(rows):
+            directory, file_name = os.path.split(path)
+            words = tokenize(os.path.splitext(file_name)[0])
+            words += tokenize(os.path.basename(directory))
+            words += tokenize(artist or "")
+            words += tokenize(title or "")
+            words = list(dict.fromkeys(words))
+            for word in words:
+                word_entries.setdefault(word, []).append(entry_id)
+            entries.append(LibraryEntry(path, artist or "", title or "", duration))
+            texts.append(" " + " ".join(words) + " ")
+        vocabulary = sorted(word_entries)
+        postings = [array("i", word_entries[word]) for word in vocabulary]
+        mask_size = (len(entries) + 7) // 8
+        dense_masks = {}
+        trigrams = {}
+        for vocabulary_id, word in enumerate(vocabulary):
+            if len(postings[vocabulary_id]) > DENSE_WORD_ENTRIES:
+                mask_bytes = bytearray(mask_size)
+                _ids_to_mask(postings[vocabulary_id], mask_bytes)
+                dense_masks[vocabulary_id] = int.from_bytes(mask_bytes, "little")
+            for trigram in _trigrams(word):
+                trigrams.setdefault(trigram, []).append(vocabulary_id)
+        broad_masks = _broad_prefix_masks(vocabulary, postings, dense_masks, mask_size)
+        self._snapshot = _Snapshot(entries, texts, vocabulary, postings, dense_masks, broad_masks, trigrams,
+                                   OrderedDict())
+        self.generation += 1
+
+    def search(self, query: str, limit: int = 50) -> List[LibraryEntry]:
+        """Best matches for query, at most limit of them."""
+        snapshot = self._snapshot
+        words = list(dict.fromkeys(tokenize(query)))
+        if snapshot is None or not words:
+            return []
+
+        matches = -1  # all bits set: every entry
+        whole_word_matches = -1
+        whole_words = []  # per query word: the " word " needles counted when ranking
+        for word in words:
+            start, end = self._prefix_range(snapshot.vocabulary, word)
+            if start < end:
+                matches &= self._prefix_mask(snapshot, word, range(start, end))
+                exact = [start] if snapshot.vocabulary[start] == word else []
+                whole_words.append([f" {word} "])
+            else:
+                exact = self._fuzzy_matches(snapshot, word)
+                if not exact:
+                    return []
+                matches &= self._mask(snapshot, exact)
+                whole_words.append([f" {snapshot.vocabulary[i]} " for i in exact])
+            whole_word_matches &= self._mask(snapshot, exact) if exact else 0
+            if not matches:
+                return []
+
+        # Rank the rows matching every word whole, then enough of the rest to fill the list.
+        # More whole-word matches first, then shorter entries.
+        candidates = set(_first_ids(whole_word_matches, MAX_RANKED)) if whole_word_matches > 0 else set()
+        candidates.update(_first_ids(matches, MAX_RANKED))
+        texts = snapshot.texts
+
+        def rank(entry_id):
+            text = texts[entry_id]
+            whole = sum(1 for needles in whole_words if any(needle in text for needle in needles))
+            return -whole, len(text), entry_id
+        return [snapshot.entries[entry_id] for entry_id in sorted(candidates, key=rank)[:limit]]
+
+    @staticmethod
+    def _prefix_range(vocabulary: List[str], prefix: str) -> Tuple[int, int]:
+        start = bisect_left(vocabulary, prefix)
+        # U+FFFF sorts after any character that can follow the prefix
+        return start, bisect_left(vocabulary, prefix + "\uffff", start)
+
+    @staticmethod
+    def _mask(snapshot: _Snapshot, vocabulary_ids) -> int:
+        """Entries containing any of the vocabulary words."""
+        mask = 0
+        mask_bytes = None
+        for vocabulary_id in vocabulary_ids:
+            dense = snapshot.dense_masks.get(vocabulary_id)
+            if dense is not None:
+                mask |= dense
+                continue
+            if mask_bytes is None:
+                mask_bytes = bytearray((len(snapshot.entries) + 7) // 8)
+            _ids_to_mask(snapshot.postings[vocabulary_id], mask_bytes)
+        if mask_bytes is not None:
+            mask |= int.from_bytes(mask_bytes, "little")
+        return mask
+
+    def _prefix_mask(self, snapshot: _Snapshot, prefix: str, vocabulary_ids) -> int:
+        mask = snapshot.broad_masks.get(prefix)
+        if mask is not None:
+            return mask
+        # Typing re-runs the query for every key, so earlier words come from the cache
+        cache = snapshot.prefix_masks
+        with self._cache_lock:
+            mask = cache.get(prefix)
+            if mask is not None:
+                cache.move_to_end(prefix)
+                return mask
+        mask = self._mask(snapshot, vocabulary_ids)
+        with self._cache_lock:
+            cache[prefix] = mask
+            if len(cache) > PREFIX_MASK_CACHE_SIZE:
+                cache.popitem(last=False)
+        return mask
+
+    @staticmethod
+    def _fuzzy_matches(snapshot: _Snapshot, word: str) -> List[int]:
+        """Vocabulary ids of the words closest to word by trigram overlap (Dice coefficient)."""
+        if len(word) < FUZZY_MIN_LENGTH:
+            return []
+        query_trigrams = _trigrams(word)
+        shared = Counter()
+        for trigram in query_trigrams:
+            shared.update(snapshot.trigrams.get(trigram, ()))
+        vocabulary = snapshot.vocabulary
+        scored = []
+        for vocabulary_id, count in shared.items():
+            # Padded with a space at each end, a word of n letters has n trigrams
+            similarity = 2 * count / (len(query_trigrams) + len(vocabulary[vocabulary_id]))
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                scored.append((similarity, vocabulary_id))
+        scored.sort(reverse=True)
+        return [vocabulary_id for _, vocabulary_id in scored[:FUZZY_ALTERNATIVES]]
@@ -0,0 +1,174 @@
+import math
+from typing import Optional
+
+from PlaylistService.batch_analysis import BatchFileAnalyzer
+from PlaylistService.fs_utils import data_path
+from PlaylistService.pcm_stream import iter_pcm, np, numpy_available
+
+LOUDNESS_CACHE_PATH = data_path("loudness_cache.json")
+
+# ITU-R BS.1770-4 / EBU R128. The filter coefficients below are defined at 48 kHz,
+# so ffmpeg resamples to that while decoding.
+SAMPLE_RATE = 48000
+_SHELF_B = (1.53512485958697, -2.69169618940638, 1.19839281085285)
+_SHELF_A = (1.0, -1.69065929318241, 0.73248077421585)
+_HIGHPASS_B = (1.0, -2.0, 1.0)
+_HIGHPASS_A = (1.0, -1.99004745483398, 0.99007225036621)
+# The K-weighting cascade is applied as an FIR of its impulse response; it has
+# decayed below -150 dB well before this many taps (85 ms).
+K_WEIGHT_TAPS = 4096
+
+SEGMENT_FRAMES = SAMPLE_RATE // 10  # 100 ms; gating blocks are 4 segments (400 ms, 75% overlap)
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+
+# True peak: 4x oversampling with a windowed-sinc interpolator, 12 taps per phase
+OVERSAMPLE = 4
+TRUE_PEAK_TAPS_PER_PHASE = 12
+
+_filters = {}
+
+
+class LoudnessReport:
+    """Integrated loudness (LUFS) and true peak (dBTP) of one track; None for digital silence."""
+
+    def __init__(self, integrated_lufs: Optional[float], true_peak_dbtp: Optional[float]):
+        self.integrated_lufs = integrated_lufs
+        self.true_peak_dbtp = true_peak_dbtp
+
+    def lufs_text(self) -> str:
+        return "-inf" if self.integrated_lufs is None else f"{self.integrated_lufs:.1f}"
+
+    def peak_text(self) -> str:
+        return "-inf" if self.true_peak_dbtp is None else f"{self.true_peak_dbtp:.1f}"
+
+    def to_dict(self) -> dict:
+        return {"lufs": self.integrated_lufs, "true_peak": self.true_peak_dbtp}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LoudnessReport":
+        return cls(data["lufs"], data["true_peak"])
+
+
+def _impulse_response(stages, length: int):
+    """Impulse response of a cascade of biquads (b, a), computed sample by sample once."""
+    signal = [0.0] * length
+    signal[0] = 1.0
+    for b, a in stages:
+        x1 = x2 = y1 = y2 = 0.0
+        out = []
+        for x in signal:
+            y = b[0] * x + b[1] * x1 + b[2] * x2 - a[1] * y1 - a[2] * y2
+            out.append(y)
+            x2, x1 = x1, x
+            y2, y1 = y1, y
+        signal = out
+    return np.array(signal)
+
+
+def _k_weighting_spectrum(fft_size: int):
+    """rfft of the K-weighting FIR at fft_size (cached per size)."""
+    key = ("k", fft_size)
+    if key not in _filters:
+        if "k_fir" not in _filters:
+            _filters["k_fir"] = _impulse_response(((_SHELF_B, _SHELF_A), (_HIGHPASS_B, _HIGHPASS_A)), K_WEIGHT_TAPS)
+        _filters[key] = np.fft.rfft(_filters["k_fir"], fft_size)
+    return _filters[key]
+
+
+def _true_peak_phases():
+    """The interpolation filter split into its OVERSAMPLE polyphase components."""
+    if "true_peak" not in _filters:
+        taps = OVERSAMPLE * TRUE_PEAK_TAPS_PER_PHASE
+        t = (np.arange(taps) - (taps - 1) / 2) / OVERSAMPLE
+        h = np.sinc(t) * np.kaiser(taps, 8.0)
+        h *= OVERSAMPLE / h.sum()
+        _filters["true_peak"] = [h[phase::OVERSAMPLE] for phase in range(OVERSAMPLE)]
+    return _filters["true_peak"]
+
+
+def analyze_loudness(file_path: str) -> LoudnessReport:
+    """Stream file_path through ffmpeg and measure integrated loudness and true peak.
+
+    Runs in a worker process. Tracks are measured as stereo, the way they
+    play out: ffmpeg duplicates mono and downmixes surround.
+    """
+    channels = 2
+    k_history = np.zeros((K_WEIGHT_TAPS - 1, channels))
+    tp_history = np.zeros((TRUE_PEAK_TAPS_PER_PHASE - 1, channels))
+    phases = _true_peak_phases()
+    segment_energy = []  # per 100 ms segment: sum of squares per channel
+    partial = np.zeros((0, channels))
+    peak = 0.0
+    total_frames = 0
+
+    for chunk in iter_pcm(file_path, SAMPLE_RATE, channels, as_float=True):
+        x = chunk.astype(np.float64)
+        frames = len(x)
+        total_frames += frames
+
+        # K-weighting by overlap-save FFT convolution
+        buffer = np.concatenate((k_history, x))
+        fft_size = 1 << (len(buffer) - 1).bit_length()
+        spectrum = _k_weighting_spectrum(fft_size)
+        weighted = np.fft.irfft(np.fft.rfft(buffer, fft_size, axis=0) * spectrum[:, None], fft_size, axis=0)
+        weighted = weighted[K_WEIGHT_TAPS - 1:K_WEIGHT_TAPS - 1 + frames]
+        k_history = buffer[-(K_WEIGHT_TAPS - 1):]
+
+        squared = np.concatenate((partial, weighted * weighted))
+        whole = len(squared) - len(squared) % SEGMENT_FRAMES
+        if whole:
+            segment_energy.append(squared[:whole].reshape(-1, SEGMENT_FRAMES, channels).sum(axis=1))
+        partial = squared[whole:]
+
+        # True peak: the samples themselves and every interpolated phase
+        peak = max(peak, float(np.abs(x).max()))
+        buffer = np.concatenate((tp_history, x))
+        for phase in phases:
+            for channel in range(channels):
+                interpolated = np.convolve(buffer[:, channel], phase, mode="valid")
+                peak = max(peak, float(np.abs(interpolated).max()))
+        tp_history = buffer[-(TRUE_PEAK_TAPS_PER_PHASE - 1):]
+
+    true_peak = 20 * math.log10(peak) if peak > 0 else None
+    if not total_frames:
+        return LoudnessReport(None, true_peak)
+
+    energy = np.concatenate(segment_energy) if segment_energy else np.zeros((0, channels))
+    if len(energy) >= 4:
+        # 400 ms blocks stepping by 100 ms: mean square over 4 consecutive segments
+        # (a trailing partial segment never completes a block and is left out)
+        cumulative = np.concatenate((np.zeros((1, channels)), np.cumsum(energy, axis=0)))
+        block_power = ((cumulative[4:] - cumulative[:-4]) / (4 * SEGMENT_FRAMES)).sum(axis=1)
+    else:
+        # Shorter than one block: measure the whole track as a single block
+        block_power = np.array([(energy.sum() + partial.sum()) / total_frames])
+
+    with np.errstate(divide="ignore"):
+        block_loudness = -0.691 + 10 * np.log10(block_power)
+    gated = block_power[block_loudness > ABSOLUTE_GATE_LUFS]
+    if not len(gated):
+        return LoudnessReport(None, true_peak)
+    relative_gate = -0.691 + 10 * math.log10(gated.mean()) + RELATIVE_GATE_LU
+    gated = block_power[(block_loudness > ABSOLUTE_GATE_LUFS) & (block_loudness > relative_gate)]
+    integrated = -0.691 + 10 * math.log10(gated.mean())
+    return LoudnessReport(round(integrated, 2), round(true_peak, 2) if true_peak is not None else None)
+
+
+class LoudnessAnalyzer(BatchFileAnalyzer):
+    """EBU R128 loudness over many tracks (see BatchFileAnalyzer), cached in LOUDNESS_CACHE_PATH."""
+
+    config_section = "loudness"
+
+    def __init__(self, cache_path: str = LOUDNESS_CACHE_PATH):
+        super().__init__(cache_path)
+
+    @staticmethod
+    def available() -> bool:
+        return numpy_available()
+
+    def worker(self):
+        return analyze_loudness
+
+    def report_from_dict(self, data: dict, settings: list) -> LoudnessReport:
+        return LoudnessReport.from_dict(data)
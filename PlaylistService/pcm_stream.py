@@ -0,0 +1,52 @@
+import subprocess
+from typing import Iterator
+
+from PlaylistService.fs_utils import FFMPEG_CREATION_FLAGS
+
+try:
+    import numpy as np
+except ImportError:  # Waveform/analysis features are skipped without NumPy
+    np = None
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def iter_pcm(file_path: str, sample_rate: int = 8000, channels: int = 1,
+             chunk_frames: int = 65536, as_float: bool = False) -> Iterator["np.ndarray"]:
+    """Decode an audio file with ffmpeg and yield it as int16 arrays of shape (frames, channels).
+
+    With as_float the arrays are float32 in [-1, 1] instead, and peaks above
+    full scale in the source survive decoding.
+
+    The file is streamed through ffmpeg's stdout, so memory use is one chunk
+    regardless of the file's length. Stopping the iteration early stops ffmpeg.
+    Raises OSError if ffmpeg can't be started and RuntimeError if it fails.
+    """
+    if np is None:
+        raise RuntimeError("NumPy is not installed")
+    cmd = ['ffmpeg', '-nostdin', '-hide_banner', '-loglevel', 'error', '-i', file_path,
+           '-vn', '-ac', str(channels), '-ar', str(sample_rate), '-f', 'f32le' if as_float else 's16le', '-']
+    dtype = "<f4" if as_float else "<i2"
+    frame_bytes = np.dtype(dtype).itemsize * channels
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               creationflags=FFMPEG_CREATION_FLAGS)
+    try:
+        carry = b""
+        while True:
+            data = process.stdout.read(chunk_frames * frame_bytes)
+            if not data:
+                break
+            data = carry + data
+            usable = len(data) - len(data) % frame_bytes
+            carry = data[usable:]
+            if usable:
+                yield np.frombuffer(data[:usable], dtype=dtype).reshape(-1, channels)
+        if process.wait() != 0:
+            raise RuntimeError(f"ffmpeg could not decode {file_path}")
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
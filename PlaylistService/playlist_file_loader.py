@@ -1,24 +1,71 @@
+import codecs
+import io
 import os
+from typing import Callable, Iterator, List, Optional
 from models.playlist import Playlist
 from models.track import Track
+from PlaylistService.write_behind import WriteBehindWriter, atomic_write
 
-def load_playlist(file_path: str) -> Playlist:
-    playlist = Playlist()
-    playlist.path = file_path
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+# Tracks are built and handed out in batches of this size
+DEFAULT_CHUNK_SIZE = 2000
+
+# Longest BOMs first: the UTF-32 LE BOM starts with the UTF-16 LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Legacy .m3u files written by Windows tools are usually ANSI, not UTF-8
+FALLBACK_ENCODING = "cp1252"
+
+
+def detect_bom_encoding(head: bytes) -> Optional[str]:
+    """Return the codec named by a byte-order mark at the start of head, if any."""
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    return None
+
+
+def _decode_line(raw: bytes) -> str:
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw.decode(FALLBACK_ENCODING, errors="replace")
 
+
+def iter_playlist_lines(file_path: str) -> Iterator[str]:
+    """Stream the lines of a playlist file as text.
+
+    A UTF-16/32 BOM selects that codec for the whole file. Otherwise (plain
+    or UTF-8 BOM) each line is decoded as UTF-8 and falls back to cp1252 on
+    its own, so one stray ANSI line in an otherwise UTF-8 file doesn't garble
+    the rest.
+    """
+    with open(file_path, "rb") as f:
+        encoding = detect_bom_encoding(f.read(4))
+        f.seek(0)
+        if encoding and encoding != "utf-8-sig":
+            with io.TextIOWrapper(f, encoding=encoding, errors="replace") as text:
+                yield from text
+        else:
+            for raw in f:
+                yield _decode_line(raw)
+
+
+def iter_playlist_tracks(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Track]]:
+    """Parse an M3U/M3U8 (or plain path list) file, yielding tracks in chunks."""
+    chunk: List[Track] = []
     current_title = None
     current_duration = None
 
-    for line in lines:
-
-        line = line.strip()
+    for line in iter_playlist_lines(file_path):
+        line = line.strip().lstrip('\ufeff')
         if not line or line.startswith('#') and not line.startswith('#EXTINF'):
             continue
-        if line.startswith('\ufeff'):
-            continue
         if line.startswith('#EXTINF:'):
             try:
                 duration_title = line[8:]
@@ -29,25 +76,67 @@ def load_playlist(file_path: str) -> Playlist:
                 current_duration = None
                 current_title = None
         else:
-            track = Track(path=line, title=current_title, duration=current_duration)
-            playlist.add_track(track, len(playlist.tracks))
+            chunk.append(Track(path=line, title=current_title, duration=current_duration))
             current_title = None
             current_duration = None
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def load_playlist(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Playlist:
+    """Load a playlist file.
+
+    Args:
+        file_path: Path to the .m3u/.m3u8 file.
+        chunk_size: Number of tracks parsed per batch.
+    """
+    playlist = Playlist()
+    playlist.path = file_path
+
+    for chunk in iter_playlist_tracks(file_path, chunk_size):
+        playlist.tracks.extend(chunk)
 
     return playlist
 
-def save_playlist(playlist: Playlist, file_path: str = None):
+def render_playlist(playlist: Playlist, file_path: str = None) -> bytes:
+    """Build the complete file contents for a playlist in one buffer."""
     if file_path is None:
         file_path = playlist.path
-    
+
     is_m3u_format = file_path.lower().endswith(('.m3u', '.m3u8'))
 
-    with open(file_path, 'w', encoding="utf-8") as f:
+    lines = []
+    if is_m3u_format:
+        lines.append('#EXTM3U')
+    for track in playlist.tracks:
         if is_m3u_format:
-            f.write('#EXTM3U\n')
-        for track in playlist.tracks:
-            if is_m3u_format:
-                duration = track.duration if track.duration is not None else 0
-                title = track.title if track.title else os.path.basename(track.path)
-                f.write(f'#EXTINF:{duration},{title}\n')
-            f.write(f'{track.path}\n')
\ No newline at end of file
+            duration = track.duration if track.duration is not None else 0
+            title = track.title if track.title else os.path.basename(track.path)
+            lines.append(f'#EXTINF:{duration},{title}')
+        lines.append(track.path)
+    lines.append('')
+    # Same line endings text-mode writes always produced on this platform
+    return os.linesep.join(lines).encode("utf-8")
+
+
+def save_playlist(playlist: Playlist, file_path: str = None, writer: Optional[WriteBehindWriter] = None,
+                  on_done: Optional[Callable[[bool], None]] = None):
+    """Save a playlist atomically.
+
+    With a writer the write is queued on its background thread (on_done is
+    called there with the result); otherwise it happens now.
+    """
+    if file_path is None:
+        file_path = playlist.path
+
+    data = render_playlist(playlist, file_path)
+    if writer is not None:
+        writer.submit(file_path, data, on_done)
+    else:
+        atomic_write(file_path, data)
+        if on_done:
+            on_done(True)
@@ -0,0 +1,94 @@
+from typing import Callable, List, Optional
+from models.playlist import Playlist
+
+
+class PlaylistSearchIndex:
+    """Pre-lowercased search text per track, built from the Playlist model.
+
+    Results are model indices, so callers map them back to tree rows by position
+    instead of reading values out of Tk. When a query extends the previous one,
+    only the previous matches are re-checked.
+    """
+
+    # Separator that can't appear in user input, so matches never span two fields
+    FIELD_SEPARATOR = "\x1f"
+
+    def __init__(self):
+        self._texts: List[str] = []
+        self._row_numbers: List[str] = []
+        self._valid = False
+        self._last_text = None
+        self._last_number = None
+        self._last_results: List[int] = []
+
+    def invalidate(self):
+        """Mark the index stale; it is rebuilt lazily on the next search."""
+        self._valid = False
+        self._last_text = None
+        self._last_number = None
+        self._last_results = []
+
+    @property
+    def is_valid(self) -> bool:
+        return self._valid
+
+    def build(self, playlist: Playlist, format_fields: Callable[[object], tuple]):
+        """Build the index from the playlist.
+
+        Args:
+            playlist: The playlist to index.
+            format_fields: Returns the displayed, searchable fields for a track
+                (everything except the row number).
+        """
+        separator = self.FIELD_SEPARATOR
+        self._texts = [
+            separator.join(str(field) for field in format_fields(track)).lower()
+            for track in playlist.tracks
+        ]
+        self._row_numbers = [str(i + 1) for i in range(len(self._texts))]
+        self._valid = True
+        self._last_text = None
+        self._last_number = None
+        self._last_results = []
+
+    def search(self, search_text: str = "", search_number: str = "") -> List[int]:
+        """Return the model indices matching the query, in playlist order.
+
+        The number query matches against the row number. The text query matches
+        against all other fields, and also the row number when no number query is
+        active (same rules the tree search has always used).
+        """
+        search_text = search_text.lower() if search_text else ""
+        search_number = search_number.strip() if search_number else ""
+        if not search_text and not search_number:
+            self._last_text = None
+            self._last_number = None
+            self._last_results = []
+            return []
+
+        candidates: Optional[List[int]] = None
+        if (self._last_text is not None
+                and search_text.startswith(self._last_text)
+                and search_number.startswith(self._last_number)
+                # Adding a number query changes which columns the text matches
+                and bool(search_number) == bool(self._last_number)):
+            candidates = self._last_results
+
+        texts = self._texts
+        row_numbers = self._row_numbers
+        if candidates is None:
+            candidates = range(len(texts))
+
+        if search_number and search_text:
+            results = [i for i in candidates
+                       if search_number in row_numbers[i] and search_text in texts[i]]
+        elif search_number:
+            results = [i for i in candidates if search_number in row_numbers[i]]
+        else:
+            results = [i for i in candidates
+                       if search_text in texts[i] or search_text in row_numbers[i]]
+
+        self._last_text = search_text
+        self._last_number = search_number
+        self._last_results = results
+        return results
@@ -6,6 +6,7 @@ from PlaylistService.playlist_store import PlaylistStore
 from PlaylistService.playlist_editor import PlaylistEditor
 from PlaylistService.api_playlist_manager import ApiPlaylistManager, RemotePlaylistRegistry, ConnectionStatus
 from PlaylistService.track_utils import TrackUtils
+from PlaylistService.start_time_engine import StartTimeEngine
 import app_config
 from models.track import Track
 from typing import List, Optional
@@ -26,8 +27,14 @@ class PlaylistServiceManager:
             self._default_source_id = available[0][0]
         
         self.playlists = self.store.open_playlists
+        # Start-time engines keyed by playlist id
+        self._start_time_engines: dict = {}
         self.intro_dir = app_config.get(["paths", "intros_dir"], "")
+        app_config.subscribe(self._on_paths_config_changed, ("paths",))
     
+    def _on_paths_config_changed(self, changed):
+        self.intro_dir = app_config.get(["paths", "intros_dir"], "")
+
     @property
     def api_manager(self) -> Optional[ApiPlaylistManager]:
         """Legacy property - returns the default/first API manager."""
@@ -55,11 +62,29 @@ class PlaylistServiceManager:
     def load_playlist_from_path(self, path) -> Playlist:
         return self.store.load_playlist_from_path(path)
 
+    def create_placeholder_playlist(self, path) -> Playlist:
+        return self.store.create_placeholder_playlist(path)
+
+    def read_playlist_tracks(self, path) -> tuple:
+        return self.store.read_playlist_tracks(path)
+
+    def attach_playlist_tracks(self, playlist: Playlist, tracks: List[Track], from_snapshot: bool):
+        self.store.attach_playlist_tracks(playlist, tracks, from_snapshot)
+
     def save_playlist(self, playlist, file_path=None):
         self.store.save_playlist(playlist, file_path)
 
+    def write_snapshot(self):
+        """Cache the open playlists (tracks, metadata, intro/exists flags) for fast restore."""
+        self.store.write_snapshot()
+
+    def flush_pending_writes(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued playlist saves to finish (call before exiting)."""
+        return self.store.flush_pending_writes(timeout)
+
     def close_playlist(self, playlist):
         self.store.close_playlist(playlist)
+        self._start_time_engines.pop(playlist.id, None)
 
     # Remote Playlist loading
     def load_api_playlist(self, source_id: str = None) -> Optional[Playlist]:
@@ -99,8 +124,9 @@ class PlaylistServiceManager:
         return self.store.get_source_status(source_id)
 
     def update_playlist_metadata(self, playlist: Playlist):
+        use_verified_duration = playlist.type != Playlist.PlaylistType.API
         for track in playlist.tracks:
-            TrackUtils.update_track_metadata(track)
+            TrackUtils.update_track_metadata(track, use_verified_duration)
     
     def update_track_metadata(self, tracks: List[Track]):
         for track in tracks:
@@ -109,27 +135,19 @@ class PlaylistServiceManager:
     def update_play_times(self, updated_track: Track, playlist: Playlist):
         if updated_track.play_time is None:
             print(f"in PlaylistServiceManager.update_play_times: play_time is None for {updated_track.title} by {updated_track.artist}")
+            return
         if updated_track.play_time < 0 or updated_track.play_time > 604800:
             print(f"in PlaylistServiceManager.update_play_times: play_time {updated_track.play_time} is not a valid time for {updated_track.title} by {updated_track.artist}")
         track_index = playlist.tracks.index(updated_track)
-        
-        # calculate backwards
-        for i in range(track_index - 1, -1, -1):
-            current_known_track = playlist.tracks[i + 1]
-            previous_track = playlist.tracks[i]
-            previous_duration = 0 if previous_track.duration is None else previous_track.duration
-            previous_track.play_time = current_known_track.play_time - previous_duration
-            if previous_track.play_time < 0:
-                previous_track.play_time += 604800
-                
-        # calculate forwards
-        for i in range(track_index + 1, len(playlist.tracks)):
-            current_known_track = playlist.tracks[i - 1]
-            next_track = playlist.tracks[i]
-            duration = 0 if current_known_track.duration is None else current_known_track.duration
-            next_track.play_time = current_known_track.play_time + duration
-            if next_track.play_time > 604800:
-                next_track.play_time -= 604800
+        self.get_start_time_engine(playlist).update(playlist.tracks, track_index, updated_track.play_time)
+
+    def get_start_time_engine(self, playlist: Playlist) -> StartTimeEngine:
+        """Get (or create) the start-time engine kept for a playlist."""
+        engine = self._start_time_engines.get(playlist.id)
+        if engine is None:
+            engine = StartTimeEngine()
+            self._start_time_engines[playlist.id] = engine
+        return engine
 
     def check_for_intros_and_exists(self, playlist: Playlist = None, tracks: List[Track] = None, be_verbose: bool = False):
         if playlist is None and tracks is None:
@@ -146,6 +164,20 @@ class PlaylistServiceManager:
                 TrackUtils.check_for_intro(self.intro_dir, track)
                 TrackUtils.check_if_track_exists(track)
 
+    def find_stale_snapshot_tracks(self, playlist: Playlist) -> List[Track]:
+        """Refresh intro/exists flags of a snapshot-restored playlist; return the tracks whose tags need re-reading.
+
+        That is files that reappeared, never had tags read, or changed size or mtime since the snapshot.
+        """
+        stale = []
+        for track in playlist.tracks:
+            was_missing = not track.exists
+            TrackUtils.check_for_intro(self.intro_dir, track)
+            signature = TrackUtils.check_if_track_exists(track)
+            if track.exists and (was_missing or track.metadata is None or signature != track.file_signature):
+                stale.append(track)
+        return stale
+
     def get_current_api_playing_track_pos(self, source_id: str = None) -> Optional[int]:
         """Get current playing track position for a source."""
         if source_id is None:
@@ -0,0 +1,107 @@
+import marshal
+import mmap
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from models.track import Track
+from PlaylistService.fs_utils import data_path, file_signature
+
+SNAPSHOT_FILE = data_path("playlist_snapshot.bin")
+
+_MAGIC = b"PBSNAP"
+_VERSION = 3
+_HEADER = struct.Struct("<6sH")
+
+# (path, artist, title, duration, has_intro, exists, metadata, file signature)
+TrackRecord = Tuple[str, str, str, Optional[float], bool, bool, Optional[dict], Optional[tuple]]
+# (source size, source mtime_ns, track records): the playlist file's signature, then its tracks
+PlaylistRecord = Tuple[int, int, List[TrackRecord]]
+
+
+def track_record(track: Track) -> TrackRecord:
+    return (track.path, track.artist, track.title, track.duration, track.has_intro, track.exists, track.metadata,
+            track.file_signature)
+
+
+def track_from_record(record: TrackRecord) -> Track:
+    path, artist, title, duration, has_intro, exists, metadata, signature = record
+    track = Track(path=path, artist=artist, title=title, duration=duration, metadata=metadata)
+    track.has_intro = has_intro
+    track.exists = exists
+    track.file_signature = signature
+    return track
+
+
+class PlaylistSnapshot:
+    """Parsed playlists with their metadata, cached in one binary file.
+
+    An entry is only used when the playlist file's mtime and size still match
+    what was recorded, so edits made outside the app fall back to parsing.
+    The file is a small header (magic + format version) followed by a marshal
+    payload, read through mmap so restoring a whole profile is one read.
+    """
+
+    def __init__(self, snapshot_path: str = SNAPSHOT_FILE):
+        self.snapshot_path = snapshot_path
+        self._entries: Optional[Dict[str, PlaylistRecord]] = None
+        # restore() runs on the playlist load pool; the first caller reads the file, the rest wait for it
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, PlaylistRecord]:
+        entries = self._entries
+        if entries is not None:
+            return entries
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            return self._entries
+
+    def _read(self) -> Dict[str, PlaylistRecord]:
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if len(mm) < _HEADER.size:
+                        return {}
+                    magic, version = _HEADER.unpack_from(mm, 0)
+                    if magic != _MAGIC or version != _VERSION:
+                        print(f"Ignoring playlist snapshot with unknown format (version {version})")
+                        return {}
+                    with memoryview(mm) as view:
+                        payload = marshal.loads(view[_HEADER.size:])
+            if isinstance(payload, dict):
+                return payload
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, EOFError, TypeError) as e:
+            print(f"Failed to read playlist snapshot {self.snapshot_path}: {e}")
+        return {}
+
+    def restore(self, file_path: str) -> Optional[List[Track]]:
+        """Tracks cached for file_path, or None if missing or the file changed since."""
+        entry = self._load().get(file_path)
+        if entry is None:
+            return None
+        size, mtime_ns, records = entry
+        if file_signature(file_path) != (size, mtime_ns):
+            return None
+        return [track_from_record(record) for record in records]
+
+    @staticmethod
+    def render(entries: Dict[str, PlaylistRecord]) -> bytes:
+        """Serialize entries into the snapshot file format."""
+        try:
+            payload = marshal.dumps(entries)
+        except ValueError:
+            # Some tag library handed us a non-plain metadata value; drop metadata rather than the snapshot
+            entries = {
+                path: (size, mtime_ns, [record[:6] + (None,) + record[7:] for record in records])
+                for path, (size, mtime_ns, records) in entries.items()
+            }
+            payload = marshal.dumps(entries)
+        return _HEADER.pack(_MAGIC, _VERSION) + payload
+
+    def remember(self, entries: Dict[str, PlaylistRecord]):
+        """Make freshly written entries visible to restore() without re-reading the file."""
+        with self._lock:
+            self._entries = dict(entries)
@@ -1,6 +1,9 @@
 from models.playlist import Playlist
 from PlaylistService import playlist_file_loader
 from PlaylistService.api_playlist_manager import ApiPlaylistManager, RemotePlaylistRegistry
+from PlaylistService.write_behind import WriteBehindWriter
+from PlaylistService.fs_utils import file_signature
+from PlaylistService.playlist_snapshot import PlaylistSnapshot, track_record
 from typing import Optional
 
 
@@ -14,6 +17,14 @@ class PlaylistStore:
         # The registry manages all ApiPlaylistManager instances
         self.remote_registry = RemotePlaylistRegistry()
 
+        # Playlist files are written off the Tk thread (they often live on a network share)
+        self.playlist_writer = WriteBehindWriter(name="playlist-writer")
+
+        # Parsed playlists + metadata cached between sessions
+        self.snapshot = PlaylistSnapshot()
+        # path -> (size, mtime_ns, track paths) as last read from or written to disk
+        self._source_states: dict[str, tuple] = {}
+
     @property
     def api_playlist(self) -> Optional[Playlist]:
         """Legacy property - returns first connected API playlist or None."""
@@ -47,25 +58,114 @@ class PlaylistStore:
             if playlist.path == path:
                 return playlist
         try:
-            playlist = playlist_file_loader.load_playlist(path)
+            playlist = Playlist(tracks=[], path=path, type=Playlist.PlaylistType.LOCAL)
+            tracks, from_snapshot = self.read_playlist_tracks(path)
+            self.attach_playlist_tracks(playlist, tracks, from_snapshot)
             self.open_playlists.append(playlist)
             return playlist
         except Exception as e:
             print(f"Failed to load playlist {path}: {e}")
             return None
 
+    def create_placeholder_playlist(self, path: str) -> Playlist:
+        """Open a local playlist without parsing it yet (see read/attach_playlist_tracks)."""
+        for playlist in self.open_playlists:
+            if playlist.path == path:
+                return playlist
+        playlist = Playlist(tracks=[], path=path, type=Playlist.PlaylistType.LOCAL)
+        playlist.loaded = False
+        self.open_playlists.append(playlist)
+        return playlist
+
+    def read_playlist_tracks(self, path: str) -> tuple[list, bool]:
+        """Parse a playlist file (or restore it from the snapshot). Safe to call off the Tk thread.
+
+        Returns (tracks, from_snapshot).
+        """
+        tracks = self.snapshot.restore(path)
+        if tracks is not None:
+            return tracks, True
+        return playlist_file_loader.load_playlist(path).tracks, False
+
+    def attach_playlist_tracks(self, playlist: Playlist, tracks: list, from_snapshot: bool):
+        """Fill a (placeholder) playlist with parsed tracks.
+
+        A placeholder tab can be edited while its file is parsed; tracks added
+        meanwhile (drops, pastes, library search) are kept after the parsed
+        ones, and count as unsaved changes.
+        """
+        added = [] if playlist.loaded else playlist.tracks
+        playlist.tracks = list(tracks) + added
+        playlist.from_snapshot = from_snapshot
+        playlist.loaded = True
+        self._record_source_state(playlist.path, tracks)
+
     def save_playlist(self, playlist: Playlist, file_path: str = None) -> bool:
         """Save a playlist to file."""
         if playlist is None:
             print("Playlist is None, cannot save")
             return False
+        if not playlist.loaded:
+            # Writing a placeholder would empty the file on disk
+            print(f"Playlist {playlist.path} has not been loaded yet, not saving")
+            return False
         try:
-            playlist_file_loader.save_playlist(playlist, file_path)
+            target = file_path if file_path is not None else playlist.path
+            track_paths = tuple(track.path for track in playlist.tracks)
+
+            def on_saved(success, target=target, track_paths=track_paths):
+                if success:
+                    self._record_source_state(target, track_paths=track_paths)
+
+            playlist_file_loader.save_playlist(playlist, file_path, writer=self.playlist_writer, on_done=on_saved)
             return True
         except Exception as e:
             print(f"Failed to save playlist {playlist.path}: {e}")
             return False
 
+    def _record_source_state(self, path: str, tracks=None, track_paths=None):
+        """Remember what is on disk for a playlist file, so snapshots can tell saved from unsaved tracks."""
+        signature = file_signature(path)
+        if signature is None:
+            self._source_states.pop(path, None)
+            return
+        if track_paths is None:
+            track_paths = tuple(track.path for track in tracks)
+        self._source_states[path] = signature + (track_paths,)
+
+    def write_snapshot(self):
+        """Queue a snapshot of the open local playlists on the background writer.
+
+        Track data is captured now; which playlists qualify is decided on the
+        writer thread, after any queued saves have landed. Playlists with
+        unsaved edits, or whose file changed outside the app, are left out.
+        """
+        captured = [
+            (playlist.path, [track_record(track) for track in playlist.tracks])
+            for playlist in self.open_playlists
+            if playlist.type == Playlist.PlaylistType.LOCAL and playlist.path and playlist.loaded
+        ]
+        snapshot = self.snapshot
+
+        def build():
+            entries = dict(snapshot._load())
+            for path, records in captured:
+                state = self._source_states.get(path)
+                if state is None or file_signature(path) != state[:2]:
+                    entries.pop(path, None)
+                    continue
+                if tuple(record[0] for record in records) != state[2]:
+                    continue
+                entries[path] = (state[0], state[1], records)
+            snapshot.remember(entries)
+            return snapshot.render(entries)
+
+        self.playlist_writer.submit(snapshot.snapshot_path, build)
+
+    def flush_pending_writes(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued playlist saves to reach disk."""
+        return self.playlist_writer.flush(timeout)
+
     def close_playlist(self, playlist: Playlist) -> bool:
         """Close a playlist and remove it from open playlists."""
         if playlist is None:
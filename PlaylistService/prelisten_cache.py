@@ -0,0 +1,135 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from typing import Iterable, Optional, Tuple
+
+import app_config
+from PlaylistService.fs_utils import file_signature
+
+# Queued prefetches beyond this are dropped (oldest selections first)
+MAX_QUEUED = 8
+
+
+class PrelistenCache:
+    """Local copies of tracks for prelisten, so playback and seeking read from local disk.
+
+    Tracks are copied from the share into a temp folder on a background
+    thread, most recently requested first. The cache is bounded by total
+    bytes (config.json "prelisten.cache_mb", default 512) and evicts the least
+    recently used copies; copies that are playing are pinned. An entry is only
+    used while the source's size and mtime still match.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, cache_dir: Optional[str] = None):
+        self.max_bytes = max_bytes or int(app_config.get(["prelisten", "cache_mb"], 512)) * 1024 * 1024
+        self.cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "playlist_builder_prelisten")
+        # source path -> (local path, size, source signature); order is least -> most recently used
+        self._entries: "OrderedDict[str, Tuple[str, int, tuple]]" = OrderedDict()
+        self._total = 0
+        self._pinned = set()
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def local_path(self, source_path: str) -> Optional[str]:
+        """Local copy of source_path if it's cached and still current, else None."""
+        with self._condition:
+            entry = self._entries.get(source_path)
+        if entry is None:
+            return None
+        local, _, signature = entry
+        if file_signature(source_path) != signature or not os.path.exists(local):
+            with self._condition:
+                self._drop(source_path)
+            return None
+        with self._condition:
+            if source_path in self._entries:
+                self._entries.move_to_end(source_path)
+        return local
+
+    def prefetch(self, source_paths: Iterable[str]):
+        """Copy these tracks in the background, in the given order, ahead of anything queued earlier."""
+        paths = [p for p in source_paths if p]
+        with self._condition:
+            wanted = [p for p in paths if p not in self._entries]
+            older = [p for p in self._queue if p not in wanted]
+            self._queue = deque((wanted + older)[:MAX_QUEUED])
+            if self._queue:
+                self._ensure_thread()
+                self._condition.notify()
+
+    def pin(self, source_path: str):
+        """Keep source_path's copy from being evicted (e.g. while it's playing)."""
+        with self._condition:
+            self._pinned.add(source_path)
+
+    def unpin(self, source_path: str):
+        with self._condition:
+            self._pinned.discard(source_path)
+            self._evict()
+
+    # ---- worker thread ----
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="prelisten-cache", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        # Copies left behind by an earlier session are not in the index; clear them out
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue)
+                source_path = self._queue.popleft()
+                if source_path in self._entries:
+                    continue
+            try:
+                self._copy(source_path)
+            except Exception as e:
+                print(f"Prelisten cache: could not copy {source_path}: {e}")
+
+    def _copy(self, source_path: str):
+        signature = file_signature(source_path)
+        if signature is None:
+            return
+        size = signature[0]
+        if size > self.max_bytes // 2:
+            # A single huge file (e.g. a 3-hour WAV) would flush everything else out
+            return
+        name = hashlib.sha1(source_path.encode("utf-8", "surrogatepass")).hexdigest()
+        local = os.path.join(self.cache_dir, name + os.path.splitext(source_path)[1].lower())
+        partial = local + ".part"
+        shutil.copyfile(source_path, partial)
+        os.replace(partial, local)
+        with self._condition:
+            self._drop(source_path)
+            self._entries[source_path] = (local, size, signature)
+            self._total += size
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used copies until under budget (lock held)."""
+        for source_path in list(self._entries):
+            if self._total <= self.max_bytes:
+                return
+            if source_path not in self._pinned:
+                self._drop(source_path)
+
+    def _drop(self, source_path: str):
+        """Forget and delete one copy (lock held)."""
+        entry = self._entries.pop(source_path, None)
+        if entry is None:
+            return
+        local, size, _ = entry
+        self._total -= size
+        try:
+            os.remove(local)
+        except OSError:
+            # Still open somewhere (Windows); it's cleared with the folder next session
+            pass
+
@@ -0,0 +1,207 @@
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+from PlaylistService.fs_utils import data_path
+
+PROFILE_DB_FILE = data_path("settings.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    name     TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profile_entries (
+    profile  TEXT NOT NULL REFERENCES profiles(name) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    entry    TEXT NOT NULL,
+    PRIMARY KEY (profile, position)
+);
+"""
+
+
+def _encode(value) -> str:
+    return json.dumps(value, sort_keys=True)
+
+
+class ProfileDatabase:
+    """Profiles and app settings in an embedded SQLite database.
+
+    Holds the same data as settings.json, but with one row per profile entry
+    (keyed by profile name and tab position) and one row per top-level
+    setting. Each sync compares the settings dict with what was last stored and
+    writes only the rows that changed, in a single transaction, so toggling a
+    remote or moving the window touches a row or two instead of every profile.
+
+    All database access happens on one background thread; sync_async() and
+    flush() are safe to call from the Tk thread.
+    """
+
+    def __init__(self, db_path: str = PROFILE_DB_FILE):
+        self.db_path = db_path
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-db")
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        # What the database holds, as last read or written: key -> encoded value,
+        # profile -> encoded entries in position order
+        self._stored_settings: Dict[str, str] = {}
+        self._stored_profiles: Dict[str, List[str]] = {}
+
+    # ---- public API (Tk thread) ----
+
+    def load(self, legacy_json_path: Optional[str] = None) -> Optional[dict]:
+        """Return every setting as a settings.json-shaped dict.
+
+        When the database is new and legacy_json_path exists, its contents are
+        imported first. Returns None if the database is empty and there was
+        nothing to migrate.
+        """
+        return self._executor.submit(self._load, legacy_json_path).result()
+
+    def sync_async(self, settings: dict):
+        """Queue settings (a private copy the caller won't mutate) to be written."""
+        future = self._executor.submit(self._sync, settings)
+        with self._pending_lock:
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(future)
+
+    def replace(self, settings: dict) -> dict:
+        """Store settings in place of everything in the database (e.g. an imported settings.json).
+
+        Waits for the write and returns the settings as now stored.
+        """
+        return self._executor.submit(self._replace, settings).result()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued writes. Returns False on timeout."""
+        with self._pending_lock:
+            pending = list(self._pending)
+        _, not_done = wait(pending, timeout)
+        return not not_done
+
+    # ---- database thread ----
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.db_path)
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _load(self, legacy_json_path: Optional[str]) -> Optional[dict]:
+        connection = self._connect()
+        has_profiles = connection.execute("SELECT 1 FROM profiles LIMIT 1").fetchone()
+        has_settings = connection.execute("SELECT 1 FROM settings LIMIT 1").fetchone()
+        if not has_profiles and not has_settings:
+            if legacy_json_path and os.path.exists(legacy_json_path):
+                self._migrate_from_json(legacy_json_path)
+            else:
+                return None
+
+        self._read_stored(connection)
+        settings = {key: json.loads(value) for key, value in self._stored_settings.items()}
+        settings["profiles"] = {
+            name: [json.loads(entry) for entry in entries]
+            for name, entries in self._stored_profiles.items()
+        }
+        return settings
+
+    def _replace(self, settings: dict) -> dict:
+        self._sync(settings)
+        return self._load(None) or {"profiles": {}}
+
+    def _read_stored(self, connection: sqlite3.Connection):
+        self._stored_settings = dict(connection.execute("SELECT key, value FROM settings"))
+        self._stored_profiles = {
+            name: [] for (name,) in connection.execute("SELECT name FROM profiles ORDER BY position")
+        }
+        for profile, entry in connection.execute(
+                "SELECT profile, entry FROM profile_entries ORDER BY profile, position"):
+            self._stored_profiles[profile].append(entry)
+
+    def _migrate_from_json(self, json_path: str):
+        """Import settings.json into the empty database (the JSON file is left in place)."""
+        try:
+            with open(json_path, "r") as f:
+                settings = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not migrate {json_path} to {self.db_path}: {e}")
+            return
+        profiles = settings.get("profiles", {})
+        if isinstance(profiles, list):
+            settings["profiles"] = {name: [] for name in profiles}
+        self._sync(settings)
+        print(f"Migrated {len(settings.get('profiles', {}))} profiles from {json_path} to {self.db_path}")
+
+    def _sync(self, settings: dict):
+        new_settings = {key: _encode(value) for key, value in settings.items() if key != "profiles"}
+        new_profiles = {
+            name: [_encode(entry) for entry in entries]
+            for name, entries in settings.get("profiles", {}).items()
+        }
+        try:
+            connection = self._connect()
+            with connection:
+                self._sync_settings(connection, new_settings)
+                self._sync_profiles(connection, new_profiles)
+        except sqlite3.Error as e:
+            print(f"Failed to save settings to {self.db_path}: {e}")
+            # The transaction was rolled back; diff against what is really stored next time
+            try:
+                self._read_stored(self._connect())
+            except sqlite3.Error:
+                pass
+            return
+        self._stored_settings = new_settings
+        self._stored_profiles = new_profiles
+
+    def _sync_settings(self, connection: sqlite3.Connection, new_settings: Dict[str, str]):
+        stored = self._stored_settings
+        changed = [(key, value) for key, value in new_settings.items() if stored.get(key) != value]
+        if changed:
+            connection.executemany(
+                "INSERT INTO settings (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value", changed)
+        removed = [(key,) for key in stored if key not in new_settings]
+        if removed:
+            connection.executemany("DELETE FROM settings WHERE key = ?", removed)
+
+    def _sync_profiles(self, connection: sqlite3.Connection, new_profiles: Dict[str, List[str]]):
+        stored = self._stored_profiles
+        removed = [(name,) for name in stored if name not in new_profiles]
+        if removed:
+            connection.executemany("DELETE FROM profiles WHERE name = ?", removed)
+
+        if list(stored) != list(new_profiles):
+            connection.executemany(
+                "INSERT INTO profiles (name, position) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET position = excluded.position",
+                [(name, position) for position, name in enumerate(new_profiles)])
+
+        for name, entries in new_profiles.items():
+            old_entries = stored.get(name, [])
+            if entries == old_entries:
+                continue
+            changed = [
+                (name, position, entry)
+                for position, entry in enumerate(entries)
+                if position >= len(old_entries) or old_entries[position] != entry
+            ]
+            if changed:
+                connection.executemany(
+                    "INSERT INTO profile_entries (profile, position, entry) VALUES (?, ?, ?) "
+                    "ON CONFLICT(profile, position) DO UPDATE SET entry = excluded.entry", changed)
+            if len(old_entries) > len(entries):
+                connection.execute(
+                    "DELETE FROM profile_entries WHERE profile = ? AND position >= ?",
+                    (name, len(entries)))
@@ -0,0 +1,146 @@
+import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from models.playlist import Playlist
+from PlaylistService.start_time_engine import WEEK_SECONDS, StartTimeEngine
+
+HOUR_SECONDS = 3600
+
+
+def current_week_time(now: Optional[datetime.datetime] = None) -> float:
+    """Seconds since Sunday 00:00 (same week layout as track play times)."""
+    now = now or datetime.datetime.now()
+    day = (now.weekday() + 1) % 7  # Python's Monday=0 -> our Sunday=0
+    return day * 86400 + now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+
+
+class ScheduleAnalysis:
+    """Schedule questions answered from a playlist's duration column.
+
+    Built once per question batch on a StartTimeEngine's cumulative offsets
+    (pass the playlist's engine to reuse what it already summed); every
+    lookup after that is a bisect or an index into that array, so a 10k-row
+    playlist answers instantly.
+
+    The playlist is "timed" when at least one track has a play_time; the first
+    such track anchors wall-clock times for the rest. Untimed playlists still
+    answer offset questions (runtime, time from row A to row B).
+    """
+
+    def __init__(self, playlist: Playlist, engine: Optional[StartTimeEngine] = None):
+        tracks = playlist.tracks
+        self._count = len(tracks)
+        self._engine = engine or StartTimeEngine()
+        self._engine.measure(tracks)
+        self._cumulative = self._engine.cumulative
+
+        self._base: Optional[float] = None
+        for i, track in enumerate(tracks):
+            if track.play_time is not None:
+                self._base = track.play_time - self._cumulative[i]
+                break
+
+    @property
+    def is_timed(self) -> bool:
+        return self._base is not None
+
+    @property
+    def row_count(self) -> int:
+        return self._count
+
+    @property
+    def total_runtime(self) -> float:
+        """Summed duration of every row, in seconds."""
+        return self._cumulative[-1]
+
+    def offset_of(self, index: int) -> float:
+        """Seconds from the start of row 0 to the start of row index (index == row_count is the end)."""
+        return self._cumulative[index]
+
+    def duration_between(self, start_row: int, end_row: int) -> float:
+        """Runtime of rows start_row..end_row inclusive."""
+        return self._cumulative[end_row + 1] - self._cumulative[start_row]
+
+    def start_time(self, index: int) -> Optional[float]:
+        """Wall-clock start of row index, in seconds since the start of the week."""
+        if self._base is None:
+            return None
+        return (self._base + self._cumulative[index]) % WEEK_SECONDS
+
+    def time_until_row(self, index: int, now_week_time: Optional[float] = None) -> Optional[float]:
+        """Seconds from now until row index starts (wrapping to next week if it already aired)."""
+        start = self.start_time(index)
+        if start is None:
+            return None
+        if now_week_time is None:
+            now_week_time = current_week_time()
+        return (start - now_week_time) % WEEK_SECONDS
+
+    def row_at_time(self, week_time: float) -> Optional[int]:
+        """Row airing at week_time (seconds since the start of the week), or None."""
+        if self._base is None or not self._count:
+            return None
+        return self._engine.row_at_offset((week_time - self._base) % WEEK_SECONDS)
+
+    def hour_crossings(self, boundary_seconds: int = HOUR_SECONDS) -> List[Tuple[int, float, float]]:
+        """Rows that are still playing when a boundary (top of the hour by default) passes.
+
+        Returns (row, boundary week time, seconds into the row at the boundary).
+        One bisect per boundary in the playlist's span, not one check per row.
+        """
+        if self._base is None or not self._count:
+            return []
+        base = self._base
+        cumulative = self._cumulative
+        first_boundary = (int((base + cumulative[0]) // boundary_seconds) + 1) * boundary_seconds
+        end = base + cumulative[-1]
+
+        crossings = []
+        boundary = first_boundary
+        while boundary < end:
+            offset = boundary - base
+            row = self._engine.row_at_offset(offset)
+            # A row starting exactly on the boundary doesn't cross it
+            if row is not None and offset - cumulative[row] > 0:
+                crossings.append((row, boundary % WEEK_SECONDS, offset - cumulative[row]))
+            boundary += boundary_seconds
+        return crossings
+
+    def fits_before_boundary(self, start_row: int, end_row: int,
+                             boundary_seconds: int = HOUR_SECONDS) -> Optional[float]:
+        """Seconds left before the next boundary once rows start_row..end_row have played.
+
+        Negative means the block overruns the boundary by that many seconds.
+        """
+        start = self.start_time(start_row)
+        if start is None:
+            return None
+        next_boundary = (start // boundary_seconds + 1) * boundary_seconds
+        return next_boundary - (start + self.duration_between(start_row, end_row))
+
+    def gaps_and_overlaps(self, scheduled_times: Sequence[Optional[float]],
+                          tolerance: float = 1.0) -> List[Tuple[int, float]]:
+        """Compare each row's scheduled start with where the previous row ends.
+
+        scheduled_times holds one start time (or None) per row, e.g. the hard
+        start times sent by a remote source. Returns (row, delta) for rows off
+        by more than tolerance seconds: positive delta is a gap (dead air before
+        the row), negative is an overlap (the row cuts the previous one short).
+        """
+        cumulative = self._cumulative
+        half_week = WEEK_SECONDS / 2
+        results = []
+        previous_row = None
+        previous_time = None
+        for row, scheduled in enumerate(scheduled_times[:self._count]):
+            if scheduled is None:
+                continue
+            if previous_row is not None:
+                expected = previous_time + cumulative[row] - cumulative[previous_row]
+                # Wrap the difference into (-half week, half week]
+                delta = (scheduled - expected + half_week) % WEEK_SECONDS - half_week
+                if abs(delta) > tolerance:
+                    results.append((row, delta))
+            previous_row = row
+            previous_time = scheduled
+        return results
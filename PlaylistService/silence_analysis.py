@@ -0,0 +1,132 @@
+from typing import List
+
+import app_config
+from PlaylistService.batch_analysis import BatchFileAnalyzer
+from PlaylistService.fs_utils import data_path
+from PlaylistService.pcm_stream import iter_pcm, np, numpy_available
+
+SILENCE_CACHE_PATH = data_path("silence_cache.json")
+
+# Silence only needs loudness over time, so decode small: 8 kHz mono in 50 ms windows
+ANALYSIS_SAMPLE_RATE = 8000
+WINDOW_SAMPLES = 400
+
+# Defaults for config.json "silence" (threshold_db, min_edge_seconds, min_gap_seconds, max_workers)
+DEFAULT_THRESHOLD_DB = -50.0
+DEFAULT_MIN_EDGE_SECONDS = 1.0
+DEFAULT_MIN_GAP_SECONDS = 2.0
+
+
+class SilenceReport:
+    """Silences found in one track: leading/trailing lengths and internal gaps, all in seconds."""
+
+    def __init__(self, duration: float, leading: float, trailing: float, gaps: List[List[float]],
+                 min_edge_seconds: float = DEFAULT_MIN_EDGE_SECONDS):
+        self.duration = duration
+        self.leading = leading
+        self.trailing = trailing
+        self.gaps = gaps
+        self.min_edge_seconds = min_edge_seconds
+
+    @property
+    def flagged(self) -> bool:
+        return self.leading >= self.min_edge_seconds or self.trailing >= self.min_edge_seconds or bool(self.gaps)
+
+    def summary(self) -> str:
+        parts = []
+        if self.leading >= self.min_edge_seconds:
+            parts.append(f"{self.leading:.1f}s at start")
+        if self.trailing >= self.min_edge_seconds:
+            parts.append(f"{self.trailing:.1f}s at end")
+        for start, end in self.gaps:
+            parts.append(f"{end - start:.1f}s at {int(start // 60)}:{int(start % 60):02d}")
+        return ", ".join(parts)
+
+    def to_dict(self) -> dict:
+        return {"duration": self.duration, "leading": self.leading, "trailing": self.trailing, "gaps": self.gaps}
+
+    @classmethod
+    def from_dict(cls, data: dict, min_edge_seconds: float) -> "SilenceReport":
+        return cls(data["duration"], data["leading"], data["trailing"], data["gaps"], min_edge_seconds)
+
+
+def analyze_file(file_path: str, threshold_db: float = DEFAULT_THRESHOLD_DB,
+                 min_edge_seconds: float = DEFAULT_MIN_EDGE_SECONDS,
+                 min_gap_seconds: float = DEFAULT_MIN_GAP_SECONDS) -> SilenceReport:
+    """Decode file_path through ffmpeg and find silences from the RMS level of 50 ms windows.
+
+    Runs in a worker process, so it only takes and returns plain data.
+    """
+    threshold = 10 ** (threshold_db / 20.0) * 32768.0
+    silent_windows = []
+    carry = np.empty(0, dtype=np.int16)
+    for chunk in iter_pcm(file_path, ANALYSIS_SAMPLE_RATE, 1):
+        samples = np.concatenate((carry, chunk[:, 0])) if len(carry) else chunk[:, 0]
+        usable = len(samples) - len(samples) % WINDOW_SAMPLES
+        if usable:
+            windows = samples[:usable].reshape(-1, WINDOW_SAMPLES).astype(np.float32)
+            silent_windows.append(np.sqrt(np.mean(windows * windows, axis=1)) < threshold)
+        carry = samples[usable:]
+    if len(carry):
+        tail = carry.astype(np.float32)
+        silent_windows.append(np.array([np.sqrt(np.mean(tail * tail)) < threshold]))
+
+    window_seconds = WINDOW_SAMPLES / ANALYSIS_SAMPLE_RATE
+    if not silent_windows:
+        return SilenceReport(0.0, 0.0, 0.0, [], min_edge_seconds)
+    silent = np.concatenate(silent_windows)
+    duration = len(silent) * window_seconds
+
+    # Runs of silent windows as [start, end) window indexes
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    leading = trailing = 0.0
+    gaps = []
+    for start, end in zip(starts, ends):
+        length = float(end - start) * window_seconds
+        if start == 0:
+            leading = length
+        if end == len(silent):
+            trailing = length
+        if start > 0 and end < len(silent) and length >= min_gap_seconds:
+            gaps.append([round(float(start) * window_seconds, 2), round(float(end) * window_seconds, 2)])
+    if leading == duration:
+        # An entirely silent file is one long silence, not a leading and a trailing one
+        trailing = 0.0
+    return SilenceReport(round(duration, 2), round(leading, 2), round(trailing, 2), gaps, min_edge_seconds)
+
+
+class SilenceAnalyzer(BatchFileAnalyzer):
+    """Silence detection over many tracks (see BatchFileAnalyzer), cached in SILENCE_CACHE_PATH.
+
+    Settings come from config.json "silence", so changing a threshold
+    re-analyzes files on the next run.
+    """
+
+    config_section = "silence"
+
+    def __init__(self, cache_path: str = SILENCE_CACHE_PATH):
+        super().__init__(cache_path)
+
+    @staticmethod
+    def available() -> bool:
+        return numpy_available()
+
+    def worker(self):
+        return analyze_file
+
+    def settings(self) -> list:
+        return [
+            float(app_config.get(["silence", "threshold_db"], DEFAULT_THRESHOLD_DB)),
+            float(app_config.get(["silence", "min_edge_seconds"], DEFAULT_MIN_EDGE_SECONDS)),
+            float(app_config.get(["silence", "min_gap_seconds"], DEFAULT_MIN_GAP_SECONDS)),
+        ]
+
+    def report_from_dict(self, data: dict, settings: list) -> SilenceReport:
+        return SilenceReport.from_dict(data, settings[1])
+
+    def is_flagged(self, path: str) -> bool:
+        report = self.reports.get(path)
+        return report is not None and report.flagged
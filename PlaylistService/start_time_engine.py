@@ -0,0 +1,159 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, compress, count
+from operator import attrgetter, is_not, ne
+from typing import List, Optional
+
+from models.track import Track
+
+WEEK_SECONDS = 604800
+
+_get_duration = attrgetter("duration")
+_get_play_time = attrgetter("play_time")
+
+
+def _first_index(flags, default: int) -> int:
+    """Index of the first truthy flag, or default (stays in C until the first hit)."""
+    return next(compress(count(), flags), default)
+
+
+class StartTimeEngine:
+    """Start times for one playlist, derived from a cumulative-duration array.
+
+    cumulative[i] is the summed duration of rows 0..i-1, so the start time of
+    row i is (base + cumulative[i]) % WEEK_SECONDS, where base is chosen so the
+    anchor row keeps the play time it was given. The modulo takes care of the
+    weekly wraparound in both directions without per-row branching.
+
+    Between calls the engine keeps what it last saw (track objects, durations
+    and the play times it wrote). Comparing those snapshots is done on whole
+    lists, and only the rows from the first difference onwards are recomputed,
+    so repeated refreshes of an unchanged playlist do no per-row work at all.
+    """
+
+    def __init__(self):
+        self._tracks: List[Track] = []
+        self._durations: list = []
+        self._play_times: list = []
+        self._cumulative = array("d", [0.0])
+        self._anchor_index: Optional[int] = None
+        self._anchor_time: Optional[float] = None
+        self._base = 0.0
+        # First row whose play time measure() left unwritten, if any
+        self._unwritten_from: Optional[int] = None
+
+    @property
+    def total_duration(self) -> float:
+        """Summed duration of every row, in seconds."""
+        return self._cumulative[-1]
+
+    @property
+    def cumulative(self) -> array:
+        """cumulative[i] is the summed duration of rows before row i (length n + 1)."""
+        return self._cumulative
+
+    def __len__(self):
+        return len(self._tracks)
+
+    def update(self, tracks: List[Track], anchor_index: int, anchor_time: float):
+        """Recompute play times so tracks[anchor_index] starts at anchor_time.
+
+        Writes track.play_time for every row whose start time changed.
+        """
+        durations = list(map(_get_duration, tracks))
+        play_times = list(map(_get_play_time, tracks))
+        anchor_unchanged = (anchor_index == self._anchor_index and anchor_time == self._anchor_time)
+
+        if (anchor_unchanged and self._unwritten_from is None and tracks == self._tracks
+                and durations == self._durations and play_times == self._play_times):
+            return
+
+        first_changed = self._first_difference(tracks, durations, play_times)
+        if self._unwritten_from is not None:
+            first_changed = min(first_changed, self._unwritten_from)
+            self._unwritten_from = None
+        self._rebuild_cumulative(durations, first_changed)
+
+        self._tracks = list(tracks)
+        self._durations = durations
+        self._anchor_index = anchor_index
+        self._anchor_time = anchor_time
+        self._base = anchor_time - self._cumulative[anchor_index]
+
+        # Rows before the first change keep their start times unless the anchor
+        # moved or sits after the change (its offset shifted with the edit)
+        if anchor_unchanged and anchor_index <= first_changed:
+            start = first_changed
+        else:
+            start = 0
+        self._write_play_times(start)
+
+    def measure(self, tracks: List[Track]):
+        """Bring the cumulative offsets up to date with tracks without writing any play times.
+
+        Only the rows from the first difference onwards are summed again;
+        the next update() rewrites their play times.
+        """
+        durations = list(map(_get_duration, tracks))
+        if tracks == self._tracks and durations == self._durations:
+            return
+        limit = min(len(tracks), len(self._tracks))
+        first_changed = min(
+            _first_index(map(is_not, tracks, self._tracks), limit),
+            _first_index(map(ne, durations, self._durations), limit),
+        )
+        self._rebuild_cumulative(durations, first_changed)
+        self._tracks = list(tracks)
+        self._durations = durations
+        if self._unwritten_from is None or first_changed < self._unwritten_from:
+            self._unwritten_from = first_changed
+
+    def start_time(self, index: int) -> float:
+        """Start time of row index, in seconds since the start of the week."""
+        return (self._base + self._cumulative[index]) % WEEK_SECONDS
+
+    def offset_of(self, index: int) -> float:
+        """Seconds from the start of row 0 to the start of row index."""
+        return self._cumulative[index]
+
+    def row_at(self, week_time: float) -> Optional[int]:
+        """Row playing at week_time (seconds since the start of the week), or None."""
+        if not self._tracks:
+            return None
+        return self.row_at_offset((week_time - self._base) % WEEK_SECONDS)
+
+    def row_at_offset(self, offset: float) -> Optional[int]:
+        """Row playing offset seconds after the start of row 0, or None past the end."""
+        index = bisect_right(self._cumulative, offset) - 1
+        if index < 0 or index >= len(self._tracks):
+            return None
+        return index
+
+    def _first_difference(self, tracks, durations, play_times) -> int:
+        """Index of the first row that differs from the last snapshot."""
+        limit = min(len(tracks), len(self._tracks))
+        return min(
+            _first_index(map(is_not, tracks, self._tracks), limit),
+            _first_index(map(ne, durations, self._durations), limit),
+            _first_index(map(ne, play_times, self._play_times), limit),
+        )
+
+    def _rebuild_cumulative(self, durations: list, start: int):
+        """Recompute cumulative[start + 1:] from durations[start:]."""
+        cumulative = self._cumulative
+        del cumulative[start + 1:]
+        cumulative.extend(accumulate(
+            (float(d) if d else 0.0 for d in durations[start:]),
+            initial=cumulative[start],
+        ))
+        # accumulate repeats the initial value; drop the duplicate
+        del cumulative[start + 1]
+
+    def _write_play_times(self, start: int):
+        base = self._base
+        cumulative = self._cumulative
+        tracks = self._tracks
+        times = [(base + c) % WEEK_SECONDS for c in cumulative[start:len(tracks)]]
+        for track, play_time in zip(tracks[start:], times):
+            track.play_time = play_time
+        self._play_times[start:] = times
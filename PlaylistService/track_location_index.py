@@ -0,0 +1,48 @@
+from typing import Dict, Hashable, List, Optional
+
+
+class TrackLocationIndex:
+    """Global path -> {owner: row indices} index across open playlists.
+
+    Owners (tabs) push their own path -> rows map whenever their rows change, so
+    finding which playlist holds a path never walks the tracks of every playlist.
+    """
+
+    def __init__(self):
+        self._locations: Dict[str, Dict[Hashable, List[int]]] = {}
+        self._owner_paths: Dict[Hashable, List[str]] = {}
+
+    def update(self, owner: Hashable, path_rows: Dict[str, List[int]]):
+        """Replace everything recorded for owner with its current path -> rows map."""
+        self.remove(owner)
+        locations = self._locations
+        for path, rows in path_rows.items():
+            locations.setdefault(path, {})[owner] = rows
+        self._owner_paths[owner] = list(path_rows)
+
+    def remove(self, owner: Hashable):
+        """Forget an owner (e.g. when its tab is closed)."""
+        locations = self._locations
+        for path in self._owner_paths.pop(owner, ()):
+            owners = locations.get(path)
+            if owners is None:
+                continue
+            owners.pop(owner, None)
+            if not owners:
+                del locations[path]
+
+    def locate(self, path: str) -> Dict[Hashable, List[int]]:
+        """Return {owner: row indices} for every owner containing path."""
+        return dict(self._locations.get(path, {}))
+
+    def first_owner(self, path: str, owners_in_order: Optional[List[Hashable]] = None) -> Optional[Hashable]:
+        """Return the first owner containing path, following owners_in_order when given."""
+        found = self._locations.get(path)
+        if not found:
+            return None
+        if owners_in_order is None:
+            return next(iter(found))
+        for owner in owners_in_order:
+            if owner in found:
+                return owner
+        return None
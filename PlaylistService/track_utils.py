@@ -1,4 +1,6 @@
 from models.track import Track
+from PlaylistService.fs_utils import file_signature
+from PlaylistService.exact_duration import verified_duration
 from mutagen import File, MutagenError
 from mutagen.easyid3 import EasyID3
 from mutagen.id3 import ID3, ID3NoHeaderError
@@ -13,16 +15,21 @@ import datetime
 
 class TrackUtils:
     @staticmethod
-    def update_track_metadata(track: Track):
-        # Check if file exists before attempting to update metadata
-
-            
+    def update_track_metadata(track: Track, use_verified_duration: bool = True):
+        # Taken before the tags are read, so a file rewritten meanwhile looks changed next time
+        signature = file_signature(track.path)
         metadata = TrackUtils._get_track_metadata(track.path)
         track.artist = metadata['artist']
         track.title = metadata['title']
         track.duration = metadata['duration'] if metadata['duration'] != 0 else track.duration
+        # Tags can only estimate some durations (e.g. VBR MP3 without a Xing header).
+        # Remote playlists pass use_verified_duration=False to keep the durations the server schedules with
+        exact = verified_duration(track.path) if use_verified_duration else None
+        if exact:
+            track.duration = exact
         track.metadata = metadata
         track.exists = True
+        track.file_signature = signature
         return track
 
     @staticmethod
@@ -46,7 +53,10 @@ class TrackUtils:
 
     @staticmethod
     def check_if_track_exists(track: Track):
-        track.exists = os.path.exists(track.path)
+        """Set track.exists; returns the file's current signature (None if missing)."""
+        signature = file_signature(track.path)
+        track.exists = signature is not None
+        return signature
     @staticmethod
     def _get_track_metadata(file_path):
         if not os.path.isfile(file_path):
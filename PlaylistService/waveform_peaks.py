@@ -0,0 +1,170 @@
+import hashlib
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from PlaylistService.fs_utils import data_path, file_signature
+from PlaylistService.pcm_stream import iter_pcm, np, numpy_available
+
+PEAK_CACHE_DIR = data_path("waveform_cache")
+
+# Fixed overview resolution, whatever the track length
+PEAK_COLUMNS = 1024
+# Decoding rate for peaks: plenty for an overview, and cheap to stream
+PEAK_SAMPLE_RATE = 8000
+# Min/max are first taken per block of this many samples, then merged into columns
+BLOCK_SAMPLES = 400
+
+_MAGIC = b"PBPEAK"
+_VERSION = 1
+_HEADER = struct.Struct("<6sHIf")  # magic, version, columns, duration
+
+
+class WaveformPeaks:
+    """Min/max overview of a track: PEAK_COLUMNS int8 pairs plus the duration in seconds."""
+
+    def __init__(self, mins, maxs, duration: float):
+        self.mins = mins
+        self.maxs = maxs
+        self.duration = duration
+
+    def to_bytes(self) -> bytes:
+        return (_HEADER.pack(_MAGIC, _VERSION, len(self.mins), self.duration)
+                + self.mins.tobytes() + self.maxs.tobytes())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional["WaveformPeaks"]:
+        if len(data) < _HEADER.size:
+            return None
+        magic, version, columns, duration = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION or len(data) != _HEADER.size + 2 * columns:
+            return None
+        body = np.frombuffer(data, dtype=np.int8, offset=_HEADER.size)
+        return cls(body[:columns], body[columns:], duration)
+
+
+def extract_peaks(file_path: str, columns: int = PEAK_COLUMNS) -> WaveformPeaks:
+    """Stream file_path through ffmpeg and reduce it to a fixed number of min/max columns."""
+    block_mins = []
+    block_maxs = []
+    carry = np.empty(0, dtype=np.int16)
+    total = 0
+    for chunk in iter_pcm(file_path, PEAK_SAMPLE_RATE, 1):
+        samples = chunk[:, 0]
+        total += len(samples)
+        if len(carry):
+            samples = np.concatenate((carry, samples))
+        usable = len(samples) - len(samples) % BLOCK_SAMPLES
+        if usable:
+            blocks = samples[:usable].reshape(-1, BLOCK_SAMPLES)
+            block_mins.append(blocks.min(axis=1))
+            block_maxs.append(blocks.max(axis=1))
+        carry = samples[usable:]
+    if len(carry):
+        block_mins.append(carry.min(keepdims=True))
+        block_maxs.append(carry.max(keepdims=True))
+
+    if not block_mins:
+        empty = np.zeros(columns, dtype=np.int8)
+        return WaveformPeaks(empty, empty.copy(), 0.0)
+    mins = np.concatenate(block_mins)
+    maxs = np.concatenate(block_maxs)
+    if len(mins) >= columns:
+        edges = np.linspace(0, len(mins), columns + 1).astype(np.int64)[:-1]
+        mins = np.minimum.reduceat(mins, edges)
+        maxs = np.maximum.reduceat(maxs, edges)
+    else:
+        index = np.arange(columns) * len(mins) // columns
+        mins = mins[index]
+        maxs = maxs[index]
+    # int16 -> int8 keeps the overview at 2 bytes per column
+    return WaveformPeaks((mins >> 8).astype(np.int8), (maxs >> 8).astype(np.int8),
+                         total / PEAK_SAMPLE_RATE)
+
+
+class WaveformPeakStore:
+    """Peaks for prelisten, extracted on a worker pool and cached on disk.
+
+    Each track's peaks live in one small file named after a hash of its
+    path, size and mtime, so an edited file gets fresh peaks and repeat opens
+    are a single small read.
+    """
+
+    def __init__(self, cache_dir: str = PEAK_CACHE_DIR, max_workers: int = 2):
+        self.cache_dir = cache_dir
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="waveform")
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        return numpy_available()
+
+    def _cache_file(self, file_path: str) -> Optional[str]:
+        signature = file_signature(file_path)
+        if signature is None:
+            return None
+        size, mtime_ns = signature
+        key = f"{file_path}|{size}|{mtime_ns}".encode("utf-8", "surrogatepass")
+        return os.path.join(self.cache_dir, hashlib.sha1(key).hexdigest() + ".peaks")
+
+    def get_cached(self, file_path: str) -> Optional[WaveformPeaks]:
+        """Peaks from the disk cache, or None if they haven't been extracted for this version of the file."""
+        if not numpy_available():
+            return None
+        cache_file = self._cache_file(file_path)
+        if cache_file is None:
+            return None
+        try:
+            with open(cache_file, "rb") as f:
+                return WaveformPeaks.from_bytes(f.read())
+        except OSError:
+            return None
+
+    def request(self, file_path: str, on_done: Callable[[Optional[WaveformPeaks]], None],
+                decode_path: Optional[str] = None):
+        """Extract peaks in the background and call on_done(peaks or None) from the worker thread.
+
+        decode_path lets the caller decode a local copy of the same file; the
+        cache is still keyed by file_path.
+        """
+        if not numpy_available():
+            on_done(None)
+            return
+        with self._lock:
+            waiters = self._in_flight.get(file_path)
+            if waiters is not None:
+                waiters.append(on_done)
+                return
+            self._in_flight[file_path] = [on_done]
+        self._executor.submit(self._extract, file_path, decode_path or file_path)
+
+    def _extract(self, file_path: str, decode_path: str):
+        peaks = None
+        try:
+            peaks = self.get_cached(file_path) or self._extract_and_store(file_path, decode_path)
+        except Exception as e:
+            print(f"Could not extract waveform for {file_path}: {e}")
+        with self._lock:
+            waiters = self._in_flight.pop(file_path, [])
+        for on_done in waiters:
+            try:
+                on_done(peaks)
+            except Exception as e:
+                print(f"Error in waveform callback for {file_path}: {e}")
+
+    def _extract_and_store(self, file_path: str, decode_path: str) -> WaveformPeaks:
+        cache_file = self._cache_file(file_path)
+        peaks = extract_peaks(decode_path)
+        if cache_file is not None:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                partial = cache_file + ".part"
+                with open(partial, "wb") as f:
+                    f.write(peaks.to_bytes())
+                os.replace(partial, cache_file)
+            except OSError as e:
+                print(f"Could not cache waveform for {file_path}: {e}")
+        return peaks
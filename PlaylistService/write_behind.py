@@ -0,0 +1,129 @@
+import hashlib
+import os
+import stat
+import tempfile
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+
+def atomic_write(file_path: str, data: bytes):
+    """Write data to file_path so readers only ever see the old or the new file.
+
+    The data goes to a temp file in the same directory (same share/volume),
+    is flushed to disk, and then replaces the target with os.replace.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates owner-only files; keep the target's permissions instead
+        try:
+            mode = stat.S_IMODE(os.stat(file_path).st_mode)
+        except OSError:
+            mode = 0o644
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class WriteBehindWriter:
+    """Background writer that saves files off the Tk thread.
+
+    Writes are coalesced per path: if a path is submitted again before the
+    writer got to it, only the newest content is written. Content whose hash
+    matches what is already on disk is not written at all.
+    """
+
+    def __init__(self, name: str = "write-behind"):
+        self._name = name
+        self._condition = threading.Condition()
+        self._pending: Dict[str, Tuple[object, Optional[Callable[[bool], None]]]] = {}
+        self._busy = False
+        # path -> (content hash, size, mtime_ns) of the last file we wrote or verified
+        self._known: Dict[str, Tuple[str, int, int]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, file_path: str, data, on_done: Optional[Callable[[bool], None]] = None):
+        """Queue data to be written to file_path. on_done(success) runs on the writer thread.
+
+        data is bytes, or a callable returning bytes (or None to skip) that is
+        evaluated on the writer thread just before writing.
+        """
+        with self._condition:
+            self._pending[file_path] = (data, on_done)
+            self._ensure_thread()
+            self._condition.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued write has finished. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                file_path = next(iter(self._pending))
+                data, on_done = self._pending.pop(file_path)
+                self._busy = True
+            try:
+                if callable(data):
+                    try:
+                        data = data()
+                    except Exception as e:
+                        print(f"Failed to prepare {file_path}: {e}")
+                        data = None
+                success = self._write(file_path, data) if data is not None else False
+                if on_done:
+                    try:
+                        on_done(success)
+                    except Exception as e:
+                        print(f"Error in write callback for {file_path}: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _write(self, file_path: str, data: bytes) -> bool:
+        digest = hashlib.sha1(data).hexdigest()
+        try:
+            if self._is_unchanged(file_path, digest, len(data)):
+                return True
+            atomic_write(file_path, data)
+            info = os.stat(file_path)
+            self._known[file_path] = (digest, info.st_size, info.st_mtime_ns)
+            return True
+        except Exception as e:
+            print(f"Failed to write {file_path}: {e}")
+            return False
+
+    def _is_unchanged(self, file_path: str, digest: str, size: int) -> bool:
+        """True when the file on disk already holds content with this hash."""
+        try:
+            info = os.stat(file_path)
+        except OSError:
+            return False
+        if info.st_size != size:
+            return False
+        known = self._known.get(file_path)
+        if known is not None and known[1:] == (info.st_size, info.st_mtime_ns):
+            # Untouched since we last wrote/verified it
+            return known[0] == digest
+        # First save this session (or changed externally): compare with the real contents
+        with open(file_path, "rb") as f:
+            on_disk = hashlib.sha1(f.read()).hexdigest()
+        self._known[file_path] = (on_disk, info.st_size, info.st_mtime_ns)
+        return on_disk == digest
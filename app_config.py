@@ -2,16 +2,26 @@
 Loads ``config.json`` once and provides helper accessors.
 The config can be reloaded at runtime via ``reload_config`` (e.g. when
 SettingsDialog saves new values).
+
+This module is the only place that reads or writes ``config.json``. Every
+change bumps ``version()`` and notifies ``subscribe``rs with the set of
+top-level sections that changed, so consumers cache what they need and
+react to changes instead of re-reading the file or polling values.
 """
 from __future__ import annotations
 
+import copy
 import json
 import os
+import logging
 import threading
-from typing import Any, List
+from typing import Any, Callable, Iterable, List
 
 _CONFIG_LOCK = threading.Lock()
 _CONFIG_DATA: dict | None = None
+_VERSION = 0
+# (callback, sections or None for every change)
+_SUBSCRIBERS: list[tuple[Callable[[set], None], frozenset | None]] = []
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.json")
 
 
@@ -30,11 +40,67 @@ def _ensure_loaded() -> None:
                 _CONFIG_DATA = _load_from_disk()
 
 
+def _changed_sections(old: dict | None, new: dict) -> set:
+    old = old or {}
+    return {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+
+
+def _replace(data: dict) -> None:
+    """Swap in *data* as the cached config and notify subscribers of what changed."""
+    global _CONFIG_DATA, _VERSION
+    with _CONFIG_LOCK:
+        changed = _changed_sections(_CONFIG_DATA, data)
+        _CONFIG_DATA = data
+        if changed:
+            _VERSION += 1
+    if changed:
+        _notify(changed)
+
+
+def _notify(changed: set) -> None:
+    for callback, sections in list(_SUBSCRIBERS):
+        if sections is not None and not (sections & changed):
+            continue
+        try:
+            callback(changed)
+        except Exception:  # noqa: broad-except
+            logging.exception("app_config: subscriber %r failed", callback)
+
+
+def version() -> int:
+    """Counter bumped on every change; lets consumers cheaply tell if their cached values are stale."""
+    _ensure_loaded()
+    return _VERSION
+
+
+def subscribe(callback: Callable[[set], None], sections: Iterable[str] | None = None) -> Callable[[], None]:
+    """Call *callback(changed_sections)* whenever the config changes.
+
+    With *sections* (top-level keys such as ``"fonts"``) the callback only runs
+    when one of those sections changed. Callbacks run on the thread that made
+    the change (the Tk thread for SettingsDialog). Returns an unsubscribe function.
+    """
+    entry = (callback, frozenset(sections) if sections is not None else None)
+    _SUBSCRIBERS.append(entry)
+
+    def unsubscribe() -> None:
+        try:
+            _SUBSCRIBERS.remove(entry)
+        except ValueError:
+            pass
+    return unsubscribe
+
+
 def reload_config() -> None:
     """Force reload configuration from disk."""
-    global _CONFIG_DATA
-    with _CONFIG_LOCK:
-        _CONFIG_DATA = _load_from_disk()
+    _replace(_load_from_disk())
+
+
+def save_config(data: dict) -> None:
+    """Write *data* to ``config.json`` and make it the active configuration."""
+    with open(CONFIG_PATH, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=4)
+    _replace(copy.deepcopy(data))
 
 
 def get(path: List[str] | tuple[str, ...], default: Any = None) -> Any:
@@ -50,11 +116,17 @@ def get(path: List[str] | tuple[str, ...], default: Any = None) -> Any:
 
 def set_value(path: List[str] | tuple[str, ...], value: Any) -> None:
     """Update in-memory config; caller must save to disk separately if needed."""
+    global _VERSION
     _ensure_loaded()
-    node = _CONFIG_DATA  # type: ignore[assignment]
-    for key in path[:-1]:
-        node = node.setdefault(key, {})
-    node[path[-1]] = value
+    with _CONFIG_LOCK:
+        node = _CONFIG_DATA  # type: ignore[assignment]
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        if path[-1] in node and node[path[-1]] == value:
+            return
+        node[path[-1]] = value
+        _VERSION += 1
+    _notify({path[0]})
 
 
 def get_config() -> dict:
@@ -0,0 +1,98 @@
+"""Benchmark MP3 conversion: streaming ffmpeg path vs the old pydub-first path.
+
+Usage: python benchmarks/bench_audio_converter.py [seconds ...]
+
+Generates a stereo 44.1 kHz 16-bit WAV for each duration (default 600 and
+10800, i.e. 10 minutes and 3 hours; the 3-hour file is about 1.9 GB) and
+converts it with each path in a fresh child process, reporting wall time and
+peak RSS. Peak RSS is the larger of the Python process and the ffmpeg
+processes it ran. Needs ffmpeg on PATH, plus pydub and mutagen.
+"""
+import json
+import math
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SAMPLE_RATE = 44100
+
+
+def write_wav(path, seconds):
+    """Write a 440 Hz tone, one second at a time so generating it stays small."""
+    one_second = b"".join(
+        struct.pack("<hh", sample, sample)
+        for sample in (int(8000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)) for i in range(SAMPLE_RATE))
+    )
+    with wave.open(path, "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        for _ in range(seconds):
+            f.writeframes(one_second)
+
+
+def peak_rss_mb():
+    """Peak RSS of this process and of its finished children, in MB."""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / 1e6  # Windows only
+        except Exception:
+            return float("nan")
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KB elsewhere
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return max(own, children) / 1e6
+
+
+def run_child(method, wav_path):
+    """Runs in the child process: convert once and print the measurements as JSON."""
+    from audio_converter import AudioConverter
+    convert = {"ffmpeg": AudioConverter.convert_with_ffmpeg, "pydub": AudioConverter.convert_with_pydub}[method]
+    start = time.perf_counter()
+    output = convert(wav_path, delete_original=False)
+    elapsed = time.perf_counter() - start
+    if output and output != wav_path:
+        os.remove(output)
+    print(json.dumps({"ok": bool(output), "seconds": elapsed, "peak_rss_mb": peak_rss_mb()}))
+
+
+def measure(method, wav_path):
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", method, wav_path],
+                            capture_output=True, text=True)
+    try:
+        return json.loads(result.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return {"ok": False, "seconds": float("nan"), "peak_rss_mb": float("nan"), "error": result.stderr[-500:]}
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3])
+        return
+
+    durations = [int(arg) for arg in sys.argv[1:]] or [600, 10800]
+    with tempfile.TemporaryDirectory() as tmp:
+        for seconds in durations:
+            wav_path = os.path.join(tmp, f"tone_{seconds}s.wav")
+            write_wav(wav_path, seconds)
+            size_mb = os.path.getsize(wav_path) / 1e6
+            print(f"{seconds // 60} min input ({size_mb:.0f} MB WAV)")
+            for method in ("ffmpeg", "pydub"):
+                stats = measure(method, wav_path)
+                status = "" if stats["ok"] else "  FAILED"
+                print(f"  {method:7s} wall {stats['seconds']:8.2f} s   peak RSS {stats['peak_rss_mb']:8.1f} MB{status}")
+            os.remove(wav_path)
+
+
+if __name__ == "__main__":
+    main()
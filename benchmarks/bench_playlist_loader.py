@@ -0,0 +1,94 @@
+"""Benchmark the streaming playlist loader against the old readlines() loader.
+
+Usage: python benchmarks/bench_playlist_loader.py [entries]
+
+Generates an M3U8 file with the given number of entries (default 100000)
+and reports time-to-first-chunk, total load time and peak traced memory.
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.playlist import Playlist
+from models.track import Track
+from PlaylistService import playlist_file_loader
+
+
+def write_playlist(path, entries):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("#EXTM3U\n")
+        for i in range(entries):
+            f.write(f"#EXTINF:{180 + i % 120},Artist {i % 500} - Title {i}\n")
+            f.write(f"\\\\server\\music\\Artist {i % 500}\\Title {i}.mp3\n")
+
+
+def readlines_loader(file_path):
+    """The loader as it was before streaming (readlines + add_track per line)."""
+    playlist = Playlist()
+    playlist.path = file_path
+    with open(file_path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    current_title = None
+    current_duration = None
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#') and not line.startswith('#EXTINF'):
+            continue
+        if line.startswith('#EXTINF:'):
+            try:
+                duration, title = line[8:].split(',', 1)
+                current_duration = int(duration)
+                current_title = title
+            except ValueError:
+                current_duration = None
+                current_title = None
+        else:
+            playlist.add_track(Track(path=line, title=current_title, duration=current_duration), len(playlist.tracks))
+            current_title = None
+            current_duration = None
+    return playlist
+
+
+def streaming_loader(path, mark):
+    """load_playlist's loop, marking when the first chunk of rows is available."""
+    playlist = Playlist()
+    playlist.path = path
+    for chunk in playlist_file_loader.iter_playlist_tracks(path):
+        playlist.tracks.extend(chunk)
+        mark()
+    return playlist
+
+
+def measure(name, load):
+    first = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    playlist = load(lambda: first.append(time.perf_counter()) if not first else None)
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    first_row = (first[0] - start) if first else total
+    print(f"{name:<12} tracks={len(playlist.tracks):>7}  first row={first_row * 1000:8.1f} ms  "
+          f"total={total * 1000:8.1f} ms  peak={peak / 1024 / 1024:7.1f} MiB")
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    fd, path = tempfile.mkstemp(suffix=".m3u8")
+    os.close(fd)
+    try:
+        write_playlist(path, entries)
+        print(f"{entries} entries, {os.path.getsize(path) / 1024 / 1024:.1f} MiB")
+        # The old loader only has rows once the whole file is parsed
+        measure("readlines", lambda mark: (lambda p: (mark(), p)[1])(readlines_loader(path)))
+        measure("streaming", lambda mark: streaming_loader(path, mark))
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
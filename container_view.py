@@ -21,6 +21,7 @@ class ContainerView(Frame):
         self._station_callbacks = {}  # source_id -> callback
         self._station_labels = {}     # source_id -> label widget
         self._station_order = []      # ordered list of source_ids
+        self._station_states = {}     # source_id -> (display_text, clickable) last applied to the label
         
         # Container for station labels
         self._stations_container = tk.Frame(self.currently_playing_frame, bg="#d4edda")
@@ -117,10 +118,18 @@ class ContainerView(Frame):
             display_text = f"[{source_name}] {text}"
         else:
             display_text = text
+
+        clickable = bool(clickable and on_click)
+        state = (display_text, clickable)
+        if self._station_states.get(source_id) == state:
+            # Label already shows this; only the click target may need refreshing
+            self._station_callbacks[source_id] = on_click if clickable else None
+            return
+        self._station_states[source_id] = state
             
         label.config(text=display_text)
 
-        if clickable and on_click:
+        if clickable:
             self._station_callbacks[source_id] = on_click
             label.config(cursor="hand2", fg="#0f5132")
         else:
@@ -156,6 +165,7 @@ class ContainerView(Frame):
             del self._station_labels[source_id]
         if source_id in self._station_callbacks:
             del self._station_callbacks[source_id]
+        self._station_states.pop(source_id, None)
         if source_id in self._station_order:
             self._station_order.remove(source_id)
         
@@ -181,4 +191,6 @@ class ContainerView(Frame):
         # Update all station labels
         for label in self._station_labels.values():
             label.config(bg=bg_color, fg=fg_color)
+        # Colors were reset, so the next update must reapply label state
+        self._station_states.clear()
 
@@ -7,17 +7,25 @@ from models.track import Track
 from typing import List
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from PlaylistService.track_utils import TrackUtils
+from PlaylistService.schedule_analysis import ScheduleAnalysis
 from playlist_notebook_view import PlaylistTabView
 import asyncio
 from test import Test
 import re
 from metadata_edit_dialog import MetadataEditDialog
 from calculate_start_times_dialog import CalculateStartTimesDialog
-from audio_converter import AudioConverter
+from conversion_jobs import ConversionJob, ConversionJobManager, ConversionJobsWindow
+from silence_report_window import SilenceReportWindow
 import shutil
 import app_config
 import logging
+import ui_dispatcher
+import file_readiness
+import utils
+from PlaylistService.exact_duration import needs_verification
+from PlaylistService.library_index import library_roots
 
 
 class WideAskStringDialog(simpledialog.Dialog):
@@ -43,6 +51,10 @@ class WideAskStringDialog(simpledialog.Dialog):
 
 
 class ControllerActions():
+    # Playlist files parsed at once when restoring a profile (mostly waiting on G:)
+    PLAYLIST_LOAD_WORKERS = 8
+    # Idle gap before the next background tab of a restored profile gets its rows and metadata
+    BACKGROUND_ATTACH_DELAY_MS = 1500
 
     def __init__(self, controller):
         self.controller = controller
@@ -63,6 +75,19 @@ class ControllerActions():
         }
         self.clipboard = []
         self.dialog_open = False
+        # Lazy tab loading: playlists being attached, the pool parsing them, parse
+        # futures by id(playlist) not yet attached, and the background attach timer
+        self._materializing = set()
+        self._load_pool = ThreadPoolExecutor(max_workers=self.PLAYLIST_LOAD_WORKERS,
+                                             thread_name_prefix="playlist-load")
+        self._parsed = {}
+        self._background_attach_job = None
+        # Background MP3 conversions (created on first use) and their progress window
+        self._conversion_manager = None
+        self._conversion_window = None
+        self._silence_window = None
+        # (playlist id, column) of the last loudness sort, so a second click reverses it
+        self._last_loudness_sort = None
     def test(self, event=None):
         test = Test(self.controller)
         test.test()
@@ -119,6 +144,7 @@ class ControllerActions():
         if file_path:
             playlist.path = file_path
             self.controller.playlist_service.save_playlist(playlist)
+            self.controller.playlist_service.write_snapshot()
     def save_current_playlist(self, event=None):
         playlist = self.get_selected_tab_playlist()
         print("playlsit.path", playlist.path)        
@@ -126,8 +152,10 @@ class ControllerActions():
             self.save_current_playlist_as()
             return
         self.controller.playlist_service.save_playlist(playlist)
+        self.controller.playlist_service.write_snapshot()
 
     def close_playlist(self, playlist: Playlist):
+        self._parsed.pop(id(playlist), None)
         self.controller.playlist_service.close_playlist(playlist)
         
 
@@ -170,16 +198,130 @@ class ControllerActions():
             # and intros were already checked in toggle_remote_source()
             if tab.playlist.type == Playlist.PlaylistType.API:
                 continue
+            if not tab.playlist.loaded:
+                # Placeholder tab: metadata is fetched when it materializes
+                continue
+            if tab.playlist.from_snapshot:
+                # Metadata came from the snapshot; only re-check what may have changed on disk
+                self.revalidate_snapshot_playlist_for_tab(tab)
+                continue
             self.load_playlist_metadata_for_tab(tab)
 
 
     
-    def load_playlist_metadata_for_tab(self, tab: PlaylistTabView):
+    def _read_placeholder_tracks(self, playlist):
+        """Parse a placeholder's playlist file (runs on the load pool)."""
+        try:
+            return self.controller.playlist_service.read_playlist_tracks(playlist.path)
+        except Exception as e:
+            print(f"Failed to load playlist {playlist.path}: {e}")
+            return None, False
+
+    def _parsed_tracks(self, playlist):
+        """Future of (tracks, from_snapshot) for a placeholder, submitting its parse if not started."""
+        future = self._parsed.get(id(playlist))
+        if future is None:
+            future = self._load_pool.submit(self._read_placeholder_tracks, playlist)
+            self._parsed[id(playlist)] = future
+        return future
+
+    def _attach_placeholder_tracks(self, tab: PlaylistTabView, tracks, from_snapshot, on_done=None):
+        """Build a placeholder tab's rows from parsed tracks, then fetch metadata (on_done after that)."""
+        playlist = tab.playlist
+        self._materializing.discard(id(playlist))
+        self._parsed.pop(id(playlist), None)
+        if tracks is None or playlist.loaded or not tab.winfo_exists():
+            if on_done:
+                on_done()
+            return
+        self.controller.playlist_service.attach_playlist_tracks(playlist, tracks, from_snapshot)
+        tab.reload_rows()
+        if from_snapshot:
+            self.revalidate_snapshot_playlist_for_tab(tab, on_done)
+        else:
+            self.load_playlist_metadata_for_tab(tab, on_done)
+
+    def materialize_tab(self, tab: PlaylistTabView, on_done=None):
+        """Build a placeholder tab's rows once its file is parsed (off the Tk thread), then fetch metadata.
+
+        Uses the result of restore_placeholder_tabs() when that already parsed
+        the file. on_done runs once the tab's metadata pass has finished.
+        """
+        playlist = tab.playlist
+        if playlist.loaded or id(playlist) in self._materializing:
+            return
+        self._materializing.add(id(playlist))
+
+        def finish(future):
+            tracks, from_snapshot = future.result()
+            self._attach_placeholder_tracks(tab, tracks, from_snapshot, on_done)
+
+        # Posted against the root so on_done still runs if the tab was closed meanwhile
+        self._parsed_tracks(playlist).add_done_callback(lambda f: ui_dispatcher.submit(
+            self.controller.root, f"materialize:{id(playlist)}", lambda: finish(f)))
+
+    def restore_placeholder_tabs(self, tabs, selected_tab=None):
+        """Parse every placeholder in tabs concurrently; build rows for the selected one first.
+
+        All files are read at once on the load pool, but parsed tracks are only
+        kept until their tab is needed. The selected tab is attached as soon as
+        its own file is parsed; the others are attached one at a time at low
+        priority once it is done (or earlier, when the user switches to them).
+        """
+        for tab in tabs:
+            if not tab.playlist.loaded:
+                self._parsed_tracks(tab.playlist)
+        if selected_tab is not None and not selected_tab.playlist.loaded:
+            self.materialize_tab(selected_tab, on_done=self.start_background_attach)
+        else:
+            self.start_background_attach()
+
+    def start_background_attach(self):
+        """Attach the remaining placeholder tabs one at a time, each after the previous one's metadata pass."""
+        if self._background_attach_job is not None:
+            return
+        self._background_attach_job = self.controller.root.after(self.BACKGROUND_ATTACH_DELAY_MS,
+                                                                 self._attach_next_background_tab)
+
+    def _attach_next_background_tab(self):
+        self._background_attach_job = None
+        for tab in self.controller.notebook_view.get_tabs():
+            if not tab.playlist.loaded and id(tab.playlist) not in self._materializing:
+                self.materialize_tab(tab, on_done=self.start_background_attach)
+                return
+
+    def load_playlist_metadata_for_tab(self, tab: PlaylistTabView, on_done=None):
         # Create a thread to run the metadata loading asynchronously
-        thread = threading.Thread(target=self._async_load_playlist_metadata, args=(tab, None))
+        thread = threading.Thread(target=self._run_then_notify,
+                                  args=(self._async_load_playlist_metadata, (tab, None), on_done))
         thread.daemon = True  # Thread will exit when main program exits
         thread.start()
  
+    def revalidate_snapshot_playlist_for_tab(self, tab: PlaylistTabView, on_done=None):
+        tab.playlist.from_snapshot = False
+        thread = threading.Thread(target=self._run_then_notify,
+                                  args=(self._async_revalidate_snapshot_playlist, (tab,), on_done))
+        thread.daemon = True
+        thread.start()
+
+    def _run_then_notify(self, work, args, on_done):
+        work(*args)
+        if on_done:
+            ui_dispatcher.submit(self.controller.root, f"metadata-done:{id(args[0])}", on_done)
+
+    def _async_revalidate_snapshot_playlist(self, playlist_tab: PlaylistTabView):
+        """Refresh intro/exists flags for a snapshot-restored playlist, reading tags only where needed."""
+        try:
+            playlist_service = self.controller.playlist_service
+            stale = playlist_service.find_stale_snapshot_tracks(playlist_tab.playlist)
+            if stale:
+                playlist_service.update_track_metadata(stale)
+                # The artist may have changed with the tags
+                playlist_service.check_for_intros_and_exists(tracks=stale)
+            ui_dispatcher.submit(playlist_tab, "reload", lambda pt=playlist_tab: pt.reload_rows(preserve_scroll=True))
+        except Exception as e:
+            print(e)
+
     def _async_load_playlist_metadata(self, playlist_tab: PlaylistTabView = None, playlist: Playlist = None):
         if playlist_tab == None and playlist == None:
             print("No tab or playlist provided")
@@ -190,7 +332,7 @@ class ControllerActions():
             self.controller.playlist_service.update_playlist_metadata(playlist)
             self.controller.playlist_service.check_for_intros_and_exists(playlist)
             if playlist_tab:
-                playlist_tab.after(0, lambda pt=playlist_tab: pt.reload_rows(preserve_scroll=True) if pt.winfo_exists() else None)
+                ui_dispatcher.submit(playlist_tab, "reload", lambda pt=playlist_tab: pt.reload_rows(preserve_scroll=True))
         except Exception as e:
             print(e)
     
@@ -468,55 +610,324 @@ class ControllerActions():
         if not messagebox.askyesno("Convert to MP3", message, parent=self.controller.root):
             return
             
-        # Process each track
-        converted_count = 0
-        failed_count = 0
-        skipped_count = 0
-        current_playlist = self.get_selected_tab_playlist()
-        
-        for track in selected_tracks:
-            # Skip if already MP3
-            file_ext = os.path.splitext(track.path)[1].lower()
-            if file_ext == '.mp3':
-                skipped_count += 1
+        to_convert = [track for track in selected_tracks if os.path.splitext(track.path)[1].lower() != '.mp3']
+        skipped_count = len(selected_tracks) - len(to_convert)
+        if not to_convert:
+            messagebox.showinfo("Convert to MP3", f"{skipped_count} track(s) already in MP3 format.", parent=self.controller.root)
+            return
+
+        # Conversions run in the background; each track is updated as its job finishes
+        manager = self.get_conversion_manager()
+        for track in to_convert:
+            manager.submit(track, on_finished=self._apply_conversion_result)
+        self.show_conversion_jobs()
+
+    def get_conversion_manager(self) -> ConversionJobManager:
+        if self._conversion_manager is None:
+            self._conversion_manager = ConversionJobManager(self.controller.root)
+        return self._conversion_manager
+
+    def show_conversion_jobs(self, event=None):
+        """Open (or raise) the window listing background MP3 conversions."""
+        window = self._conversion_window
+        if window is not None and window.winfo_exists():
+            window.lift()
+            return
+        self._conversion_window = ConversionJobsWindow(self.controller.root, self.get_conversion_manager())
+
+    def cancel_conversions(self):
+        if self._conversion_manager is not None:
+            self._conversion_manager.cancel_all()
+
+    def _apply_conversion_result(self, job: ConversionJob):
+        """Point every row holding the converted file at the MP3, then delete the original (Tk thread).
+
+        Rows are found by path rather than by Track, since a remote playlist's
+        auto-reload may have replaced the Track objects while converting. The
+        original is kept if no open playlist holds it any more.
+        """
+        if job.status != ConversionJob.DONE:
+            return
+        locations = self.controller.track_locations.locate(job.source_path)
+        if not locations:
+            print(f"{job.source_path} is no longer in an open playlist; keeping the original next to {job.result_path}")
+            return
+        try:
+            for tab, rows in locations.items():
+                playlist = tab.playlist
+                tracks = [playlist.tracks[row] for row in rows]
+                for track in tracks:
+                    track.path = job.result_path
+                self.controller.playlist_service.update_track_metadata(tracks)
+                self.check_for_intros_and_if_exists(tracks=tracks)
+                if playlist.type == Playlist.PlaylistType.API:
+                    api_manager = self.controller.playlist_service.get_api_manager_for_playlist(playlist)
+                    if api_manager:
+                        for row, track in zip(rows, tracks):
+                            api_manager.remove_tracks([row + 1])
+                            api_manager.insert_tracks([track], row + 1)
+                tab.reload_rows(preserve_scroll=True)
+        except Exception as e:
+            print(f"Error pointing playlists at {job.result_path}, keeping {job.source_path}: {e}")
+            return
+        self.get_conversion_manager().delete_original(job)
+
+    def detect_silence_in_playlist(self, event=None):
+        """Check every track of the selected playlist for long silences, in the background."""
+        analyzer = self.controller.silence_analyzer
+        if not analyzer.available():
+            messagebox.showinfo("Check for Silence", "Silence detection needs NumPy (pip install numpy).",
+                                parent=self.controller.root)
+            return
+        playlist = self.get_selected_tab_playlist()
+        paths = list(dict.fromkeys(track.path for track in playlist.tracks if track.exists and track.path))
+        if not paths:
+            messagebox.showinfo("Check for Silence", "No tracks to check.", parent=self.controller.root)
+            return
+
+        window = self._silence_window
+        if window is not None and window.winfo_exists():
+            window.close()
+        window = SilenceReportWindow(self.controller.root, playlist.name_for_display(), len(paths), analyzer.cancel)
+        self._silence_window = window
+        root = self.controller.root
+
+        def on_report(path, report):
+            ui_dispatcher.submit(root, f"silence:{path}", lambda: self._apply_silence_report(window, path, report))
+
+        def on_finished(cancelled):
+            ui_dispatcher.submit(root, f"silence-done:{id(window)}", lambda: window.finish(cancelled))
+
+        analyzer.analyze(paths, on_report, on_finished)
+
+    def _apply_silence_report(self, window: SilenceReportWindow, path: str, report):
+        """Flag or unflag every row holding path, in every tab (Tk thread)."""
+        if report is not None:
+            for tab, rows in self.controller.track_locations.locate(path).items():
+                tab.set_rows_tag(rows, "dead_air", report.flagged)
+        window.add_result(path, report)
+
+    def scan_playlist_loudness(self, event=None):
+        """Measure LUFS and true peak for every track of the selected playlist, in the background.
+
+        Values fill in the LUFS/Peak columns as they arrive; unchanged files
+        come straight from the loudness cache.
+        """
+        analyzer = self.controller.loudness_analyzer
+        if not analyzer.available():
+            messagebox.showinfo("Scan Loudness", "Loudness scanning needs NumPy (pip install numpy).",
+                                parent=self.controller.root)
+            return
+        playlist = self.get_selected_tab_playlist()
+        paths = [track.path for track in playlist.tracks if track.exists and track.path]
+        if not paths:
+            messagebox.showinfo("Scan Loudness", "No tracks to scan.", parent=self.controller.root)
+            return
+        root = self.controller.root
+
+        def on_report(path, report):
+            if report is not None:
+                ui_dispatcher.submit(root, f"loudness:{path}", lambda: self._apply_loudness_report(path, report))
+
+        def on_finished(cancelled):
+            if not cancelled:
+                print(f"Loudness scan finished for {playlist.name_for_display()}")
+
+        analyzer.analyze(paths, on_report, on_finished)
+
+    def _apply_loudness_report(self, path: str, report):
+        """Fill in the loudness cells of every row holding path, in every tab (Tk thread)."""
+        for tab, rows in self.controller.track_locations.locate(path).items():
+            tab.set_rows_value(rows, "LUFS", report.lufs_text())
+            tab.set_rows_value(rows, "Peak", report.peak_text())
+
+    def sort_playlist_by_loudness(self, column: str):
+        """Reorder the selected playlist by LUFS or true peak, loudest first; clicking again reverses.
+
+        Tracks that haven't been scanned keep their relative order at the end.
+        """
+        playlist = self.get_selected_tab_playlist()
+        if playlist.type == Playlist.PlaylistType.API:
+            messagebox.showinfo("Sort", "Remote playlists can't be sorted here.", parent=self.controller.root)
+            return
+        analyzer = self.controller.loudness_analyzer
+        attribute = "integrated_lufs" if column == "LUFS" else "true_peak_dbtp"
+        scanned = []
+        unscanned = []
+        for track in playlist.tracks:
+            report = analyzer.get_report(track.path)
+            if report is None:
+                unscanned.append(track)
+            else:
+                value = getattr(report, attribute)
+                scanned.append((float("-inf") if value is None else value, track))
+        if not scanned:
+            messagebox.showinfo("Sort", "Scan the playlist's loudness first (right-click > Scan Playlist Loudness).",
+                                parent=self.controller.root)
+            return
+        sort_key = (id(playlist), column)
+        descending = self._last_loudness_sort != sort_key
+        if not messagebox.askyesno("Sort", f"Reorder this playlist by {column}, "
+                                   f"{'loudest' if descending else 'quietest'} first?", parent=self.controller.root):
+            return
+        self._last_loudness_sort = sort_key if descending else None
+        scanned.sort(key=lambda item: item[0], reverse=descending)
+        playlist.tracks[:] = [track for _, track in scanned] + unscanned
+        self.reload_rows_in_selected_tab_without_intro_check()
+
+    def verify_exact_durations(self, event=None):
+        """Replace estimated durations in the selected playlist with exact decoded ones, in the background.
+
+        Duration cells update as results arrive; start times are recalculated
+        once at the end. Remote playlists keep the server's durations.
+        """
+        playlist = self.get_selected_tab_playlist()
+        if playlist.type == Playlist.PlaylistType.API:
+            messagebox.showinfo("Verify Durations", "Remote playlists use the server's durations.",
+                                parent=self.controller.root)
+            return
+        paths = [track.path for track in playlist.tracks
+                 if track.exists and track.path and needs_verification(track.path, track.duration)]
+        if not paths:
+            messagebox.showinfo("Verify Durations", "No durations need verifying.", parent=self.controller.root)
+            return
+        root = self.controller.root
+        corrections = []
+
+        def on_report(path, report):
+            if report is not None:
+                ui_dispatcher.submit(root, f"duration:{path}",
+                                     lambda: corrections.extend(self._apply_exact_duration(path, report.seconds)))
+
+        def on_finished(cancelled):
+            ui_dispatcher.submit(root, f"duration-done:{id(corrections)}",
+                                 lambda: self._finish_duration_verification(len(paths), corrections, cancelled))
+
+        analyzer = self.controller.duration_analyzer
+        analyzer.analyze(paths, on_report, on_finished)
+
+    def _apply_exact_duration(self, path: str, seconds: float) -> list:
+        """Set the exact duration on every local-playlist track at path (Tk thread).
+
+        Returns the differences (exact - estimate) for tracks that changed.
+        """
+        differences = []
+        for tab, rows in self.controller.track_locations.locate(path).items():
+            if tab.playlist.type == Playlist.PlaylistType.API:
                 continue
-                
-            # Get track index for updating Remote Playlist if needed
-            track_index = current_playlist.tracks.index(track)
+            for row in rows:
+                track = tab.playlist.tracks[row]
+                if track.duration is None or abs(track.duration - seconds) >= 0.01:
+                    differences.append(seconds - (track.duration or 0.0))
+                    track.duration = seconds
+            tab.set_rows_value(rows, "Duration", utils.format_duration(seconds))
+        return differences
+
+    def _finish_duration_verification(self, checked: int, corrections: list, cancelled: bool):
+        if corrections:
+            # Start times depend on every duration before them
+            for tab in self.controller.notebook_view.get_tabs():
+                if tab.playlist.type != Playlist.PlaylistType.API and tab.playlist.loaded:
+                    tab.reload_rows(preserve_scroll=True)
+        if cancelled:
+            message = f"Verification stopped: {len(corrections)} duration(s) corrected so far"
+        else:
+            message = f"Checked {checked} track(s): {len(corrections)} duration(s) corrected"
+        if corrections:
+            largest = max(corrections, key=abs)
+            message += f" (largest change {largest:+.2f} s, total {sum(corrections):+.2f} s)"
+        messagebox.showinfo("Verify Durations", message + ".", parent=self.controller.root)
+
+    def relink_missing_tracks(self, event=None, retried: bool = False):
+        """Point every missing track of the selected playlist at its new location, from the library index.
+
+        Tracks are matched by content hash (or a unique file name) with one
+        index lookup each. If some can't be found, offers to update the index
+        and try once more.
+        """
+        root = self.controller.root
+        tab = self.get_selected_tab()
+        playlist = tab.playlist
+        missing = [track for track in playlist.tracks if not track.exists and track.path]
+        if not missing:
+            if not retried:
+                messagebox.showinfo("Relink Missing Tracks", "No missing tracks in this playlist.", parent=root)
+            return
+        if not library_roots():
+            messagebox.showinfo("Relink Missing Tracks",
+                                "Add your music folders under Settings > Paths > Library Folders first.", parent=root)
+            return
 
-            # Convert the file
-            try:
-                converted_path = AudioConverter.convert_to_mp3(track.path, delete_original=True)
-                if converted_path and os.path.exists(converted_path):
-                    # Update track path
-                    track.path = converted_path
-                    # Update metadata
-                    self.controller.playlist_service.update_track_metadata([track])
-                    # Check for intros
-                    self.check_for_intros_and_if_exists(tracks=[track])
-                    # Update Remote Playlist if needed
-                    if current_playlist.type == Playlist.PlaylistType.API:
-                        self.remove_and_reinsert_track(track, track_index)
-                    converted_count += 1
-                else:
-                    failed_count += 1
-            except Exception as e:
-                print(f"Error converting track to MP3: {str(e)}")
-                failed_count += 1
-        
-        # Reload the playlist view
+        library_index = self.controller.library_index
+        matches = library_index.find_moved(list(dict.fromkeys(track.path for track in missing)))
+        relinked = 0
+        for track in missing:
+            match = matches.get(track.path)
+            if match and os.path.exists(match[0]):
+                self._relink_track(playlist, track, match[0])
+                relinked += 1
+        if relinked:
+            for open_tab in self.controller.notebook_view.get_tabs():
+                if open_tab.playlist is playlist:
+                    open_tab.reload_rows(preserve_scroll=True)
+
+        unresolved = len(missing) - relinked
+        if unresolved and not retried and not library_index.refreshing:
+            if messagebox.askyesno("Relink Missing Tracks",
+                                   f"Relinked {relinked} track(s). {unresolved} could not be found in the library "
+                                   "index.\n\nUpdate the index now and try again? This runs in the background.",
+                                   parent=root):
+                library_index.refresh_async(on_finished=lambda stats: ui_dispatcher.submit(
+                    root, "library-relink", lambda: self._retry_relink(tab)))
+            return
+        messagebox.showinfo("Relink Missing Tracks",
+                            f"Relinked {relinked} track(s)." + (f" {unresolved} still missing." if unresolved else ""),
+                            parent=root)
+
+    def _retry_relink(self, tab: PlaylistTabView):
+        if tab in self.controller.notebook_view.get_tabs():
+            self.controller.notebook_view.notebook.select(str(tab))
+            self.relink_missing_tracks(retried=True)
+
+    def _relink_track(self, playlist: Playlist, track: Track, new_path: str):
+        """Move one track to new_path, refreshing its metadata and the remote copy if needed."""
+        print(f"Relinking {track.path} -> {new_path}")
+        track.path = new_path
+        self.controller.playlist_service.update_track_metadata([track])
+        self.check_for_intros_and_if_exists(tracks=[track])
+        if playlist.type == Playlist.PlaylistType.API:
+            track_index = playlist.tracks.index(track)
+            api_manager = self.controller.playlist_service.get_api_manager_for_playlist(playlist)
+            if api_manager:
+                api_manager.remove_tracks([track_index + 1])
+                api_manager.insert_tracks([track], track_index + 1)
+
+    def add_library_tracks(self, entries):
+        """Insert library search results after the selected rows (or at the end) of the selected playlist.
+
+        Tracks are built from the library index (path, artist, title,
+        duration), so nothing is read from disk while inserting.
+        """
+        tab = self.get_selected_tab()
+        playlist = tab.playlist
+        tracks = []
+        for entry in entries:
+            track = Track(entry.path, entry.artist, entry.title, entry.duration)
+            track.metadata = {'artist': entry.artist, 'title': entry.title, 'duration': entry.duration or 0}
+            tracks.append(track)
+        selected_indexes = self.controller.get_selected_rows()[1]
+        insert_index = selected_indexes[-1] + 1 if selected_indexes else len(playlist.tracks)
+        playlist.add_tracks(tracks, insert_index)
         self.reload_rows_in_selected_tab_without_intro_check()
-        
-        # Show results
-        result_message = f"Conversion complete:\n"
-        if converted_count > 0:
-            result_message += f"- {converted_count} track(s) converted successfully\n"
-        if skipped_count > 0:
-            result_message += f"- {skipped_count} track(s) already in MP3 format\n"
-        if failed_count > 0:
-            result_message += f"- {failed_count} track(s) failed to convert\n"
-            
-        messagebox.showinfo("Convert to MP3", result_message, parent=self.controller.root)
+        if playlist.type == Playlist.PlaylistType.API:
+            manager = self.controller.playlist_service.get_api_manager_for_playlist(playlist)
+            if manager:
+                manager.insert_tracks(tracks, insert_index + 1)
+        # Select what was inserted, so the next pick lands after it
+        items = tab.tree.get_children()[insert_index:insert_index + len(tracks)]
+        tab.tree.selection_set(items)
+        if items:
+            tab.tree.see(items[-1])
 
     def reload_api_playlist_action(self, event=None):
         """Reload the currently selected Remote Playlist while preserving scroll position."""
@@ -714,6 +1125,48 @@ class ControllerActions():
             messagebox.showerror("Error", "Please select only one track")
         self.dialog_open = False
 
+    def show_schedule_summary(self, event=None):
+        """Show runtime, time-to-air for the selection and top-of-hour crossings."""
+        playlist = self.get_selected_tab_playlist()
+        if not playlist.tracks:
+            messagebox.showinfo("Schedule Summary", "Playlist is empty")
+            return
+        analysis = ScheduleAnalysis(playlist, self.controller.playlist_service.get_start_time_engine(playlist))
+        lines = [
+            f"Tracks: {analysis.row_count}",
+            f"Total runtime: {utils.format_duration(analysis.total_runtime)}",
+        ]
+
+        selected = sorted(self.get_selected_row_indexes())
+        if selected:
+            first, last = selected[0], selected[-1]
+            lines.append(f"Rows {first + 1}-{last + 1} runtime: {utils.format_duration(analysis.duration_between(first, last))}")
+
+        if analysis.is_timed:
+            lines.append(f"Starts: {utils.format_play_time(analysis.start_time(0))}")
+            lines.append(f"Ends: {utils.format_play_time((analysis.start_time(0) + analysis.total_runtime) % 604800)}")
+            if selected:
+                until = analysis.time_until_row(selected[0])
+                lines.append(f"Row {selected[0] + 1} airs in: {utils.format_duration(until)}")
+                remaining = analysis.fits_before_boundary(selected[0], selected[-1])
+                if remaining >= 0:
+                    lines.append(f"Selection ends {utils.format_duration(remaining)} before the top of the hour")
+                else:
+                    lines.append(f"Selection overruns the top of the hour by {utils.format_duration(-remaining)}")
+
+            crossings = analysis.hour_crossings()
+            lines.append("")
+            lines.append(f"Tracks crossing the top of the hour: {len(crossings)}")
+            for row, boundary, into in crossings[:15]:
+                track = playlist.tracks[row]
+                lines.append(f"  {utils.format_play_time(boundary)}  row {row + 1}: {track.artist} - {track.title} (+{utils.format_duration(into)})")
+            if len(crossings) > 15:
+                lines.append(f"  ... and {len(crossings) - 15} more")
+        else:
+            lines.append("No start times set (use Calculate Start Times)")
+
+        messagebox.showinfo("Schedule Summary", "\n".join(lines))
+
     def _show_waiting_feedback(self, message="Waiting for file to finish writing..."):
         """Show non-modal waiting feedback."""
         self.controller.root.config(cursor="watch")
@@ -736,28 +1189,6 @@ class ControllerActions():
             self._waiting_label.destroy()
             self._waiting_label = None
 
-    def _wait_for_file_stable(self, file_path, on_stable_callback, last_size=None, stable_count=0):
-        """Wait for file to stop growing before proceeding."""
-        try:
-            current_size = os.path.getsize(file_path)
-        except OSError:
-            # File disappeared or inaccessible
-            self._hide_waiting_feedback()
-            return
-
-        if last_size is not None and current_size == last_size:
-            stable_count += 1
-            if stable_count >= 2:  # Stable for 1 second (2 x 500ms)
-                self._hide_waiting_feedback()
-                on_stable_callback()
-                return
-        else:
-            stable_count = 0  # Reset if size changed
-
-        # Schedule next check
-        self.controller.root.after(500, lambda: self._wait_for_file_stable(
-            file_path, on_stable_callback, current_size, stable_count))
-
     def replace_from_macro_output_action(self, event=None):
         selected_tracks = self.get_selected_tracks()
         if not selected_tracks:
@@ -796,15 +1227,21 @@ class ControllerActions():
 
         source_file_path = os.path.join(macro_output_dir, found_file_in_macro)
 
-        # Start file stability check before proceeding
-        def do_replacement():
+        # Wait until the macro has finished writing the file before moving it
+        def do_replacement(ready):
+            self._hide_waiting_feedback()
+            if not ready:
+                if os.path.exists(source_file_path):
+                    messagebox.showerror("Error", f"'{found_file_in_macro}' is still being written. Try again once the macro has finished.",
+                                         parent=self.controller.root)
+                return
             self._do_replace_from_macro_output(
                 source_file_path, track, track_dir, found_file_in_macro,
                 current_playlist, track_index
             )
 
         self._show_waiting_feedback()
-        self._wait_for_file_stable(source_file_path, do_replacement)
+        file_readiness.when_ready(self.controller.root, source_file_path, do_replacement, timeout=120.0)
 
     def _do_replace_from_macro_output(self, source_file_path, track, track_dir, found_file_in_macro, current_playlist, track_index):
         """Perform the actual file replacement after stability check."""
@@ -831,12 +1268,35 @@ class ControllerActions():
             # (e.g., different extension), and the original file still exists, remove the original file.
             # Use os.path.normcase for case-insensitive comparison on Windows (where .mp3 and .MP3 are the same file)
             # Only delete if we're 100% sure the new file is in place
-            if os.path.normcase(destination_path) != os.path.normcase(original_track_path_before_move) and os.path.exists(original_track_path_before_move):
-                # Final safety check: destination must exist before we delete anything
-                if os.path.exists(destination_path):
-                    os.remove(original_track_path_before_move)
+            tab = self.get_selected_tab()
+
+            def finish(removed):
+                self._finish_replace_from_macro_output(
+                    removed, tab, track, original_track_path_before_move, destination_path, found_file_in_macro,
+                    macro_output_dir, current_playlist, track_index)
+
+            if os.path.normcase(destination_path) == os.path.normcase(original_track_path_before_move) \
+                    or not os.path.exists(original_track_path_before_move):
+                finish(True)
+                return
+
+            def delete_original():
+                # May wait (up to 10 s) for prelisten or playout to let go of the file, so not on the Tk thread
+                removed = file_readiness.remove_when_released(original_track_path_before_move)
+                ui_dispatcher.submit(self.controller.root, f"macro-replace:{id(track)}", lambda: finish(removed))
+
+            threading.Thread(target=delete_original, name="macro-replace", daemon=True).start()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to replace file: {e}", parent=self.controller.root)
+
+    def _finish_replace_from_macro_output(self, removed, tab, track, original_track_path_before_move, destination_path,
+                                          found_file_in_macro, macro_output_dir, current_playlist, track_index):
+        """Point the track at the replacement once the original is gone (Tk thread)."""
+        try:
+            if not removed:
+                raise PermissionError(f"'{original_track_path_before_move}' is still in use")
             # If the macro-output folder is empty after moving the file, delete the folder
-            if not os.listdir(macro_output_dir):
+            if os.path.isdir(macro_output_dir) and not os.listdir(macro_output_dir):
                 os.rmdir(macro_output_dir)
 
             messagebox.showinfo("Success", f"Track '{os.path.basename(original_track_path_before_move)}' replaced with '{found_file_in_macro}'.", parent=self.controller.root)
@@ -848,12 +1308,13 @@ class ControllerActions():
 
             # Re-check metadata and existence for the track
             self.check_for_intros_and_if_exists(playlist=current_playlist, tracks=[track])
-            self.reload_rows_in_selected_tab_without_intro_check()
+            if tab.winfo_exists():
+                tab.reload_rows()
 
             # If it's an Remote Playlist and path changed, need to update there too
             if current_playlist.type == Playlist.PlaylistType.API and path_changed:
                 # Register renamed path so auto-reload won't mark it as missing
-                self.get_selected_tab().register_renamed_path(original_track_path_before_move, destination_path)
+                tab.register_renamed_path(original_track_path_before_move, destination_path)
                 # This might need adjustment if the track identity relies on path heavily in API sync
                 # For now, assume re-inserting with new path is okay
                 self.remove_and_reinsert_track(track, track_index)  # remove_and_reinsert_track might need to be more robust or a different method used
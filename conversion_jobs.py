@@ -0,0 +1,205 @@
+import os
+import threading
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk
+from typing import Callable, List, Optional
+
+import app_config
+import ui_dispatcher
+from audio_converter import AudioConverter
+from models.track import Track
+
+
+class ConversionJob:
+    """One track being converted to MP3 by a ConversionJobManager."""
+
+    QUEUED = "Queued"
+    RUNNING = "Converting"
+    DONE = "Done"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+
+    def __init__(self, track: Track, on_finished: Optional[Callable[["ConversionJob"], None]] = None):
+        self.track = track
+        self.source_path = track.path
+        self.on_finished = on_finished
+        self.status = self.QUEUED
+        self.progress = 0.0
+        self.result_path: Optional[str] = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.source_path)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (self.DONE, self.FAILED, self.CANCELLED)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+class ConversionJobManager:
+    """Converts tracks to MP3 in the background, several ffmpeg processes at a time.
+
+    Each worker thread drives one ffmpeg process (AudioConverter.convert_with_ffmpeg),
+    so the encoding itself runs in parallel processes while the threads just
+    relay progress. Job state changes are posted to the Tk thread through
+    ui_dispatcher; job.on_finished and the listeners always run there. The
+    original file is kept until on_finished has pointed the playlists at the
+    MP3 and calls delete_original().
+    """
+
+    def __init__(self, root, max_workers: Optional[int] = None):
+        self.root = root
+        # config.json "conversion.max_workers"; defaults to one ffmpeg per CPU
+        self.max_workers = max_workers or app_config.get(["conversion", "max_workers"], None) or os.cpu_count() or 2
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="conversion")
+        self.jobs: List[ConversionJob] = []
+        self._listeners: List[Callable[[ConversionJob], None]] = []
+
+    def add_listener(self, callback: Callable[[ConversionJob], None]):
+        """Call callback(job) on the Tk thread whenever a job's status or progress changes."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def submit(self, track: Track, on_finished=None) -> ConversionJob:
+        job = ConversionJob(track, on_finished)
+        self.jobs.append(job)
+        self._executor.submit(self._run, job)
+        self._notify(job)
+        return job
+
+    def cancel_all(self):
+        for job in self.jobs:
+            if not job.finished:
+                job.cancel()
+
+    def delete_original(self, job: ConversionJob):
+        """Delete a converted job's source file on a worker (it may take a while to be released)."""
+        self._executor.submit(AudioConverter.delete_original_file, job.source_path)
+
+    def active_jobs(self) -> List[ConversionJob]:
+        return [job for job in self.jobs if not job.finished]
+
+    def clear_finished(self):
+        self.jobs = self.active_jobs()
+
+    def _run(self, job: ConversionJob):
+        if job.cancel_event.is_set():
+            self._finish(job, ConversionJob.CANCELLED)
+            return
+        job.status = ConversionJob.RUNNING
+        self._notify(job)
+
+        def on_progress(fraction):
+            job.progress = fraction
+            self._notify(job)
+
+        try:
+            job.result_path = AudioConverter.convert_with_ffmpeg(
+                job.source_path, duration=job.track.duration,
+                on_progress=on_progress, cancel_event=job.cancel_event)
+        except Exception as e:
+            print(f"Error converting {job.source_path} to MP3: {e}")
+            job.result_path = None
+
+        if job.cancel_event.is_set() and not job.result_path:
+            self._finish(job, ConversionJob.CANCELLED)
+        elif job.result_path and os.path.exists(job.result_path):
+            job.progress = 1.0
+            self._finish(job, ConversionJob.DONE)
+        else:
+            self._finish(job, ConversionJob.FAILED)
+
+    def _finish(self, job: ConversionJob, status: str):
+        job.status = status
+
+        def finished():
+            if job.on_finished:
+                try:
+                    job.on_finished(job)
+                except Exception as e:
+                    print(f"Error applying conversion result for {job.source_path}: {e}")
+            self._fire(job)
+
+        # Keyed per job so a late progress update can't replace the completion
+        ui_dispatcher.submit(self.root, f"conversion-done:{id(job)}", finished)
+
+    def _notify(self, job: ConversionJob):
+        # Progress is latest-wins per job: at most one redraw per job per frame
+        ui_dispatcher.submit(self.root, f"conversion:{id(job)}", lambda: self._fire(job))
+
+    def _fire(self, job: ConversionJob):
+        for listener in list(self._listeners):
+            listener(job)
+
+
+class ConversionJobsWindow(tk.Toplevel):
+    """Lists conversion jobs with their progress and lets the user cancel them."""
+
+    def __init__(self, parent, manager: ConversionJobManager):
+        super().__init__(parent)
+        self.manager = manager
+        self.title("Convert to MP3")
+        self.geometry("640x320")
+        self.transient(parent)
+
+        self.tree = ttk.Treeview(self, columns=("file", "status", "progress"), show="headings", selectmode="extended")
+        self.tree.heading("file", text="File")
+        self.tree.heading("status", text="Status")
+        self.tree.heading("progress", text="Progress")
+        self.tree.column("file", width=380, anchor="w")
+        self.tree.column("status", width=110, anchor="w")
+        self.tree.column("progress", width=90, anchor="e")
+        self.tree.pack(fill="both", expand=True, padx=8, pady=(8, 4))
+
+        button_frame = tk.Frame(self)
+        button_frame.pack(fill="x", padx=8, pady=(0, 8))
+        self.summary_label = tk.Label(button_frame, anchor="w")
+        self.summary_label.pack(side="left", fill="x", expand=True)
+        ttk.Button(button_frame, text="Close", command=self.close).pack(side="right", padx=(4, 0))
+        ttk.Button(button_frame, text="Cancel All", command=self.manager.cancel_all).pack(side="right", padx=(4, 0))
+        ttk.Button(button_frame, text="Cancel Selected", command=self.cancel_selected).pack(side="right")
+
+        self._items = {}  # id(job) -> tree item
+        for job in manager.jobs:
+            self.update_job(job)
+        manager.add_listener(self.update_job)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+    def update_job(self, job: ConversionJob):
+        if not self.winfo_exists():
+            return
+        values = (job.name, job.status, f"{job.progress * 100:.0f}%")
+        item = self._items.get(id(job))
+        if item is None:
+            self._items[id(job)] = self.tree.insert("", "end", values=values)
+        else:
+            self.tree.item(item, values=values)
+        self._update_summary()
+
+    def _update_summary(self):
+        jobs = self.manager.jobs
+        active = len(self.manager.active_jobs())
+        if active:
+            self.summary_label.config(text=f"{len(jobs) - active} of {len(jobs)} finished")
+        else:
+            failed = sum(1 for job in jobs if job.status == ConversionJob.FAILED)
+            self.summary_label.config(text=f"All finished ({failed} failed)" if failed else "All finished")
+
+    def cancel_selected(self):
+        selected = set(self.tree.selection())
+        for job in self.manager.jobs:
+            if self._items.get(id(job)) in selected and not job.finished:
+                job.cancel()
+
+    def close(self):
+        # Jobs keep running in the background; the window can be reopened
+        self.manager.remove_listener(self.update_job)
+        self.destroy()
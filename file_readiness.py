@@ -0,0 +1,202 @@
+"""Wait for a file to be completely written (or released) without fixed sleeps.
+
+On Linux the parent directory is watched with inotify (through ctypes), so a
+wait returns as soon as the writer closes the file (``IN_CLOSE_WRITE``) or
+renames it into place. Elsewhere, and when inotify is unavailable, the file's
+size and mtime are polled with a short, growing backoff. In both cases a file
+that has not changed for ``quiet_period`` seconds counts as ready, which also
+covers files that were finished before the wait started. On Windows a file
+that another process still holds open is never reported ready.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+import ui_dispatcher
+from PlaylistService.fs_utils import file_signature
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_CLOSE_NOWRITE = 0x00000010
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+# Polling fallback: first check after 50 ms, doubling up to 500 ms
+_POLL_START = 0.05
+_POLL_MAX = 0.5
+
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is None:
+        _libc = False
+        if sys.platform.startswith("linux"):
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+                libc.inotify_init1.argtypes = [ctypes.c_int]
+                libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+                _libc = libc
+            except (OSError, AttributeError):
+                pass
+    return _libc or None
+
+
+class _DirectoryWatch:
+    """inotify watch on one directory, reporting events for a single file name."""
+
+    def __init__(self, libc, directory: str, name: str, mask: int):
+        self._name = os.fsencode(name)
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout: float) -> int:
+        """OR of the event masks seen for the file within timeout (0 if none)."""
+        readable, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not readable:
+            return 0
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return 0
+        mask = 0
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, event_mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            start = offset + _EVENT_HEADER.size
+            if data[start:start + length].rstrip(b"\0") == self._name:
+                mask |= event_mask
+            offset = start + length
+        return mask
+
+    def close(self):
+        os.close(self._fd)
+
+
+def is_locked(path: str) -> bool:
+    """True if another process holds the file open in a way that blocks writing (Windows only)."""
+    if sys.platform != "win32":
+        return False
+    try:
+        with open(path, "r+b"):
+            return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+
+
+def wait_until_ready(path: str, timeout: float = 30.0, quiet_period: float = 0.5,
+                     include_readers: bool = False) -> bool:
+    """Block until path is completely written, or until timeout. Returns True if ready.
+
+    include_readers also waits for processes that only read the file (e.g. a
+    player) to close it, which is what deleting or replacing the file needs.
+    """
+    deadline = time.monotonic() + timeout
+    signature = file_signature(path)
+    if signature is None:
+        return False
+    if time.time() - signature[1] / 1e9 >= quiet_period and not is_locked(path):
+        return True
+
+    watch = None
+    libc = _load_libc()
+    if libc is not None:
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if include_readers:
+            mask |= IN_CLOSE_NOWRITE
+        try:
+            watch = _DirectoryWatch(libc, os.path.dirname(os.path.abspath(path)), os.path.basename(path), mask)
+        except OSError:
+            watch = None
+    try:
+        if watch is not None:
+            return _wait_inotify(watch, path, deadline, quiet_period, signature)
+        return _wait_polling(path, deadline, quiet_period, signature)
+    finally:
+        if watch is not None:
+            watch.close()
+
+
+def _wait_inotify(watch, path, deadline, quiet_period, signature) -> bool:
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        mask = watch.wait(min(quiet_period, remaining))
+        if mask & (IN_CLOSE_WRITE | IN_MOVED_TO | IN_CLOSE_NOWRITE):
+            return file_signature(path) is not None
+        current = file_signature(path)
+        if current is None:
+            return False
+        if not mask and current == signature:
+            # Nothing touched the file for a whole quiet period
+            return True
+        signature = current
+
+
+def _wait_polling(path, deadline, quiet_period, signature) -> bool:
+    interval = _POLL_START
+    last_change = time.monotonic()
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, _POLL_MAX)
+        current = file_signature(path)
+        if current is None:
+            return False
+        now = time.monotonic()
+        if current != signature:
+            signature = current
+            last_change = now
+            interval = _POLL_START
+        elif now - last_change >= quiet_period and not is_locked(path):
+            return True
+
+
+def when_ready(widget, path: str, callback, timeout: float = 30.0, quiet_period: float = 0.5,
+               include_readers: bool = False):
+    """Wait for path on a background thread, then call callback(ready) on the Tk thread."""
+    def wait():
+        ready = wait_until_ready(path, timeout, quiet_period, include_readers)
+        ui_dispatcher.submit(widget, f"file-ready:{path}", lambda: callback(ready))
+
+    threading.Thread(target=wait, name="file-readiness", daemon=True).start()
+
+
+def remove_when_released(path: str, timeout: float = 10.0) -> bool:
+    """Delete path, waiting (without fixed sleeps) for other processes to let go of it first.
+
+    Returns True once the file is gone, False if it is still held after timeout.
+    """
+    deadline = time.monotonic() + timeout
+    released = False
+    while True:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return True
+        except PermissionError:
+            remaining = deadline - time.monotonic()
+            if released or remaining <= 0:
+                # Still refused after the file was released: not a lock, so waiting won't help
+                return False
+            released = wait_until_ready(path, remaining, quiet_period=0.1, include_readers=True)
@@ -4,7 +4,6 @@ This module provides centralized font settings that can be used across the appli
 """
 import tkinter as tk
 from tkinter.font import Font
-import json, os, logging
 
 # Base font size - can be adjusted to make all text bigger or smaller
 BASE_FONT_SIZE = 13
@@ -41,17 +40,12 @@ def configure_ttk_styles():
     """Configure ttk styles using values from ``config.json``.
     This can be called repeatedly (e.g. after SettingsDialog → Apply) to
     refresh fonts, colors, and geometry across the application.
+    Values come from the shared ``app_config`` cache.
     """
     from tkinter import ttk
 
-    # Load configuration
-    try:
-        cfg_path = os.path.join(os.path.dirname(__file__), "config.json")
-        with open(cfg_path, "r", encoding="utf-8") as fh:
-            cfg = json.load(fh)
-    except Exception as exc:  # noqa: broad-except
-        logging.warning("font_config: failed to read config.json – using defaults (%s)", exc)
-        cfg = {}
+    import app_config
+    cfg = app_config.get_config()
 
     fonts_cfg = cfg.get("fonts", {})
     tree_cfg = cfg.get("treeview", {})
@@ -135,3 +129,13 @@ def configure_ttk_styles():
     style.configure("TCombobox", font=DEFAULT_FONT_TUPLE)
     style.configure("TCheckbutton", font=DEFAULT_FONT_TUPLE)
     style.configure("TRadiobutton", font=DEFAULT_FONT_TUPLE)
+
+
+# Config sections that affect the styles configured above
+STYLE_CONFIG_SECTIONS = ("fonts", "treeview", "colors")
+
+
+def watch_config():
+    """Re-apply ttk styles whenever a style-related config section changes."""
+    import app_config
+    return app_config.subscribe(lambda changed: configure_ttk_styles(), STYLE_CONFIG_SECTIONS)
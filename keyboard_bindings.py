@@ -12,6 +12,7 @@ class KeyboardBindings:
         "cut": (["<Control-x>", "<Control-X>"], "Ctrl+X"),
         "delete": (["<Delete>"], "Delete"),
         "search": (["<Control-f>", "<Control-F>"], "Ctrl+F"),
+        "add_track_search": (["<Control-i>", "<Control-I>"], "Ctrl+I"),
     }
     
     def __init__(self, root):
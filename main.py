@@ -4,7 +4,7 @@ from container_view import ContainerView
 from menu_bar import MenuBar
 from keyboard_bindings import KeyboardBindings
 from playlist_builder_controller import PlaylistBuilderController
-from font_config import configure_ttk_styles
+from font_config import configure_ttk_styles, watch_config
 import os
 import sys
 
@@ -30,6 +30,7 @@ def main():
 
     # Configure fonts and styles for the application
     configure_ttk_styles()
+    watch_config()
 
     controller = PlaylistBuilderController(root)
 
@@ -62,6 +62,8 @@ class MenuBar(tk.Menu):
 
         if "search" in self.callbacks:
             edit_menu.add_command(label="Find", command=self.callbacks["search"], accelerator=display_names.get("search", ""))
+        if "add_track_search" in self.callbacks:
+            edit_menu.add_command(label="Add Track by Search", command=self.callbacks["add_track_search"], accelerator=display_names.get("add_track_search", ""))
         
         self.add_cascade(label="Edit", menu=edit_menu)
         
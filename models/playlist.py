@@ -23,6 +23,10 @@ class Playlist:
         self.id = uuid.uuid4()
         self.type = type
         self.source_id = source_id  # e.g., "104.7" or "88.7"
+        # True when tracks came from the playlist snapshot cache and still need a background revalidation
+        self.from_snapshot = False
+        # False for placeholder playlists whose file hasn't been parsed yet (lazy profile tabs)
+        self.loaded = True
 
     def __str__(self):
         track_paths = []
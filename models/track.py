@@ -9,6 +9,8 @@ class Track:
         self.play_time = None
         self.has_intro = False
         self.exists = True
+        # (size, mtime_ns) of the file when its tags were last read
+        self.file_signature = None
     def __str__(self):
         return f"track at {self.path}"
 
@@ -16,7 +18,9 @@ class Track:
         return f"Track(path={self.path}, title={self.title}, duration={self.duration}, metadata={self.metadata}, play_time={self.play_time}, has_intro={self.has_intro})"
 
     def copy(self):
-        return Track(self.path, self.artist, self.title, self.duration, self.metadata)
+        track = Track(self.path, self.artist, self.title, self.duration, self.metadata)
+        track.file_signature = self.file_signature
+        return track
 
     def fingerprint(self) -> tuple:
         """Return a tuple for equality comparison between tracks.
@@ -1,40 +1,58 @@
+import copy
 import json
 import os
+import app_config
 from models.playlist import Playlist
+from PlaylistService.fs_utils import data_path
+from PlaylistService.profile_database import ProfileDatabase
+from PlaylistService.write_behind import WriteBehindWriter, atomic_write
 from version import VERSION, APP_NAME
 
 class Persistence:
+    # Quiet period before in-memory settings changes are written to disk
+    SAVE_DEBOUNCE_MS = 750
     
     def __init__(self, controller):
         self.controller = controller
-        self.profile_path = "settings.json"
+        self.profile_path = data_path("settings.json")
         self.profile = None
+        # self.profile is authoritative after startup; the file is only written, never re-read
+        self._writer = WriteBehindWriter(name="settings-writer")
+        self._save_job = None
+        # config.json "persistence.backend": "json" (settings.json) or "sqlite" (settings.db,
+        # migrated from settings.json on first use)
+        self.backend = app_config.get(["persistence", "backend"], "json")
+        self._database = ProfileDatabase() if self.backend == "sqlite" else None
         self.load_settings()
-        
+        self._normalize(self.profile)
 
-        
-        # Convert profiles list to dictionary if needed
-        if "profiles" in self.profile and isinstance(self.profile["profiles"], list):
-            profile_list = self.profile["profiles"]
-            self.profile["profiles"] = {}
-            for profile_name in profile_list:
-                self.profile["profiles"][profile_name] = []
-        
-        # Ensure profiles dictionary exists
-        if "profiles" not in self.profile:
-            self.profile["profiles"] = {}
-        
         # Set current profile name from settings
-        # write this shorter 
-        self.current_profile_name = self.profile["current_profile"] 
-
-        
+        self.current_profile_name = self.profile["current_profile"]
 
         # Save any changes made during initialization
         self.save_settings(self.profile)
+
+    @staticmethod
+    def _normalize(settings):
+        # Convert profiles list to dictionary if needed
+        if "profiles" in settings and isinstance(settings["profiles"], list):
+            settings["profiles"] = {profile_name: [] for profile_name in settings["profiles"]}
+
+        # Ensure profiles dictionary exists
+        if "profiles" not in settings:
+            settings["profiles"] = {}
+        settings.setdefault("current_profile", "default")
     
     def load_settings(self):
-        if not os.path.exists(self.profile_path):
+        """Return the settings, reading settings.json only the first time."""
+        if self.profile is not None:
+            return self.profile
+        if self._database is not None:
+            self.profile = self._database.load(legacy_json_path=self.profile_path)
+            if self.profile is None:
+                self.profile = {"current_profile": "default", "profiles": {"default": []}}
+                self.save_settings(self.profile)
+        elif not os.path.exists(self.profile_path):
             self.profile = {"current_profile": "default", "profiles": {"default": []}}
             self.save_settings(self.profile)
         else:
@@ -43,11 +61,74 @@ class Persistence:
         return self.profile
 
     def save_settings(self, settings):
+        """Update the in-memory settings and schedule a debounced write to disk."""
         self.profile = settings
-        with open(self.profile_path, "w") as f:
-            json.dump(self.profile, f)
+        self._schedule_flush()
         return self.profile
 
+    def _schedule_flush(self):
+        root = getattr(self.controller, "root", None)
+        if root is None:
+            self.flush()
+            return
+        if self._save_job is not None:
+            try:
+                root.after_cancel(self._save_job)
+            except Exception:
+                pass
+        self._save_job = root.after(self.SAVE_DEBOUNCE_MS, self._flush_async)
+
+    def _serialize(self) -> bytes:
+        # Serialized on the Tk thread, so the writer never sees a half-updated dict
+        return json.dumps(self.profile).encode("utf-8")
+
+    def _submit(self):
+        if self._database is not None:
+            # Only the rows that differ from what the database holds get written
+            self._database.sync_async(copy.deepcopy(self.profile))
+        else:
+            self._writer.submit(self.profile_path, self._serialize())
+
+    def _flush_async(self):
+        self._save_job = None
+        self._submit()
+
+    def flush(self, timeout=10):
+        """Write pending settings now and wait for the write to finish (call on close)."""
+        if self._save_job is not None:
+            try:
+                self.controller.root.after_cancel(self._save_job)
+            except Exception:
+                pass
+            self._save_job = None
+        self._submit()
+        if self._database is not None:
+            return self._database.flush(timeout)
+        return self._writer.flush(timeout)
+
+    def reload_from(self, path):
+        """Replace the settings with a settings.json-format file (e.g. imported from a deployment).
+
+        The open tabs still belong to the running profile, so autosaves keep
+        going there; the imported current_profile is used from the next start.
+        """
+        with open(path, "r") as f:
+            settings = json.load(f)
+        self._normalize(settings)
+        # Let queued writes land first, so none of them overwrites the import
+        self.flush()
+        if self._database is not None:
+            # settings.db only migrates settings.json when empty; replace its rows directly
+            self.profile = self._database.replace(settings)
+        else:
+            self.save_settings(settings)
+            self.flush()
+
+    def export_to(self, path):
+        """Write the current settings to path in settings.json format (whichever backend holds them)."""
+        self.flush()
+        atomic_write(path, self._serialize())
+
     def get_profile_names(self):
         """Get a list of all profile names"""
         return list(self.profile["profiles"].keys())
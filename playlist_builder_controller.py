@@ -6,9 +6,17 @@ from playlist_notebook_view import PlaylistNotebookView,PlaylistTabView
 from tkinter import ttk, messagebox, Toplevel, Label, Button
 from controller_actions import ControllerActions
 from PlaylistService.playlist_service import PlaylistServiceManager
+from PlaylistService.track_location_index import TrackLocationIndex
+from PlaylistService.prelisten_cache import PrelistenCache
+from PlaylistService.waveform_peaks import WaveformPeakStore
+from PlaylistService.silence_analysis import SilenceAnalyzer
+from PlaylistService.loudness_analysis import LoudnessAnalyzer
+from PlaylistService.exact_duration import DurationAnalyzer
+from PlaylistService.library_index import LibraryIndex
 from persistence import Persistence
 from profile_loader import ProfileLoader
 from file_utils import FileUtils
+from audio_converter import AudioConverter
 from tree_interaction_controller import TreeInteractionController
 from settings_dialog import SettingsDialog
 from version import VERSION, APP_NAME
@@ -29,6 +37,24 @@ class PlaylistBuilderController:
 
         self.playlist_service = PlaylistServiceManager()
 
+        # Global path -> {tab: row indices} index, kept up to date by the tabs themselves
+        self.track_locations = TrackLocationIndex()
+
+        # Local copies of the selected track and its neighbours for instant prelisten
+        self.prelisten_cache = PrelistenCache()
+        self._prefetch_job = None
+        # Waveform overviews shown behind the prelisten slider, cached on disk
+        self.waveform_peaks = WaveformPeakStore()
+        # Leading/trailing/internal silence per file; flagged rows get the "dead_air" tag
+        self.silence_analyzer = SilenceAnalyzer()
+        # Integrated LUFS and true peak per file, shown in the LUFS/Peak columns
+        self.loudness_analyzer = LoudnessAnalyzer()
+        # Exact decoded durations, replacing tag estimates for start-time calculations
+        self.duration_analyzer = DurationAnalyzer()
+        # Index of the music library folders, for relinking moved/renamed tracks and adding tracks by search
+        self.library_index = LibraryIndex()
+        self.root.after(self.LIBRARY_REFRESH_DELAY_MS, self.library_index.refresh_async)
+
 
         self.callbacks = {
             "button_down": self.button_down,
@@ -42,7 +68,10 @@ class PlaylistBuilderController:
             "hover_with_files": self.hover_with_files,
             "double_click": self.handle_double_click,
             "search": self.toggle_search,
-            "on_interaction": self.on_user_interaction
+            "add_track_search": self.toggle_add_track_search,
+            "on_interaction": self.on_user_interaction,
+            "selection_changed": self.on_selection_changed,
+            "sort_by_column": self.sort_by_column
         }
 
 
@@ -129,6 +158,43 @@ class PlaylistBuilderController:
         except Exception:
             pass
 
+    # Quiet period after the selection settles before prelisten prefetching starts
+    PRELISTEN_PREFETCH_DELAY_MS = 300
+    # Let startup (profile restore) finish before crawling the library folders
+    LIBRARY_REFRESH_DELAY_MS = 10000
+
+    def sort_by_column(self, column):
+        self.controller_actions.sort_playlist_by_loudness(column)
+
+    def on_selection_changed(self, event=None):
+        """Prefetch the selected track and its neighbours once the selection settles."""
+        if self._prefetch_job is not None:
+            self.root.after_cancel(self._prefetch_job)
+        self._prefetch_job = self.root.after(self.PRELISTEN_PREFETCH_DELAY_MS, self.prefetch_prelisten_tracks)
+
+    def prefetch_prelisten_tracks(self, track=None):
+        """Queue track (default: the first selected) and the two rows after and one before it."""
+        self._prefetch_job = None
+        try:
+            playlist = self.get_selected_tab_playlist()
+            if track is not None:
+                index = playlist.tracks.index(track)
+            else:
+                tree = self.get_selected_tab_tree()
+                selection = tree.selection()
+                if not selection:
+                    return
+                index = tree.index(selection[0])
+        except Exception:
+            return
+        neighbours = [index, index + 1, index - 1, index + 2]
+        paths = [
+            playlist.tracks[i].path for i in neighbours
+            if 0 <= i < len(playlist.tracks) and playlist.tracks[i].exists
+            and playlist.tracks[i].path and AudioConverter.is_format_supported_by_pygame(playlist.tracks[i].path)
+        ]
+        self.prelisten_cache.prefetch(paths)
+
     def copy_tracks(self, event=None): self.tree_interaction_controller.copy_tracks(event)
     def cut_tracks(self, event=None): self.tree_interaction_controller.cut_tracks(event)
     def delete_tracks(self, event=None): self.tree_interaction_controller.delete_tracks(event)
@@ -148,8 +214,12 @@ class PlaylistBuilderController:
 
 
 
-    def load_playlist(self, playlist_path, title):
-        playlist = self.playlist_service.load_playlist_from_path(playlist_path)
+    def load_playlist(self, playlist_path, title, lazy=False):
+        """Open a playlist in a new tab. With lazy, the file is only parsed once the tab is needed."""
+        if lazy:
+            playlist = self.playlist_service.create_placeholder_playlist(playlist_path)
+        else:
+            playlist = self.playlist_service.load_playlist_from_path(playlist_path)
         self.notebook_view.add_tab(playlist, title)
 
     def get_binding_display_names(self):
@@ -234,6 +304,16 @@ class PlaylistBuilderController:
             print(f"Error toggling search: {str(e)}")
             messagebox.showerror("Error", f"Failed to toggle search: {str(e)}")
 
+    def toggle_add_track_search(self, event=None):
+        """Toggle the add-track-by-search box in the current tab"""
+        try:
+            tab = self.get_selected_tab()
+            if tab:
+                tab.toggle_add_track()
+        except Exception as e:
+            print(f"Error toggling track search: {str(e)}")
+            messagebox.showerror("Error", f"Failed to toggle track search: {str(e)}")
+
     def notify_currently_playing(self, track, tab_view, can_focus, track_position=None):
         """Update the top bar with currently playing information.
 
@@ -325,6 +405,7 @@ class PlaylistBuilderController:
         if not tab_view:
             print(f"[DEBUG] Could not resolve tab, returning")
             return
+        context["tab"] = tab_view
 
         try:
             self.notebook_view.notebook.select(tab_view)
@@ -339,13 +420,8 @@ class PlaylistBuilderController:
         if tab_view and tab_view in self.notebook_view.get_tabs():
             return tab_view
 
-        # Fallback: locate tab containing the track path
-        for candidate in self.notebook_view.get_tabs():
-            for track in candidate.playlist.tracks:
-                if track.path == track_path:
-                    self._currently_playing_context["tab"] = candidate
-                    return candidate
-        return None
+        # Fallback: first tab (in notebook order) containing the track path
+        return self.track_locations.first_owner(track_path, self.notebook_view.get_tabs())
 
     def _format_track_display(self, track):
         parts = []
@@ -362,7 +438,7 @@ class PlaylistBuilderController:
     def open_settings_dialog(self, event=None):
         """Open the settings dialog modally."""
         try:
-            SettingsDialog(self.root, on_apply=self.refresh_theme_colors)
+            SettingsDialog(self.root, on_apply=self.refresh_theme_colors, persistence=self.persistence)
         except Exception as e:
             print(f"Error opening settings dialog: {str(e)}")
             messagebox.showerror("Error", f"Failed to open settings dialog: {str(e)}")
@@ -424,4 +500,11 @@ class PlaylistBuilderController:
         """Called when the application is closing. Saves window geometry and state."""
         state = self.root.state()  # 'normal', 'zoomed' (maximized on Windows), 'iconic', etc.
         geometry = self.root.geometry()
-        self.persistence.save_window_geometry(geometry, state)
\ No newline at end of file
+        self.persistence.save_window_geometry(geometry, state)
+        self.persistence.flush()
+        # Unfinished conversions keep their originals (those are only deleted once the MP3 is in place)
+        self.controller_actions.cancel_conversions()
+        self.playlist_service.write_snapshot()
+        # Don't exit with playlist saves still queued on the background writer
+        if not self.playlist_service.flush_pending_writes(timeout=30):
+            print("Warning: timed out waiting for playlist saves to finish")
\ No newline at end of file
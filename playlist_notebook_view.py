@@ -18,6 +18,8 @@ class PlaylistNotebookView:
         self.notebook.bind("<Button-1>", self.button_down)
         self.notebook.bind("<B1-Motion>", self.dragged)
         self.notebook.bind("<ButtonRelease-1>", self.button_up)
+        # Lazy profile tabs are parsed the first time they are shown
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
     # not sure
     def get_tab_playlists(self):
         playlists = []
@@ -85,6 +87,17 @@ class PlaylistNotebookView:
             print(e)
             return None
     
+    def on_tab_changed(self, event=None):
+        if event is not None and getattr(self.controller, "_is_loading_profile", False):
+            # ProfileLoader materializes the visible tab itself once all tabs exist
+            return
+        try:
+            tab = self.get_selected_tab()
+        except Exception:
+            return
+        if hasattr(tab, 'playlist') and not tab.playlist.loaded:
+            self.controller.controller_actions.materialize_tab(tab)
+
     def get_selected_tab(self):
         selected_tab = self.notebook.select()
         return self.notebook.nametowidget(selected_tab)
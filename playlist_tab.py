@@ -3,13 +3,17 @@ from tkinterdnd2 import TkinterDnD, DND_FILES
 from PlaylistService import playlist_service
 from PlaylistService.api_playlist_manager import ConnectionStatus
 from PlaylistService.playlist_diff import PlaylistDiff
+from PlaylistService.playlist_search_index import PlaylistSearchIndex
 import utils
 from models.playlist import Playlist
 from models.track import Track
-from typing import List, Optional
+from typing import Dict, List, Optional
 import os
-from playlist_tab_subviews import PlaylistTabTreeView, PlaylistTabContextMenu, SearchFrame
+import ui_dispatcher
+from playlist_tab_subviews import PlaylistTabTreeView, PlaylistTabContextMenu, SearchFrame, AddTrackFrame
 
+# Tags owned by the search overlay; everything else on a row belongs to the row itself
+SEARCH_TAGS = ("search_match", "search_current")
 
 
 class PlaylistTabView(ttk.Frame):
@@ -22,6 +26,8 @@ class PlaylistTabView(ttk.Frame):
         self.title = title
         self.callbacks = callbacks
         self.current_playing_track_id = None
+        # (position, item id, track) last pushed to the now-playing bar
+        self._last_playing_state = None
         
         # Connection status tracking for API playlists
         self._connection_status = ConnectionStatus.DISCONNECTED
@@ -65,7 +71,18 @@ class PlaylistTabView(ttk.Frame):
         # Search frame (initially hidden)
         self.search_frame = None
         self.search_results = []
+        self._search_overlay = set()  # Item ids currently carrying a search tag
         self.current_match_index = -1
+        self._search_index = PlaylistSearchIndex()
+        # Add-track-by-search box over the library index (initially hidden)
+        self.add_track_frame: Optional[AddTrackFrame] = None
+        self._library_generation = None  # search index generation the results were drawn from
+
+        # Row lookup tables, kept in step with the tree so lookups never read values back from Tk
+        self._row_items: List[str] = []  # item ids in row order
+        self._item_paths: Dict[str, str] = {}  # item id -> track path
+        self._item_rows: Dict[str, int] = {}  # item id -> row index
+        self._path_rows: Dict[str, List[int]] = {}  # track path -> row indices
 
         self.dragging_index = None
         # get playlist data
@@ -120,6 +137,7 @@ class PlaylistTabView(ttk.Frame):
         # Ensure we don't keep updating "Now Playing" after the tab is closed/disconnected.
         try:
             self._cleanup_remote_resources()
+            self.controller.track_locations.remove(self)
         finally:
             super().destroy()
     
@@ -194,8 +212,8 @@ class PlaylistTabView(ttk.Frame):
     
     def _on_connection_status_change(self, manager, status: ConnectionStatus, message: str):
         """Handle connection status changes."""
-        # Schedule UI update on main thread
-        self.after(0, lambda: self._update_status_display(status, message))
+        # Schedule UI update on main thread; only the latest status matters
+        ui_dispatcher.submit(self, "status", lambda: self._update_status_display(status, message))
     
     def _update_status_display(self, status: ConnectionStatus, message: str = ""):
         """Update the status bar display based on connection status."""
@@ -299,7 +317,7 @@ class PlaylistTabView(ttk.Frame):
                 playlist = self.controller.playlist_service.reload_api_playlist(self.playlist.source_id)
                 if playlist:
                     self.playlist.tracks = list(playlist.tracks)
-                    self.after(0, self.reload_rows)
+                    ui_dispatcher.submit(self, "reload", self.reload_rows)
             except Exception as e:
                 print(f"Reconnection failed: {e}")
         
@@ -334,8 +352,8 @@ class PlaylistTabView(ttk.Frame):
 
         Schedules UI update on main thread.
         """
-        # Schedule UI update on main thread
-        self.after(0, lambda: self._handle_playlist_update(new_playlist))
+        # Schedule UI update on main thread; a newer reload supersedes a pending one
+        ui_dispatcher.submit(self, "playlist_update", lambda: self._handle_playlist_update(new_playlist))
 
     def _handle_playlist_update(self, new_playlist: Playlist):
         """Handle playlist update on main thread.
@@ -357,27 +375,14 @@ class PlaylistTabView(ttk.Frame):
         - Artist intro dots are preserved (check_for_intros_and_exists is called)
         """
         # Save current state
-        selection = self.tree.selection()
-        selected_paths = []
-        for item_id in selection:
-            try:
-                values = self.tree.item(item_id, 'values')
-                if len(values) > 6:
-                    selected_paths.append(values[6])
-            except Exception:
-                pass
+        selected_paths = [self._item_paths[item_id] for item_id in self.tree.selection()
+                          if item_id in self._item_paths]
 
         yview = self.tree.yview()
         scroll_position = yview[0] if yview else 0.0
 
         # Save currently playing track path
-        currently_playing_path = None
-        if self.current_playing_track_id:
-            try:
-                values = self.tree.item(self.current_playing_track_id, 'values')
-                currently_playing_path = values[6] if len(values) > 6 else None
-            except Exception:
-                pass
+        currently_playing_path = self._item_paths.get(self.current_playing_track_id)
 
         # Substitute renamed paths before existence check
         # This prevents tracks from showing as "missing" (red) when the file was
@@ -429,32 +434,27 @@ class PlaylistTabView(ttk.Frame):
         if not paths:
             return
 
-        items_to_select = []
-        for item_id in self.tree.get_children():
-            try:
-                values = self.tree.item(item_id, 'values')
-                if len(values) > 6 and values[6] in paths:
-                    items_to_select.append(item_id)
-            except Exception:
-                pass
+        row_items = self._row_items
+        rows = sorted(row for path in set(paths) for row in self._path_rows.get(path, ()))
+        items_to_select = [row_items[row] for row in rows]
 
         if items_to_select:
             self.tree.selection_set(items_to_select)
 
     def _restore_currently_playing(self, track_path: str):
         """Restore the currently playing highlight after diff update."""
-        for item_id in self.tree.get_children():
-            try:
-                values = self.tree.item(item_id, 'values')
-                if len(values) > 6 and values[6] == track_path:
-                    current_tags = list(self.tree.item(item_id, 'tags'))
-                    if 'currently_playing' not in current_tags:
-                        current_tags.append('currently_playing')
-                    self.tree.item(item_id, tags=tuple(current_tags))
-                    self.current_playing_track_id = item_id
-                    return
-            except Exception:
-                pass
+        rows = self._path_rows.get(track_path)
+        if not rows:
+            return
+        item_id = self._row_items[rows[0]]
+        try:
+            current_tags = list(self.tree.item(item_id, 'tags'))
+            if 'currently_playing' not in current_tags:
+                current_tags.append('currently_playing')
+            self.tree.item(item_id, tags=tuple(current_tags))
+            self.current_playing_track_id = item_id
+        except Exception:
+            pass
 
     def register_renamed_path(self, old_path: str, new_path: str):
         """Register a path rename so auto-reload won't mark it as missing.
@@ -498,14 +498,16 @@ class PlaylistTabView(ttk.Frame):
             self._apply_playlist_update(pending)
 
     def is_empty(self):
-        return len(self.playlist.tracks) == 0
+        # A placeholder that hasn't been parsed yet isn't empty, it just isn't loaded
+        return self.playlist.loaded and len(self.playlist.tracks) == 0
    
     def get_selected_row_indexes(self) -> List[int]:
         indexes = []
         for row in self.tree.selection():
             if row == "":
                 continue
-            indexes.append(self.tree.index(row))
+            index = self._item_rows.get(row)
+            indexes.append(index if index is not None else self.tree.index(row))
         return indexes
 
     
@@ -525,13 +527,12 @@ class PlaylistTabView(ttk.Frame):
                 pass
         
         # Store the path of the currently playing track before clearing the tree
-        currently_playing_path = None
-        if self.current_playing_track_id:
-            values = self.tree.item(self.current_playing_track_id, 'values')
-            currently_playing_path = values[6] if len(values) > 6 else None
+        currently_playing_path = self._item_paths.get(self.current_playing_track_id)
         
-        self.tree.delete(*self.tree.get_children())
+        self.tree.delete(*self._row_items)
         self.current_playing_track_id = None  # Reset the current playing track ID
+        self._search_index.invalidate()
+        self._search_overlay = set()  # Rows carrying search tags were just deleted
         
         tracks = playlist.tracks
         if tracks and tracks[0].play_time is not None and playlist.type != Playlist.PlaylistType.API:
@@ -540,6 +541,8 @@ class PlaylistTabView(ttk.Frame):
         if is_api_raw:
             pass
         found_currently_playing = False
+        row_items = []
+        item_paths = {}
         for i, track in enumerate(tracks):
             rowNumber = i + 1
 
@@ -560,7 +563,10 @@ class PlaylistTabView(ttk.Frame):
             file_exists = True if track.exists else False
 
             # Insert row with appropriate tag if file doesn't exist
-            item_id = self.tree.insert("", "end", values=(rowNumber, start_time, has_intro, artist, title, duration, path))
+            item_id = self.tree.insert("", "end", values=(rowNumber, start_time, has_intro, artist, title, duration, path)
+                                       + self._loudness_fields(path))
+            row_items.append(item_id)
+            item_paths[item_id] = path
             
             # Apply appropriate tags
             tags = []
@@ -572,6 +578,9 @@ class PlaylistTabView(ttk.Frame):
                 
             if not file_exists:
                 tags.append("missing_file")
+
+            if self.controller.silence_analyzer.is_flagged(path):
+                tags.append("dead_air")
             
             # If this is the currently playing track, highlight it (only first match for duplicates)
             if path == currently_playing_path and not found_currently_playing:
@@ -581,13 +590,17 @@ class PlaylistTabView(ttk.Frame):
                 
             self.tree.item(item_id, tags=tuple(tags))
 
+        self._row_items = row_items
+        self._item_paths = item_paths
+        self._rebuild_row_lookup()
+
         # Restore scroll position and selection if requested
         if preserve_scroll:
             self.tree.update_idletasks()
             if scroll_position > 0.0:
                 self.tree.yview_moveto(scroll_position)
             if selected_indexes:
-                children = self.tree.get_children()
+                children = self._row_items
                 items_to_select = [children[i] for i in selected_indexes if i < len(children)]
                 if items_to_select:
                     self.tree.selection_set(items_to_select)
@@ -611,15 +624,52 @@ class PlaylistTabView(ttk.Frame):
 
         # Renumber all rows and fix alternating colors after changes
         self._renumber_rows()
+        self._search_index.invalidate()
 
         # Update the playlist tracks reference
         self.playlist.tracks = list(new_tracks)
+        self._rebuild_row_lookup()
+
+    def _rebuild_row_lookup(self):
+        """Rebuild the row index tables from the ordered item ids and their paths.
+
+        Also publishes the path -> rows map to the controller's global index.
+        """
+        item_paths = self._item_paths
+        self._item_rows = {item_id: i for i, item_id in enumerate(self._row_items)}
+        path_rows: Dict[str, List[int]] = {}
+        for i, item_id in enumerate(self._row_items):
+            path_rows.setdefault(item_paths[item_id], []).append(i)
+        self._path_rows = path_rows
+        self.controller.track_locations.update(self, path_rows)
+
+    def set_rows_value(self, rows: List[int], column: str, value: str):
+        """Set one column's value on the given rows."""
+        for row in rows:
+            if row < len(self._row_items):
+                self.tree.set(self._row_items[row], column, value)
+
+    def set_rows_tag(self, rows: List[int], tag: str, enabled: bool):
+        """Add or remove one tag on the given rows, leaving their other tags untouched."""
+        for row in rows:
+            if row >= len(self._row_items):
+                continue
+            item_id = self._row_items[row]
+            tags = [t for t in self.tree.item(item_id, 'tags') if t != tag]
+            if enabled:
+                tags.append(tag)
+            self.tree.item(item_id, tags=tuple(tags))
+
+    def get_rows_for_path(self, track_path: str) -> List[int]:
+        """Return the row indices holding track_path, in row order."""
+        return list(self._path_rows.get(track_path, ()))
 
     def _delete_row_at_index(self, index: int):
         """Delete a single row from TreeView."""
-        children = self.tree.get_children()
+        children = self._row_items
         if 0 <= index < len(children):
-            item_id = children[index]
+            item_id = children.pop(index)
+            self._item_paths.pop(item_id, None)
             # Check if this was the currently playing track
             if item_id == self.current_playing_track_id:
                 self.current_playing_track_id = None
@@ -627,7 +677,7 @@ class PlaylistTabView(ttk.Frame):
 
     def _insert_row_at_index(self, index: int, track: Track):
         """Insert a single row into TreeView at specified index."""
-        children = self.tree.get_children()
+        children = self._row_items
 
         # Determine insert position
         if index >= len(children):
@@ -640,33 +690,43 @@ class PlaylistTabView(ttk.Frame):
 
         # Insert
         item_id = self.tree.insert("", position, values=row_values)
+        children.insert(min(index, len(children)), item_id)
         self._apply_row_tags(item_id, index, track)
+        self._item_paths[item_id] = track.path
 
     def _update_row_at_index(self, index: int, track: Track):
         """Update an existing row's values without deleting it."""
-        children = self.tree.get_children()
+        children = self._row_items
         if 0 <= index < len(children):
             item_id = children[index]
             row_values = self._format_track_for_row(index + 1, track)
             self.tree.item(item_id, values=row_values)
             self._apply_row_tags(item_id, index, track)
+            self._item_paths[item_id] = track.path
 
     def _format_track_for_row(self, row_number: int, track: Track) -> tuple:
         """Format a track into TreeView row values."""
         is_api_raw = self.check_for_no_large_play_time(self.playlist)
-
-        if self.playlist.type == Playlist.PlaylistType.API:
-            if is_api_raw:
-                start_time = utils.format_play_time(track.play_time, type="api_raw")
-            else:
-                start_time = utils.format_play_time(track.play_time)
+        return (row_number,) + self._format_track_fields(track, is_api_raw) + self._loudness_fields(track.path)
+
+    def _loudness_fields(self, path: str) -> tuple:
+        """LUFS and true peak cells for a row (blank until the playlist has been scanned)."""
+        report = self.controller.loudness_analyzer.get_report(path)
+        if report is None:
+            return ("", "")
+        return (report.lufs_text(), report.peak_text())
+
+    def _format_track_fields(self, track: Track, is_api_raw: bool) -> tuple:
+        """Format everything but the row number for a track's TreeView row."""
+        if self.playlist.type == Playlist.PlaylistType.API and is_api_raw:
+            start_time = utils.format_play_time(track.play_time, type="api_raw")
         else:
             start_time = utils.format_play_time(track.play_time)
 
         has_intro = "•" if track.has_intro else ""
         duration = utils.format_duration(track.duration) if track.duration is not None else ""
 
-        return (row_number, start_time, has_intro, track.artist, track.title, duration, track.path)
+        return (start_time, has_intro, track.artist, track.title, duration, track.path)
 
     def _apply_row_tags(self, item_id: str, index: int, track: Track):
         """Apply appropriate tags to a row."""
@@ -682,21 +742,21 @@ class PlaylistTabView(ttk.Frame):
         if not track.exists:
             tags.append("missing_file")
 
+        # Long silence found by the silence check
+        if self.controller.silence_analyzer.is_flagged(track.path):
+            tags.append("dead_air")
+
         # Preserve currently playing highlight if this track matches
         if self.current_playing_track_id:
-            try:
-                current_values = self.tree.item(self.current_playing_track_id, 'values')
-                if len(current_values) > 6 and current_values[6] == track.path:
-                    tags.append("currently_playing")
-                    self.current_playing_track_id = item_id
-            except Exception:
-                pass
+            if self._item_paths.get(self.current_playing_track_id) == track.path:
+                tags.append("currently_playing")
+                self.current_playing_track_id = item_id
 
         self.tree.item(item_id, tags=tuple(tags))
 
     def _renumber_rows(self):
         """Update row numbers and alternating colors after insertions/deletions."""
-        for i, item_id in enumerate(self.tree.get_children()):
+        for i, item_id in enumerate(self._row_items):
             values = list(self.tree.item(item_id, 'values'))
             values[0] = i + 1
             self.tree.item(item_id, values=tuple(values))
@@ -746,45 +806,79 @@ class PlaylistTabView(ttk.Frame):
             # Clear any highlighting
             self.clear_search_results()
     
+    def toggle_add_track(self):
+        """Show or hide the add-track-by-search box"""
+        if self.add_track_frame:
+            self.close_add_track()
+        else:
+            self.show_add_track()
+
+    def show_add_track(self):
+        if self.add_track_frame:
+            self.add_track_frame.query_entry.focus_set()
+            return
+        self.add_track_frame = AddTrackFrame(
+            self.container,
+            self.controller.library_index.search,
+            self.controller.controller_actions.add_library_tracks,
+            self.close_add_track
+        )
+        self.add_track_frame.pack(side="bottom", fill="x", pady=(5, 0))
+        self._library_generation = None
+
+        # Show what is already indexed right away and pick up new files in the background
+        library_index = self.controller.library_index
+        library_index.load_search_index_async()
+        library_index.refresh_if_stale()
+        self._poll_library_index()
+
+    def close_add_track(self):
+        if self.add_track_frame:
+            self.add_track_frame.destroy()
+            self.add_track_frame = None
+            self.tree.focus_set()
+
+    LIBRARY_POLL_MS = 500
+
+    def _poll_library_index(self):
+        """Keep the add-track status current, re-running the query whenever the index is rebuilt."""
+        if not self.add_track_frame:
+            return
+        library_index = self.controller.library_index
+        search_index = library_index.search_index
+        if search_index.loaded:
+            status = f"{len(search_index):,} files"
+            if library_index.refreshing:
+                status += " (updating...)"
+        elif library_index.refreshing or library_index.loading:
+            status = "Loading library index..."
+        else:
+            status = "Set Library Folders under Settings > Paths to search your music"
+        self.add_track_frame.set_status(status)
+        if search_index.generation != self._library_generation:
+            self._library_generation = search_index.generation
+            self.add_track_frame.refresh()
+        if library_index.refreshing or library_index.loading:
+            self.after(self.LIBRARY_POLL_MS, self._poll_library_index)
+
     def perform_search(self, search_text="", search_number=""):
         """Search for text and/or number in the tree view"""
         self.clear_search_results()
         
         if not search_text and not search_number:
             return
-        
-        search_text = search_text.lower() if search_text else ""
-        search_number = search_number.strip() if search_number else ""
-        self.search_results = []
-        
-        # Search through all rows
-        for item_id in self.tree.get_children():
-            number_match = True
-            text_match = True
-            values = self.tree.item(item_id, 'values')
-            
-            # Check number search (matches against first column, index 0)
-            if search_number:
-                if len(values) > 0:
-                    number_str = str(values[0]).strip()
-                    number_match = (number_str == search_number or number_str.find(search_number) != -1)
-                else:
-                    number_match = False
-            
-            # Check text search (matches against all other columns, or all if no number search)
-            if search_text:
-                text_match = False
-                # If number search is active, only search other columns; otherwise search all
-                start_idx = 1 if search_number else 0
-                for i in range(start_idx, len(values)):
-                    if str(values[i]).lower().find(search_text) != -1:
-                        text_match = True
-                        break
-            
-            # Match if both conditions are met (or if only one search is active, that one matches)
-            if number_match and text_match:
-                self.search_results.append(item_id)
-                self.tree.item(item_id, tags=("search_match",))
+
+        # Search the model-backed index, then map model indices to tree rows by position
+        if not self._search_index.is_valid:
+            is_api_raw = self.check_for_no_large_play_time(self.playlist)
+            self._search_index.build(self.playlist, lambda track: self._format_track_fields(track, is_api_raw))
+        match_indexes = self._search_index.search(search_text, search_number)
+
+        children = self._row_items
+        self.search_results = [children[i] for i in match_indexes if i < len(children)]
+        for item_id in self.search_results:
+            self._set_search_tag(item_id, "search_match")
+        self._search_overlay = set(self.search_results)
         
         # If we found matches, highlight the first one
         if self.search_results:
@@ -837,12 +931,8 @@ class PlaylistTabView(ttk.Frame):
             self.tree.selection_set(item_id)
             self.tree.see(item_id)
             
-            current_tags = list(self.tree.item(item_id, 'tags'))
-            if "search_current" not in current_tags:
-                current_tags.append("search_current")
-            if "search_match" not in current_tags:
-                current_tags.append("search_match")
-            self.tree.item(item_id, tags=tuple(current_tags))
+            self._set_search_tag(item_id, "search_current")
+            self._search_overlay.add(item_id)
             # print(f"Successfully highlighted {item_id}")
             return # Successfully highlighted
 
@@ -862,19 +952,7 @@ class PlaylistTabView(ttk.Frame):
             return
             
         # Reset highlighting of the (now old) current match
-        if 0 <= self.current_match_index < len(self.search_results):
-            item_id = self.search_results[self.current_match_index]
-            if self.tree.exists(item_id):
-                # Attempt to set tags back to just 'search_match' if it was current
-                current_tags = list(self.tree.item(item_id, 'tags'))
-                if "search_current" in current_tags:
-                    current_tags.remove("search_current")
-                    # Ensure 'search_match' remains if it was a search result
-                    if "search_match" not in current_tags:
-                        current_tags.append("search_match") # Should already be there
-                    self.tree.item(item_id, tags=tuple(current_tags))
-                elif "search_match" in current_tags: # If it was only a match, ensure it stays that way
-                    self.tree.item(item_id, tags=("search_match",))
+        self._unhighlight_current_match()
         
         # Move to next logical match index
         self.current_match_index = (self.current_match_index + 1) % len(self.search_results)
@@ -886,47 +964,36 @@ class PlaylistTabView(ttk.Frame):
             return
             
         # Reset highlighting of the (now old) current match
-        if 0 <= self.current_match_index < len(self.search_results):
-            item_id = self.search_results[self.current_match_index]
-            if self.tree.exists(item_id):
-                # Attempt to set tags back to just 'search_match' if it was current
-                current_tags = list(self.tree.item(item_id, 'tags'))
-                if "search_current" in current_tags:
-                    current_tags.remove("search_current")
-                    if "search_match" not in current_tags:
-                        current_tags.append("search_match")
-                    self.tree.item(item_id, tags=tuple(current_tags))
-                elif "search_match" in current_tags:
-                    self.tree.item(item_id, tags=("search_match",))
+        self._unhighlight_current_match()
 
         # Move to previous logical match index
         self.current_match_index = (self.current_match_index - 1 + len(self.search_results)) % len(self.search_results) # Ensure positive index before modulo
         self.highlight_current_match() # This will handle highlighting the new valid item
+
+    def _unhighlight_current_match(self):
+        """Turn the current match back into a plain search match."""
+        if 0 <= self.current_match_index < len(self.search_results):
+            self._set_search_tag(self.search_results[self.current_match_index], "search_match")
         
     def clear_search_results(self):
         """Clear all search highlighting"""
-        # Reset all items to their original state
-        for item_id in self.tree.get_children():
-            # Check if it was a missing file
-            values = self.tree.item(item_id, 'values')
-            path = values[6] if len(values) > 6 else ""
-            track = next((t for t in self.playlist.tracks if t.path == path), None)
-            
-            # Preserve currently playing highlight if applicable
-            if item_id == self.current_playing_track_id:
-                if track and not track.exists:
-                    self.tree.item(item_id, tags=("missing_file", "currently_playing"))
-                else:
-                    self.tree.item(item_id, tags=("currently_playing",))
-            else:
-                if track and not track.exists:
-                    self.tree.item(item_id, tags=("missing_file",))
-                else:
-                    self.tree.item(item_id, tags=())
-                
+        # Only rows in the overlay carry search tags; strip those and keep the rest
+        # (striping, missing file, currently playing) exactly as they were.
+        for item_id in self._search_overlay:
+            self._set_search_tag(item_id, None)
+        self._search_overlay = set()
         self.search_results = []
         self.current_match_index = -1
-        
+
+    def _set_search_tag(self, item_id, search_tag):
+        """Replace the search tag on a row, leaving its other tags untouched."""
+        if not self.tree.exists(item_id):
+            return
+        tags = [t for t in self.tree.item(item_id, 'tags') if t not in SEARCH_TAGS]
+        if search_tag:
+            tags.append(search_tag)
+        self.tree.item(item_id, tags=tuple(tags))
+
     def update_current_playing_track(self):
         """Update the UI to highlight the currently playing track"""
         if self.playlist.type != Playlist.PlaylistType.API:
@@ -955,18 +1022,25 @@ class PlaylistTabView(ttk.Frame):
                     except Exception:
                         pass
                     self.current_playing_track_id = None
-                self.controller.notify_currently_playing(None, self, False)
+                if self._last_playing_state != (None, None, None):
+                    self._last_playing_state = (None, None, None)
+                    self.controller.notify_currently_playing(None, self, False)
                 return
 
             # Find the track in the tree view by position (handles duplicates correctly)
             found_item_id = None
             current_track = None
-            children = self.tree.get_children()
+            children = self._row_items
             if 0 <= current_track_pos < len(children):
                 found_item_id = children[current_track_pos]
                 if 0 <= current_track_pos < len(self.playlist.tracks):
                     current_track = self.playlist.tracks[current_track_pos]
 
+            # Steady state: same position, same row, same track, highlight intact -> nothing to do
+            state = (current_track_pos, found_item_id, current_track)
+            if state == self._last_playing_state and found_item_id == self.current_playing_track_id:
+                return
+
             # If the currently playing track changed, update the highlighting
             if found_item_id != self.current_playing_track_id:
                 # Remove highlight from previous track
@@ -988,12 +1062,14 @@ class PlaylistTabView(ttk.Frame):
                 # Update the current playing track ID
                 self.current_playing_track_id = found_item_id
 
+            self._last_playing_state = state
             if not found_item_id:
                 self.controller.notify_currently_playing(current_track, self, False, track_position=current_track_pos)
             else:
                 self.controller.notify_currently_playing(current_track, self, True, track_position=current_track_pos)
         except Exception as e:
             print(f"Error updating current playing track: {str(e)}")
+            self._last_playing_state = None
             self.controller.notify_currently_playing(None, self, False)
             
     def periodic_update_current_playing_track(self):
@@ -1017,15 +1093,14 @@ class PlaylistTabView(ttk.Frame):
             print(f"[DEBUG] No track_path, returning")
             return
 
-        children = self.tree.get_children()
+        children = self._row_items
         print(f"[DEBUG] Tree has {len(children)} children")
 
         # If position is provided and valid, use direct index lookup
         if position is not None and 0 <= position < len(children):
             item_id = children[position]
             # Verify the path matches (sanity check)
-            values = self.tree.item(item_id, 'values')
-            path = values[6] if len(values) > 6 else ""
+            path = self._item_paths.get(item_id, "")
             print(f"[DEBUG] Position-based lookup: position={position}, path_at_position={path}")
             if path == track_path:
                 print(f"[DEBUG] Path matches! Scrolling to item via position")
@@ -1034,14 +1109,13 @@ class PlaylistTabView(ttk.Frame):
             else:
                 print(f"[DEBUG] Path mismatch! Expected={track_path}, Got={path}. Falling back to path search.")
 
-        # Fallback to path-based search (finds first match)
-        for item_id in children:
-            values = self.tree.item(item_id, 'values')
-            path = values[6] if len(values) > 6 else ""
-            if path == track_path:
-                print(f"[DEBUG] Path search found match at item_id={item_id}")
-                self._scroll_to_item(item_id)
-                return
+        # Fallback to path lookup (first match)
+        rows = self._path_rows.get(track_path)
+        if rows:
+            item_id = children[rows[0]]
+            print(f"[DEBUG] Path search found match at item_id={item_id}")
+            self._scroll_to_item(item_id)
+            return
 
         print(f"[DEBUG] Path search found NO match for track_path={track_path}")
 
@@ -1054,7 +1128,7 @@ class PlaylistTabView(ttk.Frame):
             # Attempt to center the item within the viewport for better context
             self.tree.update_idletasks()
 
-            total_items = len(self.tree.get_children())
+            total_items = len(self._row_items)
             if total_items <= 0:
                 return
 
@@ -1071,7 +1145,9 @@ class PlaylistTabView(ttk.Frame):
             widget_height = max(1, self.tree.winfo_height())
             visible_rows = max(1, widget_height // row_height)
 
-            item_index = self.tree.index(item_id)
+            item_index = self._item_rows.get(item_id)
+            if item_index is None:
+                item_index = self.tree.index(item_id)
             top_index = max(0, min(total_items - visible_rows, item_index - visible_rows // 2))
 
             if total_items > 0:
@@ -1,4 +1,4 @@
-from tkinter import ttk, Menu, Entry, Frame, StringVar, Label, Toplevel
+from tkinter import ttk, Menu, Entry, Frame, StringVar, Label, Toplevel, Listbox
 import utils
 from font_config import DEFAULT_FONT, BOLD_FONT, DEFAULT_FONT_TUPLE
 
@@ -17,8 +17,13 @@ class PlaylistTabContextMenu:
         self.context_menu.add_command(label="Open File Location", command=self.parent.controller.open_file_location)
         self.context_menu.add_command(label="Open in Audacity", command=self.parent.controller.open_in_audacity)
         self.context_menu.add_command(label="Convert to MP3", command=self.parent.controller.controller_actions.convert_tracks_to_mp3)
+        self.context_menu.add_command(label="Conversion Progress", command=self.parent.controller.controller_actions.show_conversion_jobs)
+        self.context_menu.add_command(label="Check Playlist for Silence", command=self.parent.controller.controller_actions.detect_silence_in_playlist)
+        self.context_menu.add_command(label="Scan Playlist Loudness", command=self.parent.controller.controller_actions.scan_playlist_loudness)
+        self.context_menu.add_command(label="Verify Exact Durations", command=self.parent.controller.controller_actions.verify_exact_durations)
         self.context_menu.add_separator()
         self.context_menu.add_command(label="Search with Everything", command=self.parent.controller.search_with_everything)
+        self.context_menu.add_command(label="Relink Missing Tracks", command=self.parent.controller.controller_actions.relink_missing_tracks)
         self.context_menu.add_separator()
         self.context_menu.add_command(label="Rename File Path", command=self.parent.controller.controller_actions.rename_track_file_path_dialog)
         self.context_menu.add_command(label="Rename by Browsing", command=self.parent.controller.controller_actions.rename_track_by_browsing_dialog)
@@ -28,6 +33,7 @@ class PlaylistTabContextMenu:
         self.context_menu.add_command(label="Reload Remote Playlist", command=self.parent.controller.controller_actions.reload_api_playlist_action)
         self.context_menu.add_separator()
         self.context_menu.add_command(label="Calculate Start Times", command=self.parent.controller.controller_actions.open_calculate_start_times_dialog)
+        self.context_menu.add_command(label="Schedule Summary", command=self.parent.controller.controller_actions.show_schedule_summary)
 
 
     def show(self, event):
@@ -95,8 +101,10 @@ class PlaylistTabTreeView(ttk.Treeview):
     def __init__(self, parent, callbacks):
         self.parent = parent
         self.callbacks = callbacks
-        self.columns = ["#", "Start Time", "•", "Artist", "Title", "Duration", "Path"]
+        # Loudness columns come last in the row values (so existing indexes hold) but show before Path
+        self.columns = ["#", "Start Time", "•", "Artist", "Title", "Duration", "Path", "LUFS", "Peak"]
         super().__init__(parent, columns=self.columns, show="headings")
+        self.configure(displaycolumns=["#", "Start Time", "•", "Artist", "Title", "Duration", "LUFS", "Peak", "Path"])
         
         # Apply font to treeview
         self.configure(style="Treeview")
@@ -110,6 +118,9 @@ class PlaylistTabTreeView(ttk.Treeview):
         # Set Headings with improved styling
         for col in self.columns:
             self.heading(col, text=col.title())
+        # Clicking a loudness heading sorts the playlist by that value
+        for col in ("LUFS", "Peak"):
+            self.heading(col, text=col, command=lambda c=col: self.callbacks["sort_by_column"](c))
 
         # Improved column widths and styling
         self.column("#", width=50, stretch=False, anchor="center")
@@ -119,6 +130,8 @@ class PlaylistTabTreeView(ttk.Treeview):
         self.column("Title", width=220, stretch=True)
         self.column("Duration", width=90, anchor="center", stretch=False)
         self.column("Path", width=150, stretch=True)
+        self.column("LUFS", width=60, anchor="e", stretch=False)
+        self.column("Peak", width=60, anchor="e", stretch=False)
         
         # Configure tags for row styling using theme colors
         self.refresh_theme_colors()
@@ -129,6 +142,7 @@ class PlaylistTabTreeView(ttk.Treeview):
         self.tag_configure("search_match", background="#E8F0FE")
         self.tag_configure("search_current", background="#BBDEFB")
         self.tag_configure("currently_playing", background="#E0FFE0")
+        self.tag_configure("dead_air", background="#FFE8CC")
         
         # Add alternating row colors for better readability
         self.tag_configure("even_row", background="#F9F9F9")
@@ -155,6 +169,7 @@ class PlaylistTabTreeView(ttk.Treeview):
         self.bind("<B1-Motion>", self._on_dragged)
         self.bind("<ButtonRelease-1>", self._on_button_up)
         self.bind("<Double-1>", self.callbacks["double_click"])
+        self.bind("<<TreeviewSelect>>", self._on_selection_changed)
 
     def _on_leave(self, event):
         """Handle mouse leaving the treeview - hide tooltip."""
@@ -175,6 +190,10 @@ class PlaylistTabTreeView(ttk.Treeview):
             self.callbacks["on_interaction"](event)
         self.callbacks["dragged"](event)
 
+    def _on_selection_changed(self, event):
+        if "selection_changed" in self.callbacks:
+            self.callbacks["selection_changed"](event)
+
     def _on_button_up(self, event):
         """Handle button up - forward to callback."""
         self.callbacks["button_up"](event)
@@ -204,14 +223,14 @@ class PlaylistTabTreeView(ttk.Treeview):
             self.hover_column = None
             return
 
-        # Get column index (columns are numbered #1, #2, etc.)
+        # Display position (#1, #2, ...) -> column name; display order differs from value order
         try:
-            column_idx = int(column[1:]) - 1
-        except (ValueError, IndexError):
+            column_id = self.column(column, "id")
+        except Exception:
             return
 
-        # Check if hovering over the Path column (index 6)
-        if column_idx == 6:  # Path is the 7th column (index 6)
+        # Check if hovering over the Path column (value index 6)
+        if column_id == "Path":
             values = self.item(item, 'values')
             if len(values) > 6 and values[6]:  # Make sure path exists
                 # Store current position for delayed tooltip
@@ -228,6 +247,9 @@ class PlaylistTabTreeView(ttk.Treeview):
 
 
 class SearchFrame(Frame):
+    # Delay after the last keystroke before the search runs
+    SEARCH_DEBOUNCE_MS = 120
+
     def __init__(self, parent, search_callback, close_callback, next_callback=None, prev_callback=None):
         super().__init__(parent, bg="#F0F0F0", relief="ridge", borderwidth=2)
         self.parent = parent
@@ -242,10 +264,13 @@ class SearchFrame(Frame):
         
         # Flag to prevent recursion when clearing fields
         self._clearing_field = False
+
+        # Pending debounced search (Tk after() job id)
+        self._search_job = None
         
         def update_search(*args):
             if not self._clearing_field:
-                self.search_callback(self.search_var.get(), self.number_var.get())
+                self._schedule_search()
         
         def on_search_change(*args):
             if self._clearing_field:
@@ -346,7 +371,7 @@ class SearchFrame(Frame):
                 text="△", 
                 width=3, 
                 style="Search.TButton",
-                command=prev_callback
+                command=lambda: self._navigate(prev_callback)
             )
             prev_button.pack(side="left", padx=2)
         
@@ -357,7 +382,7 @@ class SearchFrame(Frame):
                 text="▽", 
                 width=3,
                 style="Search.TButton",
-                command=next_callback
+                command=lambda: self._navigate(next_callback)
             )
             next_button.pack(side="left", padx=2)
         
@@ -373,13 +398,176 @@ class SearchFrame(Frame):
         
         # Bind keys
         self.search_entry.bind("<Escape>", lambda event: self.close_callback())
-        self.search_entry.bind("<Return>", lambda event: self.next_callback() if self.next_callback else None)
-        self.search_entry.bind("<Shift-Return>", lambda event: self.prev_callback() if self.prev_callback else None)
-        self.search_entry.bind("<F3>", lambda event: self.next_callback() if self.next_callback else None)
-        self.search_entry.bind("<Shift-F3>", lambda event: self.prev_callback() if self.prev_callback else None)
+        self.search_entry.bind("<Return>", lambda event: self._navigate(self.next_callback))
+        self.search_entry.bind("<Shift-Return>", lambda event: self._navigate(self.prev_callback))
+        self.search_entry.bind("<F3>", lambda event: self._navigate(self.next_callback))
+        self.search_entry.bind("<Shift-F3>", lambda event: self._navigate(self.prev_callback))
+
+    def _schedule_search(self):
+        """Debounce keystrokes so fast typing runs one search instead of one per key."""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DEBOUNCE_MS, self.flush_pending_search)
+
+    def flush_pending_search(self):
+        """Run a pending debounced search immediately (if there is one)."""
+        if self._search_job is None:
+            return
+        try:
+            self.after_cancel(self._search_job)
+        except Exception:
+            pass
+        self._search_job = None
+        self.search_callback(self.search_var.get(), self.number_var.get())
+
+    def _navigate(self, callback):
+        """Jump to next/previous match, making sure results reflect what was typed."""
+        self.flush_pending_search()
+        if callback:
+            callback()
+
+    def destroy(self):
+        if self._search_job is not None:
+            try:
+                self.after_cancel(self._search_job)
+            except Exception:
+                pass
+            self._search_job = None
+        super().destroy()
         
     def get_search_text(self):
         return self.search_var.get()
     
     def get_search_number(self):
-        return self.number_var.get()
\ No newline at end of file
+        return self.number_var.get()
+
+class AddTrackFrame(Frame):
+    """Search box over the library index; picked results are inserted into the playlist.
+
+    search_callback(query) returns library entries (path, artist, title,
+    duration) and insert_callback(entries) adds them after the selection.
+    """
+
+    SEARCH_DEBOUNCE_MS = 60
+    RESULT_ROWS = 8
+
+    def __init__(self, parent, search_callback, insert_callback, close_callback):
+        super().__init__(parent, bg="#F0F0F0", relief="ridge", borderwidth=2)
+        self.search_callback = search_callback
+        self.insert_callback = insert_callback
+        self.close_callback = close_callback
+        self._results = []
+        self._search_job = None
+
+        bg_color = "#F0F0F0"
+        fg_color = "#505050"
+        entry_bg = "#FFFFFF"
+        entry_highlight = "#0078D7"
+        entry_border = "#E0E0E0"
+
+        inner_frame = Frame(self, bg=bg_color)
+        inner_frame.pack(fill="both", expand=True, padx=10, pady=8)
+
+        top_row = Frame(inner_frame, bg=bg_color)
+        top_row.pack(side="top", fill="x")
+        Label(top_row, text="Add Track", font=("Segoe UI", 13, "normal"), bg=bg_color, fg=fg_color).pack(
+            side="left", padx=(0, 8))
+
+        self.query_var = StringVar()
+        self.query_var.trace_add("write", lambda *args: self._schedule_search())
+        self.query_entry = Entry(
+            top_row,
+            textvariable=self.query_var,
+            width=45,
+            font=("Segoe UI", 11),
+            relief="flat",
+            borderwidth=0,
+            highlightthickness=2,
+            highlightbackground=entry_border,
+            highlightcolor=entry_highlight,
+            bg=entry_bg,
+            insertbackground=entry_highlight
+        )
+        self.query_entry.pack(side="left", padx=5, ipady=5)
+        self.query_entry.focus_set()
+
+        style = ttk.Style()
+        style.configure("Search.TButton", padding=5)
+        ttk.Button(top_row, text="Insert", style="Search.TButton", command=self.insert_selected).pack(
+            side="left", padx=2)
+        ttk.Button(top_row, text="✕", width=3, style="Search.TButton", command=self.close_callback).pack(
+            side="left", padx=(8, 0))
+
+        self.status_label = Label(top_row, text="", font=("Segoe UI", 9, "italic"), bg=bg_color, fg=fg_color)
+        self.status_label.pack(side="left", padx=10)
+
+        self.results_list = Listbox(
+            inner_frame,
+            height=self.RESULT_ROWS,
+            font=DEFAULT_FONT_TUPLE,
+            selectmode="extended",
+            activestyle="none",
+            relief="flat",
+            highlightthickness=1,
+            highlightbackground=entry_border,
+            exportselection=False
+        )
+        self.results_list.pack(side="top", fill="x", pady=(6, 0))
+
+        self.query_entry.bind("<Escape>", lambda event: self.close_callback())
+        self.query_entry.bind("<Return>", lambda event: self.insert_selected())
+        self.query_entry.bind("<Down>", lambda event: self._move_selection(1))
+        self.query_entry.bind("<Up>", lambda event: self._move_selection(-1))
+        self.results_list.bind("<Escape>", lambda event: self.close_callback())
+        self.results_list.bind("<Return>", lambda event: self.insert_selected())
+        self.results_list.bind("<Double-Button-1>", lambda event: self.insert_selected())
+
+    def _schedule_search(self):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DEBOUNCE_MS, self.refresh)
+
+    def refresh(self):
+        """Run the current query again (also after the library index has been (re)loaded)."""
+        self._search_job = None
+        query = self.query_var.get()
+        self._results = self.search_callback(query) if query.strip() else []
+        self.results_list.delete(0, "end")
+        for entry in self._results:
+            name = f"{entry.artist} - {entry.title}" if entry.artist or entry.title else entry.path
+            self.results_list.insert("end", f"{name}   {utils.format_duration(entry.duration)}   {entry.path}")
+        if self._results:
+            self.results_list.selection_set(0)
+            self.results_list.see(0)
+
+    def set_status(self, text: str):
+        self.status_label.configure(text=text)
+
+    def _move_selection(self, step: int):
+        if not self._results:
+            return "break"
+        selected = self.results_list.curselection()
+        index = min(max((selected[0] if selected else -1) + step, 0), len(self._results) - 1)
+        self.results_list.selection_clear(0, "end")
+        self.results_list.selection_set(index)
+        self.results_list.see(index)
+        return "break"
+
+    def insert_selected(self):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+            self.refresh()
+        entries = [self._results[i] for i in self.results_list.curselection() if i < len(self._results)]
+        if entries:
+            self.insert_callback(entries)
+            self.query_entry.focus_set()
+        return "break"
+
+    def destroy(self):
+        if self._search_job is not None:
+            try:
+                self.after_cancel(self._search_job)
+            except Exception:
+                pass
+            self._search_job = None
+        super().destroy()
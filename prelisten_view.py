@@ -7,6 +7,7 @@ import time
 import logging
 from font_config import DEFAULT_FONT, BOLD_FONT, DEFAULT_FONT_TUPLE
 from audio_converter import AudioConverter
+import ui_dispatcher
 from models.playlist import Playlist
 
 
@@ -43,6 +44,12 @@ class PrelistenView(tk.Frame):
         self._audio_loaded = False
         # Tk after() job id for auto-play
         self._auto_play_job = None
+        # Local prefetch cache (shared, owned by the controller) and the file pygame actually loaded
+        self._cache = getattr(getattr(parent, "controller", None), "prelisten_cache", None)
+        self._loaded_source = None
+        # Waveform overview (shared peak store, owned by the controller)
+        self._waveform_store = getattr(getattr(parent, "controller", None), "waveform_peaks", None)
+        self._peaks = None
         
         # Initialize pygame mixer with high quality settings and larger buffer to prevent crackling
         if not pygame.mixer.get_init():
@@ -93,6 +100,13 @@ class PrelistenView(tk.Frame):
         # Progress bar
         self.progress_frame = tk.Frame(self, bg=prelisten_bg)
         self.progress_frame.pack(fill="x", padx=10, pady=5)
+
+        # Waveform overview behind the slider; click to seek
+        self.waveform_canvas = tk.Canvas(self.progress_frame, height=48, bg=prelisten_bg,
+                                         highlightthickness=0, cursor="hand2")
+        self.waveform_canvas.pack(fill="x", expand=True)
+        self.waveform_canvas.bind("<Configure>", lambda event: self._draw_waveform())
+        self.waveform_canvas.bind("<Button-1>", self._on_waveform_click)
         
         self.progress_bar = ttk.Scale(self.progress_frame, from_=0, to=100, orient="horizontal", 
                                       command=self.seek_position)
@@ -178,8 +192,8 @@ class PrelistenView(tk.Frame):
             # Set volume to 100% for best quality
             pygame.mixer.music.set_volume(1.0)
             
-            # Load the audio file
-            pygame.mixer.music.load(self.track_path)
+            # Load the audio file (from the local prefetch copy when there is one)
+            self._load_source()
             
             self.track_length = self.track.duration
             
@@ -190,6 +204,7 @@ class PrelistenView(tk.Frame):
             self.status_label.config(text="Ready to play")
             self.time_label.config(text=f"0:00 / {self.format_time(self.track_length)}")
             self.progress_bar.config(to=self.track_length)
+            self._load_waveform()
             # Start the UI updater loop (Tk main thread)
             self._start_ui_updater()
             
@@ -225,6 +240,105 @@ class PrelistenView(tk.Frame):
                     print(f"Error during conversion attempt: {_console_safe(conv_error)}")
                     self.status_label.config(text=f"Conversion failed: {str(conv_error)}")
     
+    def _load_source(self):
+        """Load the cached local copy if available, else the original (and cache it for seeking)."""
+        local = self._cache.local_path(self.track_path) if self._cache else None
+        source = local or self.track_path
+        pygame.mixer.music.load(source)
+        self._set_loaded_source(source)
+        if self._cache and not local:
+            self._cache.prefetch([self.track_path])
+        try:
+            # Neighbours too, so stepping to the next track starts instantly
+            self.view_parent.controller.prefetch_prelisten_tracks(self.track)
+        except Exception:
+            pass
+
+    def _set_loaded_source(self, source):
+        if self._cache:
+            if self._loaded_source and self._loaded_source != self.track_path:
+                self._cache.unpin(self.track_path)
+            if source != self.track_path:
+                self._cache.pin(self.track_path)
+        self._loaded_source = source
+
+    def _switch_to_cached_copy(self):
+        """If the local copy finished after playback started, move over to it (at a seek)."""
+        if not self._cache or self._loaded_source != self.track_path:
+            return
+        local = self._cache.local_path(self.track_path)
+        if local:
+            pygame.mixer.music.load(local)
+            self._set_loaded_source(local)
+
+    def _load_waveform(self):
+        """Show the track's peaks: straight from the disk cache, else extracted in the background."""
+        store = self._waveform_store
+        if store is None or not store.available():
+            self.waveform_canvas.pack_forget()
+            return
+        path = self.track_path
+        peaks = store.get_cached(path)
+        if peaks is not None:
+            self._show_waveform(path, peaks)
+            return
+        self._peaks = None
+        self._draw_waveform()
+        decode_path = self._cache.local_path(path) if self._cache else None
+
+        def on_done(peaks):
+            ui_dispatcher.submit(self, "waveform", lambda: self._show_waveform(path, peaks))
+
+        store.request(path, on_done, decode_path=decode_path)
+
+    def _show_waveform(self, path, peaks):
+        if path != self.track_path or not self.winfo_exists():
+            return
+        self._peaks = peaks
+        self._draw_waveform()
+
+    def _draw_waveform(self):
+        canvas = self.waveform_canvas
+        canvas.delete("all")
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return
+        middle = height / 2
+        peaks = self._peaks
+        if peaks is None:
+            canvas.create_line(0, middle, width, middle, fill="#c0c0c0")
+        else:
+            # One polygon: maxima left to right, then minima back
+            columns = len(peaks.maxs)
+            scale = middle / 128.0
+            top = []
+            bottom = []
+            for x in range(width):
+                column = x * columns // width
+                top.extend((x, middle - int(peaks.maxs[column]) * scale))
+                bottom.extend((x, middle - int(peaks.mins[column]) * scale))
+            for i in range(len(bottom) - 2, -1, -2):
+                top.extend((bottom[i], bottom[i + 1]))
+            canvas.create_polygon(top, fill="#7a9cc6", outline="#5a7ca6")
+        canvas.create_line(0, 0, 0, height, fill="#d04040", width=2, tags="playhead")
+        self._update_playhead()
+
+    def _update_playhead(self):
+        width = self.waveform_canvas.winfo_width()
+        height = self.waveform_canvas.winfo_height()
+        fraction = self.current_position / self.track_length if self.track_length else 0.0
+        x = max(0.0, min(1.0, fraction)) * width
+        self.waveform_canvas.coords("playhead", x, 0, x, height)
+
+    def _on_waveform_click(self, event):
+        width = self.waveform_canvas.winfo_width()
+        if not self.track_length or width <= 1:
+            return
+        position = max(0.0, min(1.0, event.x / width)) * self.track_length
+        self.progress_bar.set(position)
+        self._update_playhead()
+
     def _cancel_auto_play(self):
         """Cancel any pending auto-play call"""
         if self._auto_play_job is not None:
@@ -260,7 +374,7 @@ class PrelistenView(tk.Frame):
                 # If mixer isn't ready, try loading again
                 print("Auto-play: audio not loaded, reloading...")
                 try:
-                    pygame.mixer.music.load(self.track_path)
+                    self._load_source()
                     pygame.mixer.music.set_volume(1.0)
                     self._audio_loaded = True
                 except Exception as load_error:
@@ -292,6 +406,7 @@ class PrelistenView(tk.Frame):
                 pygame.mixer.music.set_volume(1.0)
                 
                 # Start playback from current position or beginning
+                self._switch_to_cached_copy()
                 if self.current_position > 0:
                     self._playback_start_offset = float(self.current_position)
                     pygame.mixer.music.play(start=self.current_position)
@@ -324,10 +439,12 @@ class PrelistenView(tk.Frame):
         try:
             position = float(value)
             self.current_position = position
+            self._update_playhead()
             
-            # If currently playing, restart at new position
+            # If currently playing, restart at new position (from local disk once cached)
             if self.playing:
                 pygame.mixer.music.stop()
+                self._switch_to_cached_copy()
                 self._playback_start_offset = position
                 pygame.mixer.music.play(start=position)
             
@@ -370,6 +487,7 @@ class PrelistenView(tk.Frame):
                     # Update UI without triggering seek
                     self._internal_update = True
                     self.progress_bar.set(self.current_position)
+                    self._update_playhead()
                     self.time_label.config(
                         text=f"{self.format_time(self.current_position)} / {self.format_time(self.track_length)}"
                     )
@@ -384,6 +502,7 @@ class PrelistenView(tk.Frame):
                     self._playback_start_offset = 0.0
                     self._internal_update = True
                     self.progress_bar.set(0.0)
+                    self._update_playhead()
                     self.time_label.config(text=f"0:00 / {self.format_time(self.track_length)}")
                     self._internal_update = False
 
@@ -412,6 +531,8 @@ class PrelistenView(tk.Frame):
                 pygame.mixer.music.stop()
             self.playing = False
             self._audio_loaded = False
+            if self._cache and self._loaded_source and self._loaded_source != self.track_path:
+                self._cache.unpin(self.track_path)
             
             # Call the callback to notify parent
             if self.on_close_callback:
@@ -431,4 +552,5 @@ class PrelistenView(tk.Frame):
         self.playback_frame.config(bg=prelisten_bg)
         self.time_label.config(bg=prelisten_bg)
         self.progress_frame.config(bg=prelisten_bg)
+        self.waveform_canvas.config(bg=prelisten_bg)
         self.status_label.config(bg=prelisten_bg)
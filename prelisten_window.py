@@ -5,6 +5,7 @@ import os
 import threading
 import time
 import logging
+import ui_dispatcher
 
 # Configure logging once for the module
 logging.basicConfig(level=logging.DEBUG,
@@ -195,15 +196,25 @@ class PrelistenWindow(tk.Frame):
                 # Simple formatter without time to keep log concise in UI
                 self.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
 
+                # Lines emitted between UI ticks are buffered and inserted in one go
+                self._buffer = []
+                self._buffer_lock = threading.Lock()
+
             def emit(self, record):
                 msg = self.format(record) + "\n"
+                with self._buffer_lock:
+                    self._buffer.append(msg)
                 # Ensure thread-safe insert
-                self.text_widget.after(0, self._append, msg)
+                ui_dispatcher.submit(self.text_widget, "log", self._flush)
 
-            def _append(self, msg):
+            def _flush(self):
+                with self._buffer_lock:
+                    msgs, self._buffer = self._buffer, []
+                if not msgs:
+                    return
                 # Append and auto-scroll
                 self.text_widget.configure(state="normal")
-                self.text_widget.insert("end", msg)
+                self.text_widget.insert("end", "".join(msgs))
                 self.text_widget.yview_moveto(1.0)
                 self.text_widget.configure(state="disabled")
         # Instantiate and add to root logger
@@ -232,7 +243,7 @@ class PrelistenWindow(tk.Frame):
                         self._last_log_time = time.time()
                         logging.debug(f"update_progress | pos={current_position:.3f}s | busy={pygame.mixer.music.get_busy()} | elapsed_ms={elapsed_ms}")
                     # Schedule UI updates on the Tkinter main loop
-                    self.after(0, self._update_ui, current_position, False)
+                    ui_dispatcher.submit(self, "progress", lambda pos=current_position: self._update_ui(pos, False))
 
                 # Detect end of track using get_busy()
                 if not pygame.mixer.music.get_busy():
@@ -240,7 +251,7 @@ class PrelistenWindow(tk.Frame):
                     self.is_playing = False
                     self.is_paused = False
                     self.playback_start_offset = 0.0
-                    self.after(0, self._update_ui, self.duration, True)
+                    ui_dispatcher.submit(self, "progress", lambda: self._update_ui(self.duration, True))
 
             time.sleep(0.1)  # Update 10 times per second
         logging.debug("Background update thread terminating.")
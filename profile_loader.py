@@ -124,14 +124,19 @@ class ProfileLoader:
                     else:
                         print(f"Warning: Skipping API playlist without source_id (legacy format)")
                 else:
-                    # For regular playlists, load them directly
-                    self.controller.load_playlist(playlist_info["path"], playlist_info["title"])
+                    # Regular playlists start as placeholders; their files are all read
+                    # concurrently below, and the visible one gets its rows first
+                    self.controller.load_playlist(playlist_info["path"], playlist_info["title"], lazy=True)
 
             # Update UI - this will handle showing the Remote Playlist if needed
             self.controller.controller_actions.reload_open_playlists()
 
             # Set as current profile
             persistence.set_current_profile(profile_name)
+
+            tabs = notebook_view.get_tabs()
+            self.controller.controller_actions.restore_placeholder_tabs(
+                tabs, notebook_view.get_selected_tab() if tabs else None)
         finally:
             # Re-enable auto-save after profile load completes (even if something fails).
             setattr(self.controller, "_is_loading_profile", False)
@@ -190,6 +195,7 @@ class ProfileLoader:
             
         # Save to profile
         persistence.save_profile_settings(playlists, profile_name)
+        self.controller.playlist_service.write_snapshot()
         print(f"Profile {profile_name} saved with {len(playlists)} playlists")
         
         # Update window title
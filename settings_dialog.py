@@ -10,12 +10,12 @@ Currently exposes settings for:
 - Paths & Network
 - Migration
 
-On Apply / OK the ``config.json`` file is rewritten and the application styles
-are updated at runtime by calling ``font_config.configure_ttk_styles``.
+On Apply / OK the ``config.json`` file is rewritten through ``app_config``,
+whose subscribers (e.g. ``font_config.watch_config``) update the application
+at runtime.
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
 import re
@@ -25,10 +25,9 @@ from tkinter import ttk, messagebox, filedialog
 from tkinter import font as tkfont
 from copy import deepcopy
 
-import font_config
 import app_config
 
-CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.json")
+CONFIG_PATH = app_config.CONFIG_PATH
 
 logger = logging.getLogger(__name__)
 
@@ -47,14 +46,12 @@ DEFAULT_CONFIG: dict = {
 
 
 def load_config() -> dict:
-    """Load the JSON configuration file, returning an empty dict on failure."""
+    """Return an editable copy of the shared configuration, or an empty dict on failure."""
     if not os.path.exists(CONFIG_PATH):
         logger.warning("Config file not found at %s; using defaults.", CONFIG_PATH)
-        return {}
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = json.load(f)
-        return config
+        # The dialog edits its own copy; app_config stays untouched until Apply
+        return deepcopy(app_config.get_config())
     except Exception as exc:
         logger.exception("Failed to load config.json: %s", exc)
         messagebox.showerror("Settings Error", f"Failed to load settings file:\n{exc}")
@@ -62,10 +59,9 @@ def load_config() -> dict:
 
 
 def save_config(data: dict) -> None:
-    """Persist *data* as JSON to ``config.json`` with indentation."""
+    """Persist *data* to ``config.json`` through app_config (which notifies subscribers)."""
     try:
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        app_config.save_config(data)
     except Exception as exc:
         logger.exception("Failed to save config.json: %s", exc)
         messagebox.showerror("Settings Error", f"Failed to save settings file:\n{exc}")
@@ -81,7 +77,7 @@ class SettingsDialog(tk.Toplevel):
     CATEGORY_REMOTE_SOURCES = "Remote Sources"
     CATEGORY_MIGRATION = "Migration"
 
-    def __init__(self, master: tk.Tk, on_apply=None):
+    def __init__(self, master: tk.Tk, on_apply=None, persistence=None):
         super().__init__(master)
         self.title("Settings")
         self.geometry("850x600")
@@ -96,6 +92,8 @@ class SettingsDialog(tk.Toplevel):
         self.geometry(f"+{x}+{y}")
 
         self.on_apply = on_apply
+        # Profiles (settings.json) are imported/exported through the app's Persistence
+        self.persistence = persistence
 
         # Load configuration
         self.config_data = load_config()
@@ -186,6 +184,7 @@ class SettingsDialog(tk.Toplevel):
 
         playlists_dir = self._get_setting_var(("paths","playlists_dir"), tk.StringVar, default="")
         intros_dir = self._get_setting_var(("paths","intros_dir"), tk.StringVar, default="")
+        library_roots = self._get_setting_var(("paths","library_roots"), tk.StringVar, default="")
 
         # Helper row builder
         def make_row(row:int, label:str, var:tk.StringVar, browse:bool=False, is_dir:bool=True):
@@ -202,10 +201,21 @@ class SettingsDialog(tk.Toplevel):
         make_row(0,"Playlists Directory",playlists_dir,browse=True,is_dir=True)
         make_row(1,"Intros Directory",intros_dir,browse=True,is_dir=True)
 
+        # Library folders: ';'-separated, and browsing adds a folder rather than replacing
+        ttk.Label(frm,text="Library Folders").grid(row=2,column=0,sticky=tk.W,pady=3,padx=5)
+        ttk.Entry(frm,textvariable=library_roots,width=50).grid(row=2,column=1,sticky=tk.EW,pady=3,padx=5)
+        def add_library_root():
+            from tkinter import filedialog
+            path = filedialog.askdirectory()
+            if path:
+                current = [p for p in library_roots.get().split(";") if p.strip()]
+                library_roots.set(";".join(current + [path]))
+        ttk.Button(frm,text="+",command=add_library_root,width=3).grid(row=2,column=2,sticky=tk.W)
+
         # Note about remote sources
         note = ttk.Label(frm, text="Note: Remote station URLs are now configured in the 'Remote Sources' category.",
                         font=("Segoe UI", 9, "italic"))
-        note.grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=(15, 5), padx=5)
+        note.grid(row=3, column=0, columnspan=3, sticky=tk.W, pady=(15, 5), padx=5)
 
         frm.columnconfigure(1,weight=1)
 
@@ -557,22 +567,10 @@ class SettingsDialog(tk.Toplevel):
             return
         self._update_config_from_vars()
         
+        # app_config notifies its subscribers (ttk styles, remote sources, ...)
+        # of the sections that changed
         save_config(self.config_data)
-        # Reload the config in memory so app_config.get() returns updated values
-        app_config.reload_config()
-
-        # Reload remote sources registry if it exists
-        try:
-            from PlaylistService.api_playlist_manager import RemotePlaylistRegistry
-            RemotePlaylistRegistry().reload()
-        except ImportError:
-            pass  # RemotePlaylistRegistry may not be available during initial setup
 
-        try:
-            font_config.configure_ttk_styles()
-        except Exception:
-            # Capture but still keep dialog open
-            logger.exception("Failed to reconfigure ttk styles after settings apply")
         # Notify caller if provided
         if callable(self.on_apply):
             try:
@@ -597,8 +595,6 @@ class SettingsDialog(tk.Toplevel):
     def ok_clicked(self):
         self.apply_clicked()
         self.destroy()
-        # Reload config one more time to ensure it's current
-        app_config.reload_config()
 
     # -----------------
     # Migration methods
@@ -631,13 +627,12 @@ class SettingsDialog(tk.Toplevel):
                 messagebox.showerror("Error", f"config.json not found in deployment directory:\n{deployment_path}")
                 return
             
-            settings_path = os.path.join(os.path.dirname(__file__), "settings.json")
-            if os.path.exists(source_settings):
-                shutil.copy2(source_settings, settings_path)
+            if os.path.exists(source_settings) and self.persistence is not None:
+                self.persistence.reload_from(source_settings)
             
             # Reload config after import
-            self.config_data = load_config()
             app_config.reload_config()
+            self.config_data = load_config()
         except Exception as exc:
             logger.exception("Failed to import config files")
             messagebox.showerror("Error", f"Failed to import config files:\n{exc}")
@@ -661,9 +656,8 @@ class SettingsDialog(tk.Toplevel):
             if os.path.exists(CONFIG_PATH):
                 shutil.copy2(CONFIG_PATH, target_config)
             
-            settings_path = os.path.join(os.path.dirname(__file__), "settings.json")
-            if os.path.exists(settings_path):
-                shutil.copy2(settings_path, target_settings)
+            if self.persistence is not None:
+                self.persistence.export_to(target_settings)
         except Exception as exc:
             logger.exception("Failed to export config files")
             messagebox.showerror("Error", f"Failed to export config files:\n{exc}")
@@ -0,0 +1,73 @@
+import os
+import tkinter as tk
+from tkinter import ttk
+
+
+class SilenceReportWindow(tk.Toplevel):
+    """Progress of a silence analysis run and the tracks it flagged."""
+
+    def __init__(self, parent, playlist_title: str, total: int, on_cancel):
+        super().__init__(parent)
+        self.title(f"Silence Check - {playlist_title}")
+        self.geometry("720x360")
+        self.transient(parent)
+        self.total = total
+        self.done = 0
+        self.flagged = 0
+        self.failed = 0
+        self.on_cancel = on_cancel
+
+        self.progress = ttk.Progressbar(self, maximum=max(total, 1))
+        self.progress.pack(fill="x", padx=8, pady=(8, 4))
+
+        self.tree = ttk.Treeview(self, columns=("file", "silence"), show="headings")
+        self.tree.heading("file", text="File")
+        self.tree.heading("silence", text="Silence")
+        self.tree.column("file", width=320, anchor="w")
+        self.tree.column("silence", width=360, anchor="w")
+        self.tree.pack(fill="both", expand=True, padx=8, pady=4)
+
+        button_frame = tk.Frame(self)
+        button_frame.pack(fill="x", padx=8, pady=(0, 8))
+        self.summary_label = tk.Label(button_frame, anchor="w")
+        self.summary_label.pack(side="left", fill="x", expand=True)
+        ttk.Button(button_frame, text="Close", command=self.close).pack(side="right", padx=(4, 0))
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.cancel)
+        self.cancel_button.pack(side="right")
+
+        self._update_summary()
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+    def add_result(self, path: str, report):
+        if not self.winfo_exists():
+            return
+        self.done += 1
+        if report is None:
+            self.failed += 1
+        elif report.flagged:
+            self.flagged += 1
+            self.tree.insert("", "end", values=(os.path.basename(path), report.summary()))
+        self.progress["value"] = self.done
+        self._update_summary()
+
+    def finish(self, cancelled: bool):
+        if not self.winfo_exists():
+            return
+        self.cancel_button.state(["disabled"])
+        self._update_summary("Cancelled" if cancelled else "Finished")
+
+    def _update_summary(self, state: str = None):
+        text = f"{self.done} of {self.total} checked, {self.flagged} with silence"
+        if self.failed:
+            text += f", {self.failed} failed"
+        self.summary_label.config(text=f"{state}: {text}" if state else text)
+
+    def cancel(self):
+        self.on_cancel()
+        self.cancel_button.state(["disabled"])
+
+    def close(self):
+        # Closing stops the run; results found so far stay flagged in the playlist
+        if self.cancel_button.instate(["!disabled"]):
+            self.on_cancel()
+        self.destroy()
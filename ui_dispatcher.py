@@ -0,0 +1,97 @@
+import threading
+import time
+import tkinter as tk
+
+
+class UiDispatcher:
+    """Runs UI work posted from background threads on the Tk main loop.
+
+    Work is keyed by (widget, kind): posting the same kind for the same widget
+    before it has run replaces the earlier callback (latest wins), so a burst of
+    reloads or status changes costs a single render. Each tick runs queued work
+    until FRAME_BUDGET_MS is spent and leaves the rest for the next tick, and
+    work for widgets that have been destroyed in the meantime is dropped.
+    """
+
+    FRAME_BUDGET_MS = 12
+    TICK_MS = 16
+
+    def __init__(self, root):
+        self._root = root
+        self._lock = threading.Lock()
+        self._pending = {}  # (widget, kind) -> (widget, callback); dicts keep insertion order
+        self._scheduled = False
+
+    def submit(self, widget, kind: str, callback):
+        """Queue callback to run on the main thread. Safe to call from any thread."""
+        with self._lock:
+            self._pending[(widget, kind)] = (widget, callback)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._schedule(0)
+
+    def _schedule(self, delay_ms: int):
+        try:
+            self._root.after(delay_ms, self._drain)
+        except (RuntimeError, tk.TclError):
+            # Root is gone (app shutting down); nothing left to update
+            with self._lock:
+                self._pending.clear()
+                self._scheduled = False
+
+    def _drain(self):
+        deadline = time.perf_counter() + self.FRAME_BUDGET_MS / 1000.0
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._scheduled = False
+                    return
+                key = next(iter(self._pending))
+                widget, callback = self._pending.pop(key)
+
+            if self._widget_alive(widget):
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Error running UI update '{key[1]}': {e}")
+
+            if time.perf_counter() >= deadline:
+                with self._lock:
+                    if not self._pending:
+                        self._scheduled = False
+                        return
+                # Over budget: yield to Tk so input and redraws get a turn
+                self._schedule(self.TICK_MS)
+                return
+
+    @staticmethod
+    def _widget_alive(widget) -> bool:
+        try:
+            return bool(widget.winfo_exists())
+        except Exception:
+            return False
+
+
+_dispatchers_lock = threading.Lock()
+
+
+def get_dispatcher(widget) -> UiDispatcher:
+    """Return the dispatcher for the Tk root that owns widget."""
+    root = widget._root()
+    with _dispatchers_lock:
+        dispatcher = getattr(root, "_ui_dispatcher", None)
+        if dispatcher is None:
+            dispatcher = UiDispatcher(root)
+            root._ui_dispatcher = dispatcher
+    return dispatcher
+
+
+def submit(widget, kind: str, callback):
+    """Queue callback on widget's UI thread, coalescing with pending work of the same kind."""
+    try:
+        dispatcher = get_dispatcher(widget)
+    except Exception:
+        # Widget already torn down
+        return
+    dispatcher.submit(widget, kind, callback)